@@ -1,9 +1,6 @@
 import os
 import re
 import requests
-from bs4 import BeautifulSoup
-import pypdf
-import docx
 import io
 from pathlib import Path
 import random
@@ -14,6 +11,8 @@ if _REPO_ROOT not in sys.path:
     sys.path.insert(0, _REPO_ROOT)
 
 from scripts.cti_extract import extract_readable_text
+from scripts.cti_strategies import NONE, default_memory, run_ladder
+from scripts.http_cache import default_cache
 
 def get_user_agent():
     """
@@ -50,7 +49,7 @@ def get_medium_content(url):
                 'User-Agent': get_user_agent(),
                 'Accept': 'application/json',
             }
-            response = requests.get(json_url, timeout=15, headers=headers)
+            response = default_cache().get(json_url, timeout=15, headers=headers)
             response.raise_for_status()
 
             # Medium prefixes JSON with ])}while(1);</x>
@@ -102,11 +101,68 @@ def get_medium_content(url):
 
     return None
 
+def _remember(url, text):
+    """Cache ``text`` as the extraction of ``url``'s current body and return it."""
+    default_cache().store_extracted_text(url, text)
+    return text
+
+def extract_plain_text(html):
+    """
+    The cheapest extraction: a tag sweep over the main content area of ``html``.
+    """
+    from bs4 import BeautifulSoup
+
+    soup = BeautifulSoup(html, 'html.parser')
+
+    # Remove unwanted tags
+    for script_or_style in soup(["script", "style", "meta", "noscript"]):
+        script_or_style.decompose()
+
+    # Try to find main content areas (common article/content containers)
+    content_selectors = [
+        'article',
+        '.entry-content',
+        '.post-content',
+        '.article-content',
+        'main',
+        '[role="main"]'
+    ]
+
+    content_area = None
+    for selector in content_selectors:
+        content_area = soup.select_one(selector)
+        if content_area:
+            break
+
+    # Use content area if found, otherwise full body
+    target = content_area if content_area else soup
+
+    # Extract text, preserving paragraphs
+    paragraphs = []
+    for element in target.find_all(['p', 'h1', 'h2', 'h3', 'h4', 'li']):
+        text = element.get_text(strip=True)
+        if text and len(text) > 20:  # Filter out very short snippets
+            paragraphs.append(text)
+
+    # Join paragraphs with double newlines
+    text = '\n\n'.join(paragraphs)
+
+    # Basic cleanup - only remove truly problematic characters
+    # Keep most unicode, just remove control characters except newlines/tabs
+    import re
+    text = re.sub(r'[\x00-\x08\x0B\x0C\x0E-\x1F\x7F-\x9F]', '', text)
+
+    return text if text.strip() else " ".join(soup.stripped_strings)
+
 def get_cti_content(url):
     """
     Downloads and extracts text content from a given URL.
     Supports HTML (with JS rendering fallback), PDF, and DOCX formats.
     Handles Brotli (br) and Zstandard (zstd) compression.
+
+    Fetches go through the on-disk HTTP cache: an unchanged source is
+    revalidated rather than downloaded, and its previously extracted text is
+    reused without parsing or re-running the rendering fallbacks.
     """
     # Try Medium-specific approach first
     if 'medium.com' in url:
@@ -130,9 +186,16 @@ def get_cti_content(url):
         }
         # Explicitly allow automatic decompression
         # Note: requires 'brotli' and 'zstandard' packages for br/zstd compression
-        response = requests.get(url, timeout=15, headers=headers, stream=False, allow_redirects=True)
+        cache = default_cache()
+        response = cache.get(url, timeout=15, headers=headers)
         response.raise_for_status()
 
+        if response.from_cache:
+            cached_text = cache.extracted_text(url)
+            if cached_text:
+                print(f"♻️  Source unchanged since last fetch, reusing extracted text ({len(cached_text.split())} words)")
+                return cached_text
+
         # Debug: Check if content is compressed/binary
         content_type = response.headers.get('content-type', '').lower()
         content_encoding = response.headers.get('content-encoding', '').lower()
@@ -158,77 +221,35 @@ def get_cti_content(url):
                 return f"Error: Unable to decode binary content"
 
         if 'pdf' in content_type:
+            import pypdf  # parsers are imported only for the content type at hand
+
             with io.BytesIO(response.content) as f:
                 reader = pypdf.PdfReader(f)
                 text = "".join(page.extract_text() for page in reader.pages)
-            return text
+            return _remember(url, text)
         elif 'vnd.openxmlformats-officedocument.wordprocessingml.document' in content_type:
+            import docx
+
             with io.BytesIO(response.content) as f:
                 doc = docx.Document(f)
                 text = "\n".join([para.text for para in doc.paragraphs])
-            return text
+            return _remember(url, text)
         else:
             # Use response.text which respects the encoding we set
-            soup = BeautifulSoup(response.text, 'html.parser')
-
-            # Remove unwanted tags
-            for script_or_style in soup(["script", "style", "meta", "noscript"]):
-                script_or_style.decompose()
-
-            # Try to find main content areas (common article/content containers)
-            content_selectors = [
-                'article',
-                '.entry-content',
-                '.post-content',
-                '.article-content',
-                'main',
-                '[role="main"]'
-            ]
-
-            content_area = None
-            for selector in content_selectors:
-                content_area = soup.select_one(selector)
-                if content_area:
-                    break
-
-            # Use content area if found, otherwise full body
-            target = content_area if content_area else soup
-
-            # Extract text, preserving paragraphs
-            paragraphs = []
-            for element in target.find_all(['p', 'h1', 'h2', 'h3', 'h4', 'li']):
-                text = element.get_text(strip=True)
-                if text and len(text) > 20:  # Filter out very short snippets
-                    paragraphs.append(text)
-
-            # Join paragraphs with double newlines
-            text = '\n\n'.join(paragraphs)
-
-            # Basic cleanup - only remove truly problematic characters
-            # Keep most unicode, just remove control characters except newlines/tabs
-            import re
-            text = re.sub(r'[\x00-\x08\x0B\x0C\x0E-\x1F\x7F-\x9F]', '', text)
-
-            final_text = text if text.strip() else " ".join(soup.stripped_strings)
-
-            # Check if content seems valid (has enough words and reasonable length)
-            word_count = len(final_text.split())
-            if word_count < 100:
-                # Content is suspiciously short - might be JS-rendered
-                print(f"⚠️  Content seems too short ({word_count} words), trying JS rendering...")
-                js_content = try_js_rendering(url)
-                if js_content and len(js_content.split()) > word_count:
-                    print(f"✅ JS rendering succeeded ({len(js_content.split())} words)")
-                    return js_content
-
+            html = response.text
+            steps = {
+                'plain': lambda: extract_plain_text(html),
+                # readability over the body already fetched, not a second download
+                'js': lambda: try_js_rendering(url, html=html),
                 # Heaviest fallback: a real headless browser, which can solve
                 # JS bot-challenges (e.g. AWS WAF) the paths above cannot.
-                browser_content = fetch_with_browser(url)
-                if browser_content and len(browser_content.split()) > word_count:
-                    print(f"✅ Browser rendering succeeded ({len(browser_content.split())} words)")
-                    return browser_content
-
-            return final_text
+                'browser': lambda: fetch_with_browser(url),
+            }
+            text, strategy = run_ladder(url, steps, default_memory(), heavy=('browser',))
+            if strategy == NONE:
+                # Too thin to trust; left uncached so the next run retries.
+                return text
+            return _remember(url, text)
 
     except requests.exceptions.HTTPError as e:
         if e.response.status_code == 404:
@@ -240,22 +261,24 @@ def get_cti_content(url):
     except Exception as e:
         return f"Error processing content: {e}"
 
-def try_js_rendering(url):
+def try_js_rendering(url, html=None):
     """
     Attempt to render JavaScript content using urllib and readability.
     This is a lightweight approach that works in GitHub Actions.
+    Pass ``html`` when the page has already been fetched to skip the download.
     """
     try:
-        import urllib.request
+        if html is None:
+            import urllib.request
 
-        # Fetch with a real browser user agent
-        req = urllib.request.Request(
-            url,
-            headers={'User-Agent': get_user_agent()}
-        )
+            # Fetch with a real browser user agent
+            req = urllib.request.Request(
+                url,
+                headers={'User-Agent': get_user_agent()}
+            )
 
-        with urllib.request.urlopen(req, timeout=20) as response:
-            html = response.read()
+            with urllib.request.urlopen(req, timeout=20) as response:
+                html = response.read()
 
         return extract_readable_text(html)
 
@@ -0,0 +1,50 @@
+"""Shared plumbing for the micro-benchmarks in this directory.
+
+Each ``bench_*.py`` is a standalone script run from the repo root, e.g.::
+
+    python scripts/benchmarks/bench_techniques.py
+
+They time real code paths over the real hunt corpus and print one line per
+variant. Nothing here is collected by pytest.
+"""
+
+from __future__ import annotations
+
+import sys
+import time
+from collections.abc import Callable
+from pathlib import Path
+
+REPO_ROOT = Path(__file__).resolve().parent.parent.parent
+if str(REPO_ROOT) not in sys.path:
+    sys.path.insert(0, str(REPO_ROOT))
+
+from scripts.migrate_to_frontmatter import CATEGORY_DIRS, SKIP_FILENAMES
+
+
+def corpus_files() -> list[tuple[Path, str]]:
+    """Every hunt file in the category directories as ``(path, category)``."""
+    return [
+        (path, category)
+        for category in CATEGORY_DIRS
+        for path in sorted((REPO_ROOT / category).glob("*.md"))
+        if path.name not in SKIP_FILENAMES
+    ]
+
+
+def best_of(fn: Callable[[], object], repeat: int = 5) -> float:
+    """Fastest wall-clock time of ``repeat`` calls, in seconds."""
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def report(label: str, seconds: float, baseline: float | None = None) -> None:
+    """Print one aligned result line, with a speedup factor when given a baseline."""
+    line = f"  {label:<40} {seconds * 1000:9.2f} ms"
+    if baseline:
+        line += f"   ({baseline / seconds:5.1f}x)"
+    print(line)
@@ -0,0 +1,137 @@
+#!/usr/bin/env python3
+"""hunts.db write path on a 50k-row synthetic corpus: per-row statements vs batched.
+
+Both variants get the same pre-parsed hunts, so this times only the SQLite
+side of build_hunt_database.scan_and_update_hunts: an initial load, then an
+incremental run where 1% of hunts changed and 1% were deleted.
+"""
+
+from __future__ import annotations
+
+import json
+import sqlite3
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+from _common import report
+
+from scripts import build_hunt_database as db
+
+ROWS = 50_000
+TACTICS = ["Execution", "Persistence", "Defense Evasion", "Command and Control"]
+
+
+def _synthetic(n: int, root: Path, revision: int = 0) -> dict[str, tuple[dict, Path, str]]:
+    corpus = {}
+    for i in range(n):
+        hunt_id = f"H{i:05d}"
+        info = {
+            "hunt_id": hunt_id,
+            "hypothesis": f"Threat actors abuse technique variant {i} (rev {revision}).",
+            "tactic": TACTICS[i % 4],
+            "tactics": [TACTICS[i % 4]],
+            "technique": f"T{1000 + i % 600}.{i % 7:03d}",
+            "techniques": [f"T{1000 + i % 600}.{i % 7:03d}", f"T{1000 + i % 600}"],
+            "tags": [f"#tag{i % 50}", f"#tag{i % 13}"],
+            "submitter": f"user{i % 200}",
+            "category": "Flames",
+            "title": f"Hunt {i}",
+            "why": "- Adversaries hide in plain sight.",
+            "notes": "",
+            "references": "- https://attack.mitre.org/",
+        }
+        corpus[f"{hunt_id}.md"] = (info, root / f"{hunt_id}.md", f"{i:08x}{revision}")
+    return corpus
+
+
+def _legacy_scan(conn, corpus) -> None:
+    """The pre-batching loop: a SELECT and a write per file, then a stat per row."""
+    for filename, (info, path, digest) in corpus.items():
+        existing = conn.execute(
+            'SELECT id, file_hash FROM hunts WHERE filename = ?', (filename,)
+        ).fetchone()
+        row = db._hunt_row(info, path, digest)
+        if existing:
+            if existing[1] == digest:
+                continue
+            conn.execute('''
+                UPDATE hunts SET hunt_id = ?, hypothesis = ?, tactic = ?, technique = ?,
+                    tags = ?, submitter = ?, category = ?, file_path = ?, file_hash = ?,
+                    last_modified = ?
+                WHERE id = ?
+            ''', (*row, None, existing[0]))
+            rowid = existing[0]
+            db.remove_hunt_index(conn, [rowid])
+        else:
+            rowid = conn.execute('''
+                INSERT INTO hunts (hunt_id, hypothesis, tactic, technique, tags, submitter,
+                    category, file_path, file_hash, filename, created_date, last_modified)
+                VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+            ''', (*row, filename, None, None)).lastrowid
+        db.index_hunts(conn, [(rowid, info)])
+    for rowid, filepath in conn.execute('SELECT id, file_path FROM hunts').fetchall():
+        if not Path(filepath).exists():
+            conn.execute('DELETE FROM hunts WHERE id = ?', (rowid,))
+            db.remove_hunt_index(conn, [rowid])
+    conn.commit()
+
+
+def _batched_scan(conn, corpus) -> None:
+    known = {name: digest for name, digest in conn.execute('SELECT filename, file_hash FROM hunts')}
+    ids = dict(conn.execute('SELECT filename, id FROM hunts'))
+    inserts, updates = [], []
+    for filename, (info, path, digest) in corpus.items():
+        if filename not in known:
+            inserts.append((filename, info, db._hunt_row(info, path, digest), None, None))
+        elif known[filename] != digest:
+            updates.append((ids[filename], info, db._hunt_row(info, path, digest), None))
+    db.attach_stat_cache(conn)
+    db.apply_changes(conn, inserts, updates, corpus.keys())
+
+
+def _run(label, scan, workdir, initial, incremental, baseline=None):
+    path = workdir / f"{label.split()[0]}.db"
+    conn = sqlite3.connect(path)
+    if scan is _batched_scan:
+        db.configure_connection(conn)
+    db.create_database_schema(conn)
+    start = time.perf_counter()
+    scan(conn, initial)
+    load = time.perf_counter() - start
+    start = time.perf_counter()
+    scan(conn, incremental)
+    incr = time.perf_counter() - start
+    count = conn.execute('SELECT COUNT(*) FROM hunts').fetchone()[0]
+    conn.close()
+    report(f"{label}: initial load", load, baseline and baseline[0])
+    report(f"{label}: 1% changed, 1% deleted", incr, baseline and baseline[1])
+    return load, incr, count
+
+
+def main() -> None:
+    with tempfile.TemporaryDirectory() as tmp:
+        workdir = Path(tmp)
+        files = workdir / "Flames"
+        files.mkdir()
+        initial = _synthetic(ROWS, files)
+        for _, path, _ in initial.values():
+            path.touch()
+
+        changed = _synthetic(ROWS, files, revision=1)
+        incremental = {}
+        for i, name in enumerate(initial):
+            if i % 100 == 1:
+                (files / name).unlink()
+            else:
+                incremental[name] = changed[name] if i % 100 == 0 else initial[name]
+
+        print(f"hunts.db writes, {ROWS} synthetic hunts")
+        legacy = _run("legacy per-row", _legacy_scan, workdir, initial, incremental)
+        batched = _run("batched", _batched_scan, workdir, initial, incremental, legacy)
+        assert legacy[2] == batched[2] == len(incremental), (legacy[2], batched[2])
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,44 @@
+#!/usr/bin/env python3
+"""No-op build_hunt_database scan over the real corpus: hash every file vs stat first."""
+
+from __future__ import annotations
+
+import hashlib
+import sqlite3
+import warnings
+
+from _common import REPO_ROOT, best_of, corpus_files, report
+
+from scripts import build_hunt_database as db
+
+
+def _md5_all(paths) -> None:
+    """What every run used to do before any comparison: read and MD5 each file."""
+    for path in paths:
+        with open(path, "rb") as f:
+            hashlib.md5(f.read()).hexdigest()
+
+
+def main() -> None:
+    paths = [path for path, _ in corpus_files()]
+    directories = sorted({str(path.parent) for path in paths})
+
+    conn = sqlite3.connect(":memory:")
+    db.create_database_schema(conn)
+    db.get_git_dates = lambda path: (None, None)
+    with warnings.catch_warnings():
+        warnings.simplefilter("ignore", DeprecationWarning)
+        db.scan_and_update_hunts(conn, directories, verbose=False)
+
+    print(f"No-op hunts.db scan over {len(paths)} hunt files ({REPO_ROOT.name})")
+    legacy = best_of(lambda: _md5_all(paths), repeat=20)
+    report("read + MD5 every file", legacy)
+    report("read + BLAKE2b every file", best_of(
+        lambda: [db.get_file_hash(p) for p in paths], repeat=20), legacy)
+    report("stat() every file", best_of(lambda: [p.stat() for p in paths], repeat=20), legacy)
+    report("scan_and_update_hunts (no-op)", best_of(
+        lambda: db.scan_and_update_hunts(conn, directories, verbose=False), repeat=20), legacy)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,41 @@
+#!/usr/bin/env python3
+"""Frontmatter splitting over the corpus: pure-Python PyYAML, python-frontmatter, hunt_yaml.
+
+python-frontmatter 1.1 already picks CSafeLoader when libyaml is present; the
+first row shows what the pure-Python SafeLoader would cost.
+"""
+
+from __future__ import annotations
+
+import frontmatter
+import yaml
+from _common import best_of, corpus_files, report
+from frontmatter.default_handlers import YAMLHandler
+
+from scripts import hunt_yaml
+
+
+class _PurePythonYAML(YAMLHandler):
+    def load(self, fm, **kwargs):
+        return yaml.load(fm, Loader=yaml.SafeLoader)
+
+
+def main() -> None:
+    texts = [path.read_text(encoding="utf-8") for path, _ in corpus_files()]
+    for text in texts:
+        post = frontmatter.loads(text)
+        assert hunt_yaml.split(text) == (post.metadata, post.content)
+
+    print(f"Split {len(texts)} hunt files into metadata and body "
+          f"(libyaml: {yaml.__with_libyaml__})")
+    pure = _PurePythonYAML()
+    baseline = best_of(lambda: [frontmatter.loads(t, handler=pure) for t in texts])
+    report("frontmatter.loads, SafeLoader", baseline)
+    report("frontmatter.loads (default)",
+           best_of(lambda: [frontmatter.loads(t) for t in texts], repeat=20), baseline)
+    report("hunt_yaml.split",
+           best_of(lambda: [hunt_yaml.split(t) for t in texts], repeat=20), baseline)
+
+
+if __name__ == "__main__":
+    main()
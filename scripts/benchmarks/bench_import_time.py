@@ -0,0 +1,69 @@
+#!/usr/bin/env python3
+"""Cold import time of the CI and pipeline entry points, via ``python -X importtime``.
+
+Each module is imported in a fresh interpreter, so nothing is shared between
+runs. The figure is the cumulative time ``-X importtime`` reports for the
+module itself, best of five. The heavy third-party packages that were
+actually loaded are listed after each result.
+"""
+
+from __future__ import annotations
+
+import os
+import subprocess
+import sys
+
+from _common import REPO_ROOT, report
+
+HEAVY = ("jsonschema", "anthropic", "openai", "pypdf", "docx", "bs4", "requests")
+
+# (label, module, directory put on sys.path first). The drafting scripts import
+# their siblings by bare name, as they do when run as ``python scripts/x.py``.
+TARGETS = [
+    ("check_hunt_id_collisions", "scripts.check_hunt_id_collisions", REPO_ROOT),
+    ("hunt_parser", "scripts.hunt_parser", REPO_ROOT),
+    ("duplicate_detection", "scripts.duplicate_detection", REPO_ROOT),
+    ("cti_extract", "scripts.cti_extract", REPO_ROOT),
+    ("generate_from_cti", "generate_from_cti", REPO_ROOT / "scripts"),
+    ("process_hunt_submission", "process_hunt_submission", REPO_ROOT / "scripts"),
+    ("process_issue", "process_issue", REPO_ROOT / ".github" / "scripts"),
+]
+
+_PROBE = (
+    "import sys; sys.path.insert(0, {path!r}); import {module}; "
+    "print(' '.join(m for m in {heavy!r} if m in sys.modules))"
+)
+
+
+def import_time(module: str, path, repeat: int = 5) -> tuple[float, str]:
+    """Best cumulative import time in seconds, and the heavy modules it loaded."""
+    best, loaded = float("inf"), ""
+    # No key: importing must not need one.
+    env = {k: v for k, v in os.environ.items() if not k.endswith("_API_KEY")}
+    for _ in range(repeat):
+        proc = subprocess.run(
+            [sys.executable, "-X", "importtime", "-c",
+             _PROBE.format(path=str(path), module=module, heavy=HEAVY)],
+            capture_output=True, text=True, cwd=REPO_ROOT, env=env,
+        )
+        if proc.returncode:
+            return float("nan"), proc.stderr.strip().splitlines()[-1]
+        for line in proc.stderr.splitlines():
+            fields = [f.strip() for f in line.split("|")]
+            if len(fields) == 3 and fields[2] == module:
+                best = min(best, int(fields[1]) / 1e6)
+        loaded = proc.stdout.strip()
+    return best, loaded
+
+
+def main() -> None:
+    print(f"Cold import time, best of 5 ({sys.version.split()[0]})")
+    for label, module, path in TARGETS:
+        seconds, loaded = import_time(module, path)
+        report(label, seconds)
+        if loaded:
+            print(f"  {'':<40} loads: {loaded}")
+
+
+if __name__ == "__main__":
+    main()
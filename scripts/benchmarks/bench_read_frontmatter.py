@@ -0,0 +1,28 @@
+#!/usr/bin/env python3
+"""Frontmatter-only reads over the corpus: python-frontmatter vs read_frontmatter."""
+
+from __future__ import annotations
+
+import frontmatter
+from _common import best_of, corpus_files, report
+
+from scripts.hunt_parser import read_frontmatter
+
+
+def main() -> None:
+    paths = [path for path, _ in corpus_files()]
+    assert all(
+        read_frontmatter(p) == frontmatter.loads(p.read_text(encoding="utf-8")).metadata
+        for p in paths
+    )
+
+    print(f"Frontmatter of {len(paths)} hunt files")
+    baseline = best_of(lambda: [frontmatter.loads(p.read_text(encoding="utf-8")).metadata
+                                for p in paths], repeat=20)
+    report("read_text + frontmatter.loads", baseline)
+    report("read_frontmatter",
+           best_of(lambda: [read_frontmatter(p) for p in paths], repeat=20), baseline)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,57 @@
+#!/usr/bin/env python3
+"""Legacy table-row splitting: per-character appends vs token slicing, on long rows."""
+
+from __future__ import annotations
+
+from _common import best_of, report
+
+from scripts.hunt_parser import split_table_row
+
+
+def _char_by_char(row: str) -> list[str]:
+    """The splitter hunt_parser used before split_table_row."""
+    protect_code = row.count("`") % 2 == 0
+    cells, current, in_code, i = [], [], False, 0
+    while i < len(row):
+        if row[i] == "\\" and i + 1 < len(row) and row[i + 1] == "|":
+            current.append("|")
+            i += 2
+        elif row[i] == "`" and protect_code:
+            in_code = not in_code
+            current.append("`")
+            i += 1
+        elif row[i] == "|" and not in_code:
+            cells.append("".join(current).strip())
+            current = []
+            i += 1
+        else:
+            current.append(row[i])
+            i += 1
+    cells.append("".join(current).strip())
+    if cells and cells[0] == "":
+        cells = cells[1:]
+    if cells and cells[-1] == "":
+        cells = cells[:-1]
+    return cells
+
+
+NOTES = "Look for curl \\| osascript chains and `launchctl list | grep -E 'com\\.apple'` output. "
+ROWS = {
+    "plain 6-cell row, 5 KB": "| H001 | " + " | ".join(["word " * 200] * 5) + " |",
+    "escapes + code spans, 5 KB": "| H001 | hypothesis | Persistence | "
+                                  + NOTES * 55 + " | #tag | [X](https://x.com) |",
+}
+
+
+def main() -> None:
+    for label, row in ROWS.items():
+        assert split_table_row(row) == _char_by_char(row)
+        print(f"{label} ({len(row)} chars), x1000")
+        baseline = best_of(lambda: [_char_by_char(row) for _ in range(1000)])
+        report("per-character appends", baseline)
+        report("split_table_row", best_of(lambda: [split_table_row(row) for _ in range(1000)]),
+               baseline)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,56 @@
+#!/usr/bin/env python3
+"""Technique-ID extraction over the full corpus: per-text loop vs one batch pass."""
+
+from __future__ import annotations
+
+import re
+
+from _common import best_of, corpus_files, report
+
+from scripts.techniques import (
+    classify_techniques,
+    extract_techniques,
+    extract_techniques_batch,
+)
+
+# The per-call regex loop hunt_parser used before scripts/techniques.py.
+_LEGACY_RE = re.compile(r"T(\d{4})(?:[._/](\d{3}))?")
+
+
+def _legacy_extract(text: str) -> list[str]:
+    seen: set[str] = set()
+    out: list[str] = []
+    for match in _LEGACY_RE.finditer(text):
+        tid = f"T{match.group(1)}"
+        if match.group(2):
+            tid = f"{tid}.{match.group(2)}"
+        if tid not in seen:
+            seen.add(tid)
+            out.append(tid)
+    return out
+
+
+def main() -> None:
+    texts = [path.read_text(encoding="utf-8") for path, _ in corpus_files()]
+    assert [_legacy_extract(t) for t in texts] == extract_techniques_batch(texts)
+
+    print(f"Technique extraction over {len(texts)} hunt files")
+    legacy = best_of(lambda: [_legacy_extract(t) for t in texts], repeat=20)
+    report("legacy per-text loop", legacy)
+    report("extract_techniques per text", best_of(
+        lambda: [extract_techniques(t) for t in texts], repeat=20), legacy)
+    report("extract_techniques_batch", best_of(
+        lambda: extract_techniques_batch(texts), repeat=20), legacy)
+
+    ids = [tid for found in extract_techniques_batch(texts) for tid in found]
+    summary = classify_techniques(ids)
+    report("classify_techniques (all IDs)", best_of(lambda: classify_techniques(ids)))
+    print(
+        f"  {len(summary['techniques'])} distinct IDs, "
+        f"{len(summary['subtechniques'])} sub-techniques, "
+        f"{len(summary['deprecated'])} deprecated, {len(summary['unknown'])} unknown"
+    )
+
+
+if __name__ == "__main__":
+    main()
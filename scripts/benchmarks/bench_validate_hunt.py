@@ -0,0 +1,50 @@
+#!/usr/bin/env python3
+"""validate_hunt over every frontmatter hunt: full jsonschema vs the compiled fast path."""
+
+from __future__ import annotations
+
+import warnings
+
+from _common import best_of, corpus_files, report
+
+from scripts import hunt_parser
+from scripts import hunt_schema
+
+
+def _corpus_documents() -> list[dict]:
+    """The exact dicts hunt_parser hands to validate_hunt for the real corpus."""
+    captured = []
+    real = hunt_parser.validate_hunt
+    hunt_parser.validate_hunt = lambda data: captured.append(dict(data)) or real(data)
+    try:
+        with warnings.catch_warnings():
+            warnings.simplefilter("ignore", DeprecationWarning)
+            for path, category in corpus_files():
+                hunt_parser.parse_hunt_file(path, category)
+    finally:
+        hunt_parser.validate_hunt = real
+    return captured
+
+
+def _full(docs) -> None:
+    """What validate_hunt did for every hunt before the fast path."""
+    validator = hunt_schema._validator()
+    for doc in docs:
+        sorted(validator.iter_errors(doc), key=lambda e: list(e.path))
+
+
+def main() -> None:
+    docs = _corpus_documents()
+    check = hunt_schema._fast_check()
+    assert all(check(doc) for doc in docs), "corpus should be valid"
+
+    print(f"validate_hunt over {len(docs)} frontmatter hunts")
+    baseline = best_of(lambda: _full(docs), repeat=20)
+    report("jsonschema iter_errors + sort", baseline)
+    report("compiled check only", best_of(lambda: [check(d) for d in docs], repeat=20), baseline)
+    report("validate_hunt (two-tier)", best_of(
+        lambda: [hunt_schema.validate_hunt(d) for d in docs], repeat=20), baseline)
+
+
+if __name__ == "__main__":
+    main()
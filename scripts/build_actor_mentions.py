@@ -12,6 +12,10 @@ Matching rules:
   - per-actor alias denylist suppresses individual (actor_id, alias) pairs
     that produce false positives (loaded from scripts/actor_alias_denylist.json)
 
+Unless run with --force, exits early when public/build-manifest.json shows
+none of those inputs changed (the output carries a timestamp, so a pointless
+rebuild always makes a diff).
+
 Output shape:
   {
     "generated_at": "2026-05-23T12:00:00Z",
@@ -27,9 +31,14 @@ from __future__ import annotations
 import datetime as _dt
 import json
 import re
+import sys
 from pathlib import Path
 from typing import Any, Iterable
 
+_REPO_ROOT = str(Path(__file__).resolve().parent.parent)
+if _REPO_ROOT not in sys.path:
+    sys.path.insert(0, _REPO_ROOT)
+
 MIN_ALIAS_LEN = 4
 REPO_ROOT = Path(__file__).resolve().parent.parent
 DEFAULT_CONTEXT_GRAPH = REPO_ROOT / "public" / "context-graph-data.json"
@@ -142,10 +151,16 @@ def build(
     output_path: Path = DEFAULT_OUTPUT,
     *,
     now: _dt.datetime | None = None,
+    hunts: list[dict[str, Any]] | None = None,
 ) -> dict[str, Any]:
-    """Run the full pipeline. Writes output_path and returns the written dict."""
+    """Run the full pipeline. Writes output_path and returns the written dict.
+
+    Pass ``hunts`` to use an in-memory hunts-data list instead of reading
+    ``hunts_path``.
+    """
     context_graph = json.loads(context_graph_path.read_text())
-    hunts = json.loads(hunts_path.read_text())
+    if hunts is None:
+        hunts = json.loads(hunts_path.read_text())
     denylist = load_denylist(denylist_path)
 
     actors = load_actors(context_graph)
@@ -164,7 +179,15 @@ def build(
 
 
 if __name__ == "__main__":
+    from scripts.build_manifest import Manifest
+
+    manifest = Manifest(REPO_ROOT)
+    if "--force" not in sys.argv[1:] and manifest.status("actor-mentions") is None:
+        print(f"{DEFAULT_OUTPUT.relative_to(REPO_ROOT)} is up to date (public/build-manifest.json)")
+        sys.exit(0)
     written = build()
+    manifest.record("actor-mentions")
+    manifest.save()
     print(
         f"Wrote {DEFAULT_OUTPUT.relative_to(REPO_ROOT)} "
         f"with {len(written['mentions'])} actors having mentions."
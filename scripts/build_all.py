@@ -0,0 +1,244 @@
+#!/usr/bin/env python3
+"""
+Build every generated artifact from one parse of the hunt corpus.
+
+Each output is a stage: a name, the input files it depends on (globs relative
+to the repo root, including the scripts that produce it), the files it
+writes, and a function that writes them from a shared BuildContext. The
+context parses the corpus at most once, and only if a stage that needs it
+actually runs. It also parses the ATT&CK STIX bundle once for the stages
+that use it.
+
+A stage is skipped, make-style, when public/build-manifest.json (see
+scripts/build_manifest.py) says its inputs, scripts and outputs all still
+hash the same as after its last successful run. The hunt-database stage
+declares no inputs and always runs; build_hunt_database is incremental on its
+own and hunts.db is not committed.
+
+Usage:
+    python scripts/build_all.py                  # build whatever is stale
+    python scripts/build_all.py --force          # rebuild every stage
+    python scripts/build_all.py --only hunts-data actor-mentions
+    python scripts/build_all.py --from-stix      # datasource map from ATT&CK
+    python scripts/build_all.py --list           # show stages and whether they are stale
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import sqlite3
+import sys
+import time
+from collections.abc import Callable
+from functools import cached_property
+from pathlib import Path
+from typing import Any, NamedTuple
+
+_REPO_ROOT = str(Path(__file__).resolve().parent.parent)
+if _REPO_ROOT not in sys.path:
+    sys.path.insert(0, _REPO_ROOT)
+
+from scripts.build_manifest import ARTIFACTS, CORPUS, STIX, Manifest, missing_inputs
+
+REPO_ROOT = Path(_REPO_ROOT)
+
+
+class Stage(NamedTuple):
+    name: str
+    inputs: tuple[str, ...]
+    outputs: tuple[str, ...]
+    run: Callable[[BuildContext], Any]
+
+
+class BuildContext:
+    """Inputs shared across stages, each loaded on first use."""
+
+    def __init__(self, root: Path = REPO_ROOT, from_stix: bool = False):
+        self.root = root
+        self.from_stix = from_stix
+
+    def extra_inputs(self, stage: Stage) -> tuple[str, ...]:
+        """Inputs a stage reads only under this context's options."""
+        return (STIX,) if self.from_stix and stage.name == "datasource-map" else ()
+
+    @cached_property
+    def parsed(self) -> dict[Path, dict]:
+        """hunt_parser records keyed by repo-relative path (``Flames/H001.md``)."""
+        from scripts.hunt_parser import parse_hunt_file
+        from scripts.migrate_to_frontmatter import SKIP_FILENAMES
+
+        start = time.perf_counter()
+        records = {}
+        for pattern in CORPUS:
+            for path in sorted(self.root.glob(pattern)):
+                if path.name in SKIP_FILENAMES:
+                    continue
+                rel = path.relative_to(self.root)
+                records[rel] = parse_hunt_file(path, rel.parts[0])
+        print(f"  (parsed {len(records)} hunts once in "
+              f"{(time.perf_counter() - start) * 1000:.1f} ms)")
+        return records
+
+    @cached_property
+    def hunts(self) -> list[dict]:
+        """The hunts-data.json list, shaped from :attr:`parsed`."""
+        from scripts.rebuild_hunts_data import CATEGORIES, check_layout, collect_hunts, shape_hunt
+
+        check_layout(self.root, CATEGORIES)
+        parsed = self.parsed
+
+        def reshape(path: Path, category: str) -> dict | None:
+            record = parsed.get(path.relative_to(self.root))
+            return shape_hunt(record, category) if record else None
+
+        return collect_hunts(self.root, CATEGORIES, parse=reshape, verbose=False)
+
+    @cached_property
+    def stix_bundle(self) -> dict:
+        return json.loads((self.root / STIX).read_text())
+
+
+# --- stages ------------------------------------------------------------------
+
+
+def _hunts_data(ctx: BuildContext) -> None:
+    from scripts.rebuild_hunts_data import write_hunts_data
+
+    write_hunts_data(ctx.hunts, ctx.root)
+
+
+def _actor_mentions(ctx: BuildContext) -> None:
+    from scripts.build_actor_mentions import build
+
+    build(hunts=ctx.hunts)
+
+
+def _mitre_matrix(ctx: BuildContext) -> None:
+    from scripts.build_mitre_matrix import build_matrix, write_matrix
+
+    write_matrix(build_matrix(ctx.stix_bundle.get("objects", [])))
+
+
+def _datasource_map(ctx: BuildContext) -> None:
+    from scripts.build_datasource_map import build_mapping, build_stix_mapping, write_mapping
+
+    if ctx.from_stix:
+        mapping = build_stix_mapping(ctx.hunts, bundle=ctx.stix_bundle)
+    else:
+        mapping = build_mapping()
+    write_mapping(mapping, ctx.hunts, ctx.root / "public" / "datasource-mapping.json")
+
+
+def _hunt_database(ctx: BuildContext) -> None:
+    from scripts import build_hunt_database as db
+
+    db_path = ctx.root / "database" / "hunts.db"
+    db_path.parent.mkdir(parents=True, exist_ok=True)
+    conn = sqlite3.connect(str(db_path))
+    try:
+        db.configure_connection(conn)
+        db.create_database_schema(conn)
+        stats = db.scan_and_update_hunts(
+            conn, [p.split("/")[0] for p in CORPUS], verbose=False, parsed=ctx.parsed
+        )
+    finally:
+        conn.close()
+    if stats["errors"]:
+        raise RuntimeError(f"{stats['errors']} hunt files failed to index")
+
+
+def _leaderboard(ctx: BuildContext) -> None:
+    from scripts.generate_leaderboard import generate_leaderboard
+
+    generate_leaderboard(parsed=ctx.parsed)
+
+
+STAGES = (
+    Stage(*ARTIFACTS["hunts-data"], _hunts_data),
+    Stage(*ARTIFACTS["actor-mentions"], _actor_mentions),
+    Stage(*ARTIFACTS["mitre-matrix"], _mitre_matrix),
+    Stage(*ARTIFACTS["datasource-map"], _datasource_map),
+    Stage("hunt-database", (), ("database/hunts.db",), _hunt_database),
+    Stage(*ARTIFACTS["leaderboard"], _leaderboard),
+)
+
+
+# --- driver ------------------------------------------------------------------
+
+
+def run_stages(
+    stages=STAGES,
+    ctx: BuildContext | None = None,
+    force: bool = False,
+    manifest: Manifest | None = None,
+) -> dict[str, str]:
+    """Run each stale stage in order; returns ``{stage name: outcome}``.
+
+    Outcomes are ``built``, ``unchanged``, ``missing input`` and ``failed``.
+    A failed stage does not stop later ones, and it is not recorded in the
+    manifest, so the next run retries it.
+    """
+    ctx = ctx or BuildContext()
+    manifest = manifest or Manifest(ctx.root)
+    outcomes: dict[str, str] = {}
+    total = time.perf_counter()
+
+    for stage in stages:
+        start = time.perf_counter()
+        extra = ctx.extra_inputs(stage)
+        if missing_inputs(stage.inputs + extra, ctx.root):
+            outcome = "missing input"
+        elif stage.inputs and not force and manifest.status(stage, extra) is None:
+            outcome = "unchanged"
+        else:
+            try:
+                stage.run(ctx)
+            except Exception as exc:  # noqa: BLE001 — report and carry on
+                print(f"  ! {stage.name}: {exc}", file=sys.stderr)
+                manifest.forget(stage.outputs)
+                outcome = "failed"
+            else:
+                if stage.inputs:
+                    manifest.record(stage, extra)
+                outcome = "built"
+        outcomes[stage.name] = outcome
+        print(f"  {stage.name:<16} {outcome:<14} {(time.perf_counter() - start) * 1000:8.1f} ms")
+
+    manifest.save()
+    print(f"  {'total':<16} {'':<14} {(time.perf_counter() - total) * 1000:8.1f} ms")
+    return outcomes
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--force", action="store_true", help="rebuild every stage")
+    parser.add_argument("--only", nargs="+", metavar="STAGE", choices=[s.name for s in STAGES],
+                        help="run only these stages")
+    parser.add_argument("--from-stix", action="store_true",
+                        help=f"derive the datasource map from {STIX}")
+    parser.add_argument("--list", action="store_true", help="list stages and exit")
+    args = parser.parse_args()
+
+    # The builders write repo-relative paths (hunts.db stores Flames/H001.md).
+    os.chdir(REPO_ROOT)
+
+    stages = [s for s in STAGES if not args.only or s.name in args.only]
+    ctx = BuildContext(from_stix=args.from_stix)
+    if args.list:
+        manifest = Manifest()
+        for stage in stages:
+            if not stage.inputs:
+                status = "always runs"
+            else:
+                status = manifest.status(stage, ctx.extra_inputs(stage)) or "up to date"
+            print(f"  {stage.name:<16} {status:<28} -> {', '.join(stage.outputs)}")
+        return 0
+
+    outcomes = run_stages(stages, ctx, force=args.force)
+    return 1 if "failed" in outcomes.values() else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,11 +1,32 @@
 #!/usr/bin/env python3
 """
 Build a mapping from broad data source categories to ATT&CK technique IDs.
-Uses the ATT&CK STIX data to get actual data source associations per technique.
+
+By default the mapping comes from MANUAL_TECHNIQUE_MAP. With --from-stix it is
+derived from the ATT&CK STIX bundle (data/enterprise-attack.json, the same file
+build_mitre_matrix.py reads): every technique in public/hunts-data.json is
+resolved through data-component ``detects`` relationships to its data sources,
+and DATASOURCE_TO_CATEGORY maps those to our broad categories. The manual map
+is then layered on top as overrides.
+
+The mapping is only rewritten when public/build-manifest.json shows an input
+changed (or with --force).
 """
+import argparse
 import json
+import sys
 import urllib.request
 from collections import defaultdict
+from pathlib import Path
+
+_REPO_ROOT = str(Path(__file__).resolve().parent.parent)
+if _REPO_ROOT not in sys.path:
+    sys.path.insert(0, _REPO_ROOT)
+
+from scripts.build_manifest import STIX, Manifest
+from scripts.build_mitre_matrix import SOURCE as STIX_SOURCE
+from scripts.build_mitre_matrix import _ext_id
+from scripts.techniques import normalize_technique_id, parent_technique
 
 # ATT&CK data sources → our broad categories
 DATASOURCE_TO_CATEGORY = {
@@ -218,12 +239,94 @@ CATEGORIES = [
 ]
 
 
-def build_mapping():
-    """Build the final mapping using manual technique maps."""
+def normalized_manual_map():
+    """MANUAL_TECHNIQUE_MAP keyed by canonical dotted IDs.
+
+    The table carries both ``T1070.004`` and ``T1070_004`` spellings; hunt tags
+    are always dotted, so underscore keys never matched anything. Duplicate
+    spellings are merged (union of their categories).
+    """
+    merged = defaultdict(list)
+    for tech_id, categories in MANUAL_TECHNIQUE_MAP.items():
+        canonical = normalize_technique_id(tech_id) or tech_id
+        for cat in categories:
+            if cat not in merged[canonical]:
+                merged[canonical].append(cat)
+    return dict(merged)
+
+
+def build_detects_index(objects):
+    """Map each technique ID to the ATT&CK data sources that detect it.
+
+    Resolves the STIX chain once: ``detects`` relationship → data component →
+    its parent data source (``x_mitre_data_source_ref``) → data source name.
+    Built in a single pass over the bundle so per-technique lookups are O(1).
+    """
+    stix_to_technique = {}
+    source_names = {}
+    component_to_source_ref = {}
+    detects = []
+    for obj in objects:
+        kind = obj.get("type")
+        if kind == "attack-pattern":
+            ext_id = _ext_id(obj)
+            if ext_id:
+                stix_to_technique[obj["id"]] = ext_id
+        elif kind == "x-mitre-data-source":
+            source_names[obj["id"]] = obj.get("name", "")
+        elif kind == "x-mitre-data-component":
+            component_to_source_ref[obj["id"]] = obj.get("x_mitre_data_source_ref", "")
+        elif kind == "relationship" and obj.get("relationship_type") == "detects":
+            if not (obj.get("revoked") or obj.get("x_mitre_deprecated")):
+                detects.append(obj)
+
+    index = defaultdict(set)
+    for rel in detects:
+        technique = stix_to_technique.get(rel.get("target_ref", ""))
+        source = source_names.get(component_to_source_ref.get(rel.get("source_ref", ""), ""))
+        if technique and source:
+            index[technique].add(source)
+    return dict(index)
+
+
+def derive_technique_map(technique_ids, detects_index):
+    """Broad categories for each technique, derived from its data sources.
+
+    A sub-technique ATT&CK gives no ``detects`` of its own inherits its
+    parent's. Techniques whose data sources map to no category are omitted.
+    """
+    derived = {}
+    for tech_id in technique_ids:
+        sources = detects_index.get(tech_id) or detects_index.get(parent_technique(tech_id), ())
+        categories = sorted({DATASOURCE_TO_CATEGORY[s] for s in sources if s in DATASOURCE_TO_CATEGORY})
+        if categories:
+            derived[tech_id] = categories
+    return derived
+
+
+def hunt_technique_ids(hunts):
+    """Every canonical technique ID referenced by hunts-data.json entries."""
+    found = set()
+    for h in hunts:
+        for value in h.get("techniques", []) + h.get("tags", []):
+            tid = normalize_technique_id(value)
+            if tid:
+                found.add(tid)
+    return found
+
+
+def build_mapping(technique_map=None, note=None):
+    """Build the final mapping from a technique → categories map.
+
+    Defaults to the (normalized) manual map.
+    """
+    if technique_map is None:
+        technique_map = normalized_manual_map()
+
     # Build category → techniques lookup
     cat_techniques = defaultdict(set)
     
-    for tech_id, categories in MANUAL_TECHNIQUE_MAP.items():
+    for tech_id, categories in technique_map.items():
         for cat in categories:
             cat_techniques[cat].add(tech_id)
     
@@ -244,19 +347,74 @@ def build_mapping():
         "categories": output_categories,
         "metadata": {
             "version": "1.0",
-            "technique_count": len(MANUAL_TECHNIQUE_MAP),
-            "note": "Manual mapping of HEARTH technique tags to broad data source categories"
+            "technique_count": len(technique_map),
+            "note": note or "Manual mapping of HEARTH technique tags to broad data source categories"
         }
     }
     
     return output
 
 
+def build_stix_mapping(hunts, stix_path=STIX_SOURCE, bundle=None):
+    """Derive categories for every hunt technique from ATT&CK, then apply overrides.
+
+    Reads the same bundle build_mitre_matrix.py uses, unless an already
+    parsed ``bundle`` is passed. MANUAL_TECHNIQUE_MAP is layered on top: where
+    it has an entry for a technique, that entry wins.
+    """
+    if bundle is None:
+        bundle = json.loads(Path(stix_path).read_text())
+    index = build_detects_index(bundle.get("objects", []))
+    technique_map = derive_technique_map(sorted(hunt_technique_ids(hunts)), index)
+    technique_map.update(normalized_manual_map())
+    return build_mapping(
+        technique_map,
+        note="Derived from ATT&CK data-component detects relationships, with manual overrides",
+    )
+
+
 def main():
-    mapping = build_mapping()
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument(
+        "--from-stix",
+        action="store_true",
+        help="derive coverage from data/enterprise-attack.json, manual map as overrides",
+    )
+    parser.add_argument("--stix-path", type=Path, default=STIX_SOURCE)
+    parser.add_argument("--force", action="store_true",
+                        help="rebuild even if public/build-manifest.json says nothing changed")
+    args = parser.parse_args()
+
+    root = Path(__file__).parent.parent
+    # The manifest tracks the default bundle only; a custom --stix-path always rebuilds.
+    tracked = not args.from_stix or args.stix_path.resolve() == STIX_SOURCE.resolve()
+    extra = (STIX,) if args.from_stix else ()
+    manifest = Manifest(root)
+    if tracked and not args.force and manifest.status("datasource-map", extra) is None:
+        print("datasource-mapping.json is up to date (public/build-manifest.json)")
+        return 0
+
+    hunts_path = root / "public" / "hunts-data.json"
+    with open(hunts_path) as f:
+        hunts = json.load(f)
+
+    if args.from_stix:
+        if not args.stix_path.exists():
+            print(f"ERROR: {args.stix_path} not found.", file=sys.stderr)
+            return 1
+        mapping = build_stix_mapping(hunts, args.stix_path)
+    else:
+        mapping = build_mapping()
     
-    from pathlib import Path
-    out_path = Path(__file__).parent.parent / "public" / "datasource-mapping.json"
+    write_mapping(mapping, hunts, root / "public" / "datasource-mapping.json")
+    if tracked:
+        manifest.record("datasource-map", extra)
+        manifest.save()
+    return 0
+
+
+def write_mapping(mapping, hunts, out_path):
+    """Write datasource-mapping.json and report hunt techniques it leaves unmapped."""
     with open(out_path, 'w') as f:
         json.dump(mapping, f, indent=2)
     
@@ -265,20 +423,11 @@ def main():
         print(f"  {cat['icon']} {cat['name']}: {len(cat['techniques'])} techniques")
     
     # Verify coverage against HEARTH hunts
-    hunts_path = Path(__file__).parent.parent / "public" / "hunts-data.json"
-    with open(hunts_path) as f:
-        hunts = json.load(f)
-    
     all_mapped = set()
     for cat in mapping["categories"]:
-        all_mapped.update(cat["techniques"])
+        all_mapped.update(normalize_technique_id(t) for t in cat["techniques"])
     
-    unmapped = set()
-    for h in hunts:
-        for tag in h.get("tags", []):
-            if tag.startswith("T") and any(c.isdigit() for c in tag):
-                if tag not in all_mapped and not tag.startswith("TA"):
-                    unmapped.add(tag)
+    unmapped = hunt_technique_ids(hunts) - all_mapped
     
     if unmapped:
         print(f"\n⚠️  Unmapped techniques in HEARTH: {sorted(unmapped)}")
@@ -287,4 +436,4 @@ def main():
 
 
 if __name__ == "__main__":
-    main()
+    sys.exit(main())
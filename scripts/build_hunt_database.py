@@ -7,8 +7,13 @@ The markdown files remain the source of truth - this is just an index.
 
 Usage:
     python scripts/build_hunt_database.py [--rebuild]
+    python scripts/build_hunt_database.py --search "QUERY" [--limit N]
+    python scripts/build_hunt_database.py [--technique T1059.*] [--tag TAG] [--tactic TACTIC]
 
     --rebuild: Drop and rebuild the entire database from scratch
+    --search:  Full-text search (SQLite FTS5, BM25-ranked) over title,
+               hypothesis, why, notes, references, tags and techniques
+    --technique/--tag/--tactic: List hunts matching every given filter
 """
 
 import sqlite3
@@ -24,33 +29,237 @@ if _REPO_ROOT not in sys.path:
     sys.path.insert(0, _REPO_ROOT)
 
 from scripts.migrate_to_frontmatter import SKIP_FILENAMES
+from scripts.rebuild_hunts_data import parse_submitter_from_dict
+from scripts.techniques import parent_technique
+
+# Bump when the schema or the meaning of a stored value changes (as when
+# submitters became canonical names); an older database is dropped and rebuilt
+# from the markdown (it is only an index, so nothing is lost).
+SCHEMA_VERSION = 7
+
+# Per-checkout stat cache, beside the database and not committed: a fresh
+# checkout gives every file a new mtime, so keeping (size, mtime_ns) in
+# hunts.db would change the committed database on every run.
+STAT_CACHE_SUFFIX = "-stat.db"
+
+# FTS5 columns, in order. BM25 weights below line up with them: a hit in the
+# title or hypothesis says far more about a hunt than one in its references.
+FTS_COLUMNS = ("title", "hypothesis", "why", "notes", "references", "tags", "techniques")
+FTS_WEIGHTS = (10.0, 5.0, 2.0, 1.0, 0.5, 3.0, 3.0)
+# "references" is an SQL keyword, so every column name is quoted.
+_FTS_COLUMN_SQL = ", ".join(f'"{c}"' for c in FTS_COLUMNS)
+
+# One row per (hunt, value); keyed by hunts.id, cleaned up with the hunt.
+RELATION_TABLES = ("hunt_techniques", "hunt_tags", "hunt_tactics")
+
+# Materialized hunt counts: stats table -> (key column, source table, key
+# expression over a source row). Triggers on the source table keep each count
+# current inside the same transaction as the row change, so readers never
+# aggregate.
+STATS_TABLES = {
+    "stats_tactic": ("tactic", "hunt_tactics", "{row}.tactic"),
+    "stats_technique": ("technique", "hunt_techniques", "{row}.technique"),
+    "stats_submitter": ("submitter", "hunts", "{row}.submitter"),
+    "stats_category": ("category", "hunts", "{row}.category"),
+    "stats_month": ("month", "hunts", "substr({row}.created_date, 1, 7)"),
+}
 
 
 def get_file_hash(filepath):
-    """Calculate MD5 hash of file content to detect changes."""
+    """BLAKE2b digest of file content, used to detect changes.
+
+    Only called when a file's size or mtime differs from the cached stat.
+    """
     with open(filepath, 'rb') as f:
-        return hashlib.md5(f.read()).hexdigest()
+        return hashlib.blake2b(f.read(), digest_size=16).hexdigest()
+
 
+def extract_hunt_info(filepath, parsed=None):
+    """Adapter that delegates to scripts.hunt_parser for unified parsing.
 
-def extract_hunt_info(filepath):
-    """Adapter that delegates to scripts.hunt_parser for unified parsing."""
+    ``parsed`` is an already-parsed hunt_parser record for ``filepath``; when
+    given, the file is not read again.
+    """
     from scripts.hunt_parser import parse_hunt_file
 
     path = Path(filepath)
     category = path.parent.name
-    parsed = parse_hunt_file(path, category)
+    if parsed is None:
+        parsed = parse_hunt_file(path, category)
     return {
         "hunt_id": parsed["id"],
         "hypothesis": parsed["hypothesis"],
         "tactic": ", ".join(parsed.get("tactics", [])),
         "technique": parsed["techniques"][0] if parsed.get("techniques") else "",
+        "techniques": parsed.get("techniques", []),
+        "tactics": parsed.get("tactics", []),
         "tags": [f"#{t}" for t in parsed.get("tags", [])],
-        "submitter": parsed["submitter"]["name"],
+        # Canonical identity (SUBMITTER_MAP), as shown on the site.
+        "submitter": parse_submitter_from_dict(parsed["submitter"])["name"],
+        "category": category,
+        "title": parsed.get("title") or "",
+        "why": parsed.get("why", ""),
+        "notes": parsed.get("notes", ""),
+        "references": parsed.get("references", ""),
     }
 
 
+def _fts_row(hunt_info):
+    """Column values for hunts_fts, in FTS_COLUMNS order."""
+    return (
+        hunt_info["title"],
+        hunt_info["hypothesis"],
+        hunt_info["why"],
+        hunt_info["notes"],
+        hunt_info["references"],
+        " ".join(t.lstrip("#") for t in hunt_info["tags"]),
+        " ".join(hunt_info["techniques"]),
+    )
+
+
+def index_hunts(conn, entries):
+    """Write the full-text and relation rows for ``(rowid, hunt_info)`` pairs.
+
+    Each table is filled with one executemany batch. Hunts being re-indexed
+    must go through :func:`remove_hunt_index` first.
+    """
+    placeholders = ", ".join("?" * (len(FTS_COLUMNS) + 1))
+    conn.executemany(
+        f'INSERT INTO hunts_fts (rowid, {_FTS_COLUMN_SQL}) VALUES ({placeholders})',
+        [(rowid, *_fts_row(info)) for rowid, info in entries],
+    )
+    conn.executemany(
+        'INSERT OR IGNORE INTO hunt_techniques (hunt_rowid, technique, parent_technique) '
+        'VALUES (?, ?, ?)',
+        [(rowid, t, parent_technique(t)) for rowid, info in entries for t in info["techniques"]],
+    )
+    conn.executemany(
+        'INSERT OR IGNORE INTO hunt_tags (hunt_rowid, tag) VALUES (?, ?)',
+        [(rowid, t.lstrip("#")) for rowid, info in entries for t in info["tags"]],
+    )
+    conn.executemany(
+        'INSERT OR IGNORE INTO hunt_tactics (hunt_rowid, tactic) VALUES (?, ?)',
+        [(rowid, t) for rowid, info in entries for t in info["tactics"]],
+    )
+
+
+def remove_hunt_index(conn, rowids):
+    """Delete the full-text and relation rows of the given hunts.id values."""
+    params = [(rowid,) for rowid in rowids]
+    conn.executemany('DELETE FROM hunts_fts WHERE rowid = ?', params)
+    for table in RELATION_TABLES:
+        conn.executemany(f'DELETE FROM {table} WHERE hunt_rowid = ?', params)
+
+
+def configure_connection(conn):
+    """Pragmas for the builder's write pattern: one large transaction per run.
+
+    WAL lets readers keep querying the index while a rebuild is in progress;
+    synchronous=NORMAL is durable enough for a file that can always be rebuilt
+    from the markdown.
+    """
+    conn.execute('PRAGMA journal_mode = WAL')
+    conn.execute('PRAGMA synchronous = NORMAL')
+    conn.execute('PRAGMA temp_store = MEMORY')
+    conn.execute('PRAGMA cache_size = -16000')
+
+
+def attach_stat_cache(conn):
+    """Attach this checkout's stat cache to ``conn`` as schema ``stat``.
+
+    It lives at ``<db>-stat.db`` beside the database (in memory for an
+    in-memory database) and maps each file to the path, hash, size and
+    mtime_ns it was last seen with.
+    """
+    databases = {name: file for _, name, file in conn.execute('PRAGMA database_list')}
+    if 'stat' not in databases:
+        main = databases.get('main')
+        path = str(Path(main).with_name(Path(main).stem + STAT_CACHE_SUFFIX)) if main else ':memory:'
+        conn.commit()  # ATTACH is not allowed inside a transaction
+        conn.execute('ATTACH DATABASE ? AS stat', (path,))
+    conn.execute('''
+        CREATE TABLE IF NOT EXISTS stat.file_stats (
+            filename TEXT PRIMARY KEY,
+            file_path TEXT NOT NULL,
+            file_hash TEXT NOT NULL,
+            file_size INTEGER NOT NULL,
+            file_mtime_ns INTEGER NOT NULL
+        ) WITHOUT ROWID
+    ''')
+
+
+def _drop_outdated_schema(conn):
+    """Drop every table if the database predates SCHEMA_VERSION.
+
+    Returns True when it dropped anything, so the caller knows a full re-index
+    follows.
+    """
+    has_metadata = conn.execute(
+        "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'metadata'"
+    ).fetchone()
+    if not has_metadata:
+        return False
+    row = conn.execute("SELECT value FROM metadata WHERE key = 'schema_version'").fetchone()
+    if row and int(row[0]) == SCHEMA_VERSION:
+        return False
+    tables = [
+        name for (name,) in conn.execute(
+            "SELECT name FROM sqlite_master WHERE type = 'table' "
+            "AND name NOT LIKE 'sqlite_%' AND name NOT LIKE 'hunts_fts_%'"
+        )
+    ]
+    for name in tables:
+        conn.execute(f'DROP TABLE IF EXISTS "{name}"')
+    conn.commit()
+    return True
+
+
+def _create_stats_tables(conn):
+    """Create the stats_* count tables and the triggers that maintain them.
+
+    Each trigger adds or subtracts one per source row and drops a key whose
+    count reaches zero. NULL keys (a hunt with no created_date, say) are not
+    counted.
+    """
+    for table, (key, source, expr) in STATS_TABLES.items():
+        new, old = expr.format(row="NEW"), expr.format(row="OLD")
+        increment = f'''
+            INSERT INTO {table} ({key}, hunts) SELECT {new}, 1 WHERE {new} IS NOT NULL
+            ON CONFLICT ({key}) DO UPDATE SET hunts = hunts + 1;'''
+        decrement = f'''
+            UPDATE {table} SET hunts = hunts - 1 WHERE {key} = {old};
+            DELETE FROM {table} WHERE {key} = {old} AND hunts <= 0;'''
+
+        conn.execute(f'''
+            CREATE TABLE IF NOT EXISTS {table} (
+                {key} TEXT PRIMARY KEY,
+                hunts INTEGER NOT NULL
+            ) WITHOUT ROWID
+        ''')
+        conn.execute(f'''
+            CREATE TRIGGER IF NOT EXISTS {table}_insert AFTER INSERT ON {source}
+            BEGIN {increment} END
+        ''')
+        conn.execute(f'''
+            CREATE TRIGGER IF NOT EXISTS {table}_delete AFTER DELETE ON {source}
+            BEGIN {decrement} END
+        ''')
+        if source == "hunts":
+            conn.execute(f'''
+                CREATE TRIGGER IF NOT EXISTS {table}_update AFTER UPDATE ON hunts
+                WHEN {old} IS NOT {new}
+                BEGIN {decrement} {increment} END
+            ''')
+
+
 def create_database_schema(conn):
-    """Create the database schema if it doesn't exist."""
+    """Create the database schema if it doesn't exist.
+
+    A database written by an older SCHEMA_VERSION is dropped first; the next
+    scan then re-indexes every hunt.
+    """
+    _drop_outdated_schema(conn)
+
     conn.execute('''
         CREATE TABLE IF NOT EXISTS hunts (
             id INTEGER PRIMARY KEY AUTOINCREMENT,
@@ -61,6 +270,7 @@ def create_database_schema(conn):
             technique TEXT,
             tags TEXT,
             submitter TEXT,
+            category TEXT,
             file_path TEXT NOT NULL,
             file_hash TEXT NOT NULL,
             created_date TEXT,
@@ -76,6 +286,45 @@ def create_database_schema(conn):
     conn.execute('CREATE INDEX IF NOT EXISTS idx_hunt_id ON hunts(hunt_id)')
     conn.execute('CREATE INDEX IF NOT EXISTS idx_created_date ON hunts(created_date)')
 
+    # Many-to-many lookups. WITHOUT ROWID tables clustered on the primary key,
+    # plus a reversed (value, hunt_rowid) index, so "hunts with technique X"
+    # and "values of hunt N" are both covered index seeks.
+    conn.execute('''
+        CREATE TABLE IF NOT EXISTS hunt_techniques (
+            hunt_rowid INTEGER NOT NULL,
+            technique TEXT NOT NULL,
+            parent_technique TEXT NOT NULL,
+            PRIMARY KEY (hunt_rowid, technique)
+        ) WITHOUT ROWID
+    ''')
+    conn.execute(
+        'CREATE INDEX IF NOT EXISTS idx_hunt_techniques_technique '
+        'ON hunt_techniques(technique, hunt_rowid)'
+    )
+    conn.execute(
+        'CREATE INDEX IF NOT EXISTS idx_hunt_techniques_parent '
+        'ON hunt_techniques(parent_technique, hunt_rowid)'
+    )
+    for table, column in (("hunt_tags", "tag"), ("hunt_tactics", "tactic")):
+        conn.execute(f'''
+            CREATE TABLE IF NOT EXISTS {table} (
+                hunt_rowid INTEGER NOT NULL,
+                {column} TEXT NOT NULL,
+                PRIMARY KEY (hunt_rowid, {column})
+            ) WITHOUT ROWID
+        ''')
+        conn.execute(
+            f'CREATE INDEX IF NOT EXISTS idx_{table}_{column} ON {table}({column}, hunt_rowid)'
+        )
+
+    _create_stats_tables(conn)
+
+    # Full-text index over the prose fields; rowid is hunts.id.
+    conn.execute(
+        f'CREATE VIRTUAL TABLE IF NOT EXISTS hunts_fts USING fts5('
+        f'{_FTS_COLUMN_SQL}, tokenize = "porter unicode61")'
+    )
+
     # Create metadata table for tracking database state
     conn.execute('''
         CREATE TABLE IF NOT EXISTS metadata (
@@ -83,6 +332,11 @@ def create_database_schema(conn):
             value TEXT
         )
     ''')
+    # Kept as-is when present: rewriting it would touch hunts.db on every run.
+    conn.execute(
+        "INSERT OR IGNORE INTO metadata (key, value) VALUES ('schema_version', ?)",
+        (str(SCHEMA_VERSION),),
+    )
 
     conn.commit()
 
@@ -119,17 +373,130 @@ def get_git_dates(filepath):
                datetime.fromtimestamp(stat.st_mtime).isoformat()
 
 
-def scan_and_update_hunts(conn, hunt_directories, verbose=True):
+def _hunt_row(hunt_info, hunt_file, current_hash):
+    """hunts columns shared by INSERT and UPDATE, in statement order."""
+    return (
+        hunt_info['hunt_id'],
+        hunt_info['hypothesis'],
+        hunt_info['tactic'],
+        hunt_info['technique'],
+        json.dumps(hunt_info['tags']),
+        hunt_info['submitter'],
+        hunt_info['category'],
+        str(hunt_file),
+        current_hash,
+    )
+
+
+def apply_changes(conn, inserts, updates, seen_filenames, stats=()):
+    """Write one scan's changes in a single transaction.
+
+    ``inserts`` holds ``(filename, hunt_info, row, created_date, last_modified)``
+    and ``updates`` holds ``(db_id, hunt_info, row, last_modified)``, where
+    ``row`` comes from :func:`_hunt_row`. ``stats`` holds
+    ``(filename, file_path, file_hash, file_size, file_mtime_ns)`` rows for
+    the stat cache (see :func:`attach_stat_cache`, which must have run). Rows
+    whose filename is not in ``seen_filenames`` are deleted with set-based
+    statements. Returns the number of deleted hunts.
+    """
+    with conn:
+        conn.executemany('''
+            UPDATE hunts
+            SET hunt_id = ?, hypothesis = ?, tactic = ?, technique = ?,
+                tags = ?, submitter = ?, category = ?, file_path = ?, file_hash = ?,
+                last_modified = ?
+            WHERE id = ?
+        ''', [(*row, last_modified, db_id) for db_id, _, row, last_modified in updates])
+        conn.executemany('INSERT OR REPLACE INTO stat.file_stats VALUES (?, ?, ?, ?, ?)', stats)
+
+        # AUTOINCREMENT ids only grow, so every row inserted below gets an id
+        # above the current maximum.
+        max_id = conn.execute('SELECT COALESCE(MAX(id), 0) FROM hunts').fetchone()[0]
+        conn.executemany('''
+            INSERT INTO hunts
+            (hunt_id, hypothesis, tactic, technique, tags, submitter, category,
+             file_path, file_hash, filename, created_date, last_modified)
+            VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+        ''', [(*row, filename, created, modified) for filename, _, row, created, modified in inserts])
+        new_ids = dict(conn.execute(
+            'SELECT filename, id FROM hunts WHERE id > ?', (max_id,)
+        ))
+
+        remove_hunt_index(conn, [db_id for db_id, _, _, _ in updates])
+        index_hunts(
+            conn,
+            [(db_id, info) for db_id, info, _, _ in updates]
+            + [(new_ids[filename], info) for filename, info, _, _, _ in inserts],
+        )
+
+        conn.execute('CREATE TEMP TABLE IF NOT EXISTS scan_seen (filename TEXT PRIMARY KEY)')
+        conn.execute('DELETE FROM scan_seen')
+        conn.executemany(
+            'INSERT OR IGNORE INTO scan_seen (filename) VALUES (?)',
+            [(name,) for name in seen_filenames],
+        )
+        gone = 'SELECT id FROM hunts WHERE filename NOT IN (SELECT filename FROM scan_seen)'
+        conn.execute(f'DELETE FROM hunts_fts WHERE rowid IN ({gone})')
+        for table in RELATION_TABLES:
+            conn.execute(f'DELETE FROM {table} WHERE hunt_rowid IN ({gone})')
+        deleted = conn.execute(
+            'DELETE FROM hunts WHERE filename NOT IN (SELECT filename FROM scan_seen)'
+        ).rowcount
+        conn.execute(
+            'DELETE FROM stat.file_stats WHERE filename NOT IN (SELECT filename FROM scan_seen)'
+        )
+        conn.execute('DROP TABLE scan_seen')
+
+        if inserts or updates or deleted:
+            conn.execute('''
+                INSERT OR REPLACE INTO metadata (key, value)
+                VALUES ('last_updated', ?)
+            ''', (datetime.now().isoformat(),))
+    return deleted
+
+
+def scan_and_update_hunts(conn, hunt_directories, verbose=True, parsed=None):
     """
     Scan hunt directories and update the database.
     Only processes new or modified files.
+
+    ``parsed`` optionally maps hunt file paths (as globbed from
+    ``hunt_directories``) to hunt_parser records, so a caller that already
+    parsed the corpus does not pay for it twice.
+
+    Every known ``(filename, file_hash)`` is loaded in one query and diffed in
+    memory; the resulting inserts, updates and deletes are then applied in a
+    single transaction by :func:`apply_changes`. Rows for files not found in
+    ``hunt_directories`` are removed.
+
+    A file whose size and mtime_ns match the stat cache is skipped without
+    being read, so a no-op run costs one ``stat()`` per hunt. Only a changed
+    stat leads to hashing, and only a changed hash to re-parsing. The stat
+    cache is a separate, uncommitted file (:func:`attach_stat_cache`): a file
+    that was only touched, as every file is by a fresh checkout, refreshes its
+    cache entry and leaves hunts.db byte-for-byte unchanged.
     """
     processed = 0
-    added = 0
-    updated = 0
     skipped = 0
     errors = 0
 
+    attach_stat_cache(conn)
+    known = {
+        row[1]: row
+        for row in conn.execute('SELECT id, filename, file_hash, file_path FROM hunts')
+    }
+    cached_stats = {
+        row[0]: row[1:]
+        for row in conn.execute(
+            'SELECT filename, file_path, file_hash, file_size, file_mtime_ns FROM stat.file_stats'
+        )
+    }
+    seen = set()
+    inserts = []
+    updates = []
+    stats = []
+    preparsed = parsed or {}
+
     for directory_name in hunt_directories:
         directory_path = Path(directory_name)
         if not directory_path.exists():
@@ -144,82 +511,50 @@ def scan_and_update_hunts(conn, hunt_directories, verbose=True):
         for hunt_file in hunt_files:
             if hunt_file.name in SKIP_FILENAMES:
                 continue
+            # A file that fails to parse keeps its existing row.
+            seen.add(hunt_file.name)
             try:
-                # Calculate current file hash
-                current_hash = get_file_hash(hunt_file)
+                stat = hunt_file.stat()
+                existing = known.get(hunt_file.name)
+                if existing:
+                    db_id, _, db_hash, db_path = existing
+                    same_path = db_path == str(hunt_file)
+                    if same_path and cached_stats.get(hunt_file.name) == (
+                        db_path, db_hash, stat.st_size, stat.st_mtime_ns
+                    ):
+                        skipped += 1
+                        continue  # Stat unchanged, skip without reading
 
-                # Check if file exists in database
-                cursor = conn.execute(
-                    'SELECT id, file_hash FROM hunts WHERE filename = ?',
-                    (hunt_file.name,)
-                )
-                existing = cursor.fetchone()
+                current_hash = get_file_hash(hunt_file)
+                stats.append((
+                    hunt_file.name, str(hunt_file), current_hash, stat.st_size, stat.st_mtime_ns,
+                ))
 
                 if existing:
-                    # File exists - check if it's been modified
-                    db_id, db_hash = existing
-                    if db_hash == current_hash:
+                    if db_hash == current_hash and same_path:
+                        # Touched (checkout, copy) but not edited.
                         skipped += 1
-                        continue  # No changes, skip
+                        continue
 
-                    # File modified - update it
                     if verbose:
                         print(f"  🔄 Updating {hunt_file.name}...")
-
-                    hunt_info = extract_hunt_info(str(hunt_file))
-
-                    created_date, last_modified = get_git_dates(hunt_file)
-
-                    conn.execute('''
-                        UPDATE hunts
-                        SET hunt_id = ?, hypothesis = ?, tactic = ?, technique = ?,
-                            tags = ?, submitter = ?, file_path = ?, file_hash = ?,
-                            last_modified = ?
-                        WHERE id = ?
-                    ''', (
-                        hunt_info['hunt_id'],
-                        hunt_info['hypothesis'],
-                        hunt_info['tactic'],
-                        hunt_info['technique'],
-                        json.dumps(hunt_info['tags']),
-                        hunt_info['submitter'],
-                        str(hunt_file),
-                        current_hash,
-                        last_modified,
-                        db_id
-                    ))
-
-                    updated += 1
+                    hunt_info = extract_hunt_info(str(hunt_file), preparsed.get(hunt_file))
+                    _, last_modified = get_git_dates(hunt_file)
+                    row = _hunt_row(hunt_info, hunt_file, current_hash)
+                    updates.append((db_id, hunt_info, row, last_modified))
                 else:
-                    # New file - insert it
                     if verbose:
                         print(f"  ✅ Adding {hunt_file.name}...")
-
-                    hunt_info = extract_hunt_info(str(hunt_file))
-
+                    hunt_info = extract_hunt_info(str(hunt_file), preparsed.get(hunt_file))
                     created_date, last_modified = get_git_dates(hunt_file)
-
-                    conn.execute('''
-                        INSERT INTO hunts
-                        (filename, hunt_id, hypothesis, tactic, technique, tags, submitter,
-                         file_path, file_hash, created_date, last_modified)
-                        VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-                    ''', (
+                    inserts.append((
                         hunt_file.name,
-                        hunt_info['hunt_id'],
-                        hunt_info['hypothesis'],
-                        hunt_info['tactic'],
-                        hunt_info['technique'],
-                        json.dumps(hunt_info['tags']),
-                        hunt_info['submitter'],
-                        str(hunt_file),
-                        current_hash,
+                        hunt_info,
+                        _hunt_row(hunt_info, hunt_file, current_hash),
                         created_date,
-                        last_modified
+                        last_modified,
                     ))
 
-                    added += 1
-
                 processed += 1
 
             except Exception as e:
@@ -228,49 +563,121 @@ def scan_and_update_hunts(conn, hunt_directories, verbose=True):
                     print(f"  ❌ Error processing {hunt_file.name}: {e}")
                 continue
 
-    # Clean up deleted files
-    cursor = conn.execute('SELECT filename, file_path FROM hunts')
-    all_db_files = cursor.fetchall()
+    gone = set(known) - seen
+    if verbose:
+        for filename in sorted(gone):
+            print(f"  🗑️  Removing deleted file: {filename}")
+    # A run that changed no hunt writes nothing to hunts.db, not even
+    # last_updated; touched files only refresh the stat cache.
     deleted = 0
-
-    for filename, filepath in all_db_files:
-        if not Path(filepath).exists():
-            if verbose:
-                print(f"  🗑️  Removing deleted file: {filename}")
-            conn.execute('DELETE FROM hunts WHERE filename = ?', (filename,))
-            deleted += 1
-
-    conn.commit()
-
-    # Update metadata
-    conn.execute('''
-        INSERT OR REPLACE INTO metadata (key, value)
-        VALUES ('last_updated', ?)
-    ''', (datetime.now().isoformat(),))
-    conn.commit()
+    if inserts or updates or gone:
+        deleted = apply_changes(conn, inserts, updates, seen, stats)
+    elif stats:
+        with conn:
+            conn.executemany('INSERT OR REPLACE INTO stat.file_stats VALUES (?, ?, ?, ?, ?)', stats)
 
     return {
         'processed': processed,
-        'added': added,
-        'updated': updated,
+        'added': len(inserts),
+        'updated': len(updates),
         'skipped': skipped,
         'deleted': deleted,
         'errors': errors
     }
 
 
+def _fts_query(text):
+    """Make free text safe to hand to FTS5 MATCH.
+
+    Plain words, ``prefix*`` terms, quoted phrases and the AND/OR/NOT
+    operators pass through. Anything else — ``T1059.001``, ``cmd.exe``,
+    ``C:\\Windows`` — is quoted as a phrase, since FTS5 would otherwise reject
+    its punctuation as a syntax error.
+    """
+    terms = []
+    for token in re.findall(r'"[^"]*"|\S+', text):
+        if token in ("AND", "OR", "NOT") or re.fullmatch(r'"[^"]*"|\w+\*?', token):
+            terms.append(token)
+        else:
+            terms.append('"' + token.replace('"', '""') + '"')
+    return " ".join(terms)
+
+
+def search_hunts(conn, query, limit=10):
+    """Full-text search over hunts, best match first.
+
+    Returns dicts with ``hunt_id``, ``file_path``, ``hypothesis``, ``score``
+    (BM25; lower is better) and a highlighted ``snippet``.
+    """
+    weights = ", ".join(str(w) for w in FTS_WEIGHTS)
+    cursor = conn.execute(f'''
+        SELECT h.hunt_id, h.file_path, h.hypothesis,
+               bm25(hunts_fts, {weights}) AS score,
+               snippet(hunts_fts, -1, '[', ']', '…', 12) AS snippet
+        FROM hunts_fts
+        JOIN hunts h ON h.id = hunts_fts.rowid
+        WHERE hunts_fts MATCH ?
+        ORDER BY score
+        LIMIT ?
+    ''', (_fts_query(query), limit))
+    columns = [c[0] for c in cursor.description]
+    return [dict(zip(columns, row)) for row in cursor.fetchall()]
+
+
+def find_hunts(conn, technique=None, tag=None, tactic=None):
+    """Hunts matching every given filter, ordered by hunt ID.
+
+    ``technique`` matches exactly, except that ``T1059.*`` matches the whole
+    family: T1059 itself and every T1059 sub-technique. ``tag`` may carry a
+    leading ``#``. Each filter is an index seek on its relation table; the
+    results are intersected in SQL. Returns dicts with ``hunt_id``,
+    ``file_path`` and ``hypothesis``.
+    """
+    subqueries = []
+    params = []
+    if technique:
+        if technique.endswith(".*"):
+            subqueries.append('SELECT hunt_rowid FROM hunt_techniques WHERE parent_technique = ?')
+            params.append(technique[:-2])
+        else:
+            subqueries.append('SELECT hunt_rowid FROM hunt_techniques WHERE technique = ?')
+            params.append(technique)
+    if tag:
+        subqueries.append('SELECT hunt_rowid FROM hunt_tags WHERE tag = ?')
+        params.append(tag.lstrip("#"))
+    if tactic:
+        subqueries.append('SELECT hunt_rowid FROM hunt_tactics WHERE tactic = ?')
+        params.append(tactic)
+    where = f'WHERE id IN ({" INTERSECT ".join(subqueries)})' if subqueries else ''
+    cursor = conn.execute(
+        f'SELECT hunt_id, file_path, hypothesis FROM hunts {where} ORDER BY hunt_id',
+        params,
+    )
+    columns = [c[0] for c in cursor.description]
+    return [dict(zip(columns, row)) for row in cursor.fetchall()]
+
+
+def print_search_results(results):
+    if not results:
+        print("No matching hunts.")
+        return
+    for r in results:
+        print(f"{r['hunt_id']:<6} {r['score']:8.2f}  {r['file_path']}")
+        print(f"       {r['snippet']}")
+
+
 def print_statistics(conn):
-    """Print database statistics."""
-    cursor = conn.execute('SELECT COUNT(*) FROM hunts')
+    """Print database statistics, read from the materialized stats_* tables."""
+    cursor = conn.execute('SELECT COALESCE(SUM(hunts), 0) FROM stats_category')
     total = cursor.fetchone()[0]
 
-    cursor = conn.execute('SELECT COUNT(DISTINCT tactic) FROM hunts WHERE tactic IS NOT NULL')
+    cursor = conn.execute('SELECT COUNT(*) FROM stats_tactic')
     unique_tactics = cursor.fetchone()[0]
 
-    cursor = conn.execute('SELECT COUNT(DISTINCT technique) FROM hunts WHERE technique IS NOT NULL')
+    cursor = conn.execute('SELECT COUNT(*) FROM stats_technique')
     unique_techniques = cursor.fetchone()[0]
 
-    cursor = conn.execute('SELECT tactic, COUNT(*) as count FROM hunts WHERE tactic IS NOT NULL GROUP BY tactic ORDER BY count DESC LIMIT 5')
+    cursor = conn.execute('SELECT tactic, hunts FROM stats_tactic ORDER BY hunts DESC, tactic LIMIT 5')
     top_tactics = cursor.fetchall()
 
     cursor = conn.execute('SELECT value FROM metadata WHERE key = "last_updated"')
@@ -297,9 +704,33 @@ def main():
     parser.add_argument('--rebuild', action='store_true', help='Drop and rebuild entire database')
     parser.add_argument('--quiet', action='store_true', help='Suppress output except errors')
     parser.add_argument('--db-path', default='database/hunts.db', help='Path to database file')
+    parser.add_argument('--search', metavar='QUERY', help='Full-text search the index and exit')
+    parser.add_argument('--limit', type=int, default=10, help='Maximum search results (default 10)')
+    parser.add_argument('--technique', help='List hunts with this technique (T1059.* for the family)')
+    parser.add_argument('--tag', help='List hunts with this tag')
+    parser.add_argument('--tactic', help='List hunts with this tactic')
     args = parser.parse_args()
 
     verbose = not args.quiet
+    filtering = args.technique or args.tag or args.tactic
+
+    if args.search is not None or filtering:
+        if not Path(args.db_path).exists():
+            print(f"❌ {args.db_path} not found; build it first.", file=sys.stderr)
+            sys.exit(1)
+        conn = sqlite3.connect(str(args.db_path))
+        try:
+            if args.search is not None:
+                print_search_results(search_hunts(conn, args.search, args.limit))
+            else:
+                for hunt in find_hunts(conn, args.technique, args.tag, args.tactic):
+                    print(f"{hunt['hunt_id']:<6} {hunt['file_path']}")
+        except sqlite3.OperationalError as e:
+            print(f"❌ Query failed: {e}", file=sys.stderr)
+            sys.exit(1)
+        finally:
+            conn.close()
+        return
 
     # Ensure database directory exists
     db_path = Path(args.db_path)
@@ -313,6 +744,7 @@ def main():
 
     # Connect to database
     conn = sqlite3.connect(str(db_path))
+    configure_connection(conn)
 
     if verbose:
         print("🗄️  HEARTH Hunt Database Builder")
@@ -0,0 +1,223 @@
+#!/usr/bin/env python3
+"""
+Record which inputs produced each generated artifact, and check it.
+
+public/build-manifest.json holds one entry per artifact:
+
+    "hunts-data": {
+      "extra": [],              # inputs beyond the declared ones (e.g. STIX)
+      "inputs": "<digest>",     # every non-script input file
+      "outputs": {"public/hunts-data.json": "<digest>", ...},
+      "script": "<digest>"      # the scripts that produce the artifact
+    }
+
+Digests are BLAKE2b over repo-relative paths and file contents, so a fresh
+checkout does not look dirty and no timestamps are stored. A builder asks
+:meth:`Manifest.status` before doing any work and calls :meth:`Manifest.record`
+after writing; ``--check`` answers the same question for CI by hashing inputs
+and outputs, without importing or running any builder.
+
+Usage:
+    python scripts/build_manifest.py --check                    # all artifacts
+    python scripts/build_manifest.py --check hunts-data actor-mentions
+"""
+
+from __future__ import annotations
+
+import argparse
+import hashlib
+import json
+import sys
+import time
+from pathlib import Path
+from typing import NamedTuple
+
+REPO_ROOT = Path(__file__).resolve().parent.parent
+MANIFEST = "public/build-manifest.json"
+
+CORPUS = ("Flames/*.md", "Embers/*.md", "Alchemy/*.md")
+# The parser every corpus build goes through.
+PARSER = (
+    "scripts/hunt_parser.py", "scripts/hunt_schema.py", "scripts/hunt_yaml.py", "scripts/techniques.py",
+)
+STIX = "data/enterprise-attack.json"
+
+
+class Artifact(NamedTuple):
+    name: str
+    inputs: tuple[str, ...]
+    outputs: tuple[str, ...]
+
+
+ARTIFACTS = {
+    a.name: a
+    for a in (
+        Artifact(
+            "hunts-data",
+            CORPUS + PARSER + ("scripts/rebuild_hunts_data.py", "scripts/inverted_index.py"),
+            ("hunts-data.js", "public/hunts-data.json", "public/hunts-index.json"),
+        ),
+        Artifact(
+            "actor-mentions",
+            (
+                "public/hunts-data.json",
+                "public/context-graph-data.json",
+                "scripts/actor_alias_denylist.json",
+                "scripts/build_actor_mentions.py",
+            ),
+            ("public/actor-mentions.json",),
+        ),
+        Artifact(
+            "mitre-matrix",
+            (STIX, "scripts/build_mitre_matrix.py"),
+            ("public/mitre-matrix.json",),
+        ),
+        Artifact(
+            "datasource-map",
+            ("public/hunts-data.json", "scripts/build_datasource_map.py", "scripts/techniques.py"),
+            ("public/datasource-mapping.json",),
+        ),
+        Artifact(
+            "leaderboard",
+            CORPUS + PARSER + (
+                "scripts/generate_leaderboard.py",
+                "scripts/build_hunt_database.py",
+                "scripts/rebuild_hunts_data.py",
+            ),
+            ("Keepers/Contributors.md",),
+        ),
+    )
+}
+
+
+def input_files(patterns, root: Path = REPO_ROOT) -> list[Path]:
+    """The files the given globs match, sorted and de-duplicated."""
+    found = set()
+    for pattern in patterns:
+        found.update(p for p in root.glob(pattern) if p.is_file())
+    return sorted(found)
+
+
+def missing_inputs(patterns, root: Path = REPO_ROOT) -> list[str]:
+    """Literal (non-glob) inputs that do not exist; the build cannot run."""
+    return [p for p in patterns if "*" not in p and not (root / p).exists()]
+
+
+def file_digest(path: Path, cache: dict | None = None) -> str:
+    if cache is not None and path in cache:
+        return cache[path]
+    digest = hashlib.blake2b(path.read_bytes(), digest_size=16).hexdigest()
+    if cache is not None:
+        cache[path] = digest
+    return digest
+
+
+def fingerprint(patterns, root: Path = REPO_ROOT, cache: dict | None = None) -> str:
+    """BLAKE2b over every matched file's repo-relative path and content digest."""
+    h = hashlib.blake2b(digest_size=16)
+    for path in input_files(patterns, root):
+        h.update(path.relative_to(root).as_posix().encode())
+        h.update(file_digest(path, cache).encode())
+    return h.hexdigest()
+
+
+def _split(artifact: Artifact, extra) -> tuple[tuple[str, ...], tuple[str, ...]]:
+    patterns = artifact.inputs + tuple(extra)
+    scripts = tuple(p for p in patterns if p.startswith("scripts/"))
+    return scripts, tuple(p for p in patterns if p not in scripts)
+
+
+class Manifest:
+    """public/build-manifest.json, loaded once and written back by :meth:`save`.
+
+    ``cache`` memoizes file digests for the life of the object. Call
+    :meth:`forget` for files that are rewritten in the meantime.
+    """
+
+    def __init__(self, root: Path = REPO_ROOT, path: Path | None = None):
+        self.root = root
+        self.path = path or root / MANIFEST
+        self.cache: dict[Path, str] = {}
+        try:
+            self.entries = json.loads(self.path.read_text())
+        except (OSError, ValueError):
+            self.entries = {}
+
+    def status(self, artifact: Artifact | str, extra=None) -> str | None:
+        """``None`` when the artifact is fresh; otherwise why it is stale.
+
+        ``extra`` defaults to the extra inputs recorded for the artifact.
+        """
+        artifact = ARTIFACTS[artifact] if isinstance(artifact, str) else artifact
+        entry = self.entries.get(artifact.name)
+        if entry is None:
+            return "never built"
+        if extra is None:
+            extra = entry.get("extra", [])
+        elif list(extra) != entry.get("extra", []):
+            return "options changed"
+        scripts, inputs = _split(artifact, extra)
+        missing = missing_inputs(scripts + inputs, self.root)
+        if missing:
+            return f"missing input {missing[0]}"
+        if fingerprint(scripts, self.root, self.cache) != entry.get("script"):
+            return "script changed"
+        if fingerprint(inputs, self.root, self.cache) != entry.get("inputs"):
+            return "inputs changed"
+        recorded = entry.get("outputs", {})
+        for out in artifact.outputs:
+            path = self.root / out
+            if not path.exists():
+                return f"missing output {out}"
+            if file_digest(path, self.cache) != recorded.get(out):
+                return f"output modified {out}"
+        return None
+
+    def forget(self, paths) -> None:
+        for p in paths:
+            self.cache.pop(self.root / p, None)
+
+    def record(self, artifact: Artifact | str, extra=()) -> None:
+        """Record the artifact's current inputs and outputs as a fresh build."""
+        artifact = ARTIFACTS[artifact] if isinstance(artifact, str) else artifact
+        self.forget(artifact.outputs)
+        scripts, inputs = _split(artifact, extra)
+        self.entries[artifact.name] = {
+            "extra": list(extra),
+            "inputs": fingerprint(inputs, self.root, self.cache),
+            "outputs": {
+                out: file_digest(self.root / out, self.cache) for out in artifact.outputs
+            },
+            "script": fingerprint(scripts, self.root, self.cache),
+        }
+
+    def save(self) -> None:
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self.path.write_text(json.dumps(self.entries, indent=2, sort_keys=True) + "\n")
+
+
+def check(names=None, root: Path | None = None) -> dict[str, str | None]:
+    """``{artifact name: reason it is stale, or None}`` for ``names`` (default all)."""
+    manifest = Manifest(root or REPO_ROOT)
+    return {name: manifest.status(name) for name in names or ARTIFACTS}
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--check", nargs="*", metavar="ARTIFACT", choices=list(ARTIFACTS),
+                        help="exit 1 if any of these artifacts (default: all) is stale")
+    args = parser.parse_args(argv)
+    if args.check is None:
+        parser.print_help()
+        return 0
+
+    start = time.perf_counter()
+    results = check(args.check)
+    for name, reason in results.items():
+        print(f"  {name:<16} {reason or 'up to date'}")
+    print(f"  checked in {(time.perf_counter() - start) * 1000:.1f} ms")
+    return 1 if any(results.values()) else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -6,11 +6,18 @@ public/mitre-matrix.json with the tactics + techniques the frontend needs, plus:
   - `platforms` on each technique (for local OS validation by the CTI pipeline)
   - a top-level `deprecated` map of retired ID → replacement (revoked-by)
 Both are additive; existing consumers that read `tactics`/`techniques` are unaffected.
+
+Skips the rebuild when public/build-manifest.json shows neither the bundle nor
+this script changed since the last one; pass --force to rebuild anyway.
 """
 import json
 import sys
 from pathlib import Path
 
+_REPO_ROOT = str(Path(__file__).resolve().parent.parent)
+if _REPO_ROOT not in sys.path:
+    sys.path.insert(0, _REPO_ROOT)
+
 ROOT = Path(__file__).resolve().parent.parent
 SOURCE = ROOT / "data" / "enterprise-attack.json"
 TARGET = ROOT / "public" / "mitre-matrix.json"
@@ -22,9 +29,32 @@ def main() -> int:
         print(f"ERROR: {SOURCE} not found. See plan pre-flight.", file=sys.stderr)
         return 1
 
+    from scripts.build_manifest import Manifest
+
+    manifest = Manifest(ROOT)
+    if "--force" not in sys.argv[1:] and manifest.status("mitre-matrix") is None:
+        print(f"{TARGET} is up to date (public/build-manifest.json)")
+        return 0
+
     bundle = json.loads(SOURCE.read_text())
-    objects = bundle.get("objects", [])
+    write_matrix(build_matrix(bundle.get("objects", [])))
+    manifest.record("mitre-matrix")
+    manifest.save()
+    return 0
+
 
+def write_matrix(payload: dict, target: Path = TARGET) -> None:
+    target.parent.mkdir(parents=True, exist_ok=True)
+    target.write_text(json.dumps(payload, indent=2, ensure_ascii=False) + "\n")
+
+    size_kb = target.stat().st_size / 1024
+    print(f"Wrote {target} — {len(payload['tactics'])} tactics, "
+          f"{len(payload['techniques'])} techniques, "
+          f"{len(payload['deprecated'])} deprecated, {size_kb:.1f} KB")
+
+
+def build_matrix(objects: list[dict]) -> dict:
+    """The mitre-matrix.json payload for a parsed STIX bundle's ``objects``."""
     tactics: list[dict] = []
     techniques: list[dict] = []
 
@@ -82,14 +112,7 @@ def main() -> int:
 
     techniques.sort(key=tech_key)
 
-    payload = {"tactics": tactics, "techniques": techniques, "deprecated": deprecated}
-    TARGET.parent.mkdir(parents=True, exist_ok=True)
-    TARGET.write_text(json.dumps(payload, indent=2, ensure_ascii=False) + "\n")
-
-    size_kb = TARGET.stat().st_size / 1024
-    print(f"Wrote {TARGET} — {len(tactics)} tactics, {len(techniques)} techniques, "
-          f"{len(deprecated)} deprecated, {size_kb:.1f} KB")
-    return 0
+    return {"tactics": tactics, "techniques": techniques, "deprecated": deprecated}
 
 
 def _build_deprecated_map(objects: list[dict]) -> dict[str, dict]:
@@ -1,12 +1,14 @@
 #!/usr/bin/env python3
 """Fail a PR if it introduces a hunt ID that collides with an existing one.
 
-Run on a PR with the head checked out and ``origin/main`` fetched. Detects:
+Run with the PR head and ``origin/main`` fetched. Everything is read from
+commit and tree objects — the working tree is never consulted — so any fetched
+head can be checked without checking it out. Detects:
   1. a hunt file ADDED by the PR whose ID already exists on main,
   2. an added or modified file whose declared ID disagrees with its filename,
   3. a hunt file MODIFIED in place whose submitter changed — i.e. one
      contributor's hunt overwritten by a different hunt under the same ID,
-  4. two files in the working tree sharing an ID.
+  4. two files in the PR head sharing an ID.
 
 Fails closed if ``origin/main`` yields no hunts, since an empty baseline (an
 unresolved base ref) would otherwise let every colliding ID pass.
@@ -16,6 +18,7 @@ Exits 1 (printing each problem) on any collision, else 0.
 
 from __future__ import annotations
 
+import io
 import subprocess
 import sys
 from pathlib import Path
@@ -24,10 +27,9 @@ _REPO_ROOT = str(Path(__file__).resolve().parent.parent)
 if _REPO_ROOT not in sys.path:
     sys.path.insert(0, _REPO_ROOT)
 
-import frontmatter
-
+from scripts.git_objects import GitObjectReader
 from scripts.hunt_ids import find_id_problems
-from scripts.hunt_parser import _parse_legacy_table
+from scripts.hunt_parser import _parse_legacy_table, frontmatter_header
 
 DIRS = ("Flames", "Embers", "Alchemy")
 
@@ -47,13 +49,13 @@ def extract_identity(text: str, stem: str) -> tuple[str | None, str | None]:
     for legacy hunts). Never raises — unreadable fields come back as ``None``.
     """
     try:
-        post = frontmatter.loads(text)
+        metadata = frontmatter_header(io.StringIO(text))
     except Exception:
-        post = None
+        metadata = {}
 
-    if post is not None and post.metadata:
-        declared = post.metadata.get("id")
-        submitter = post.metadata.get("submitter")
+    if metadata:
+        declared = metadata.get("id")
+        submitter = metadata.get("submitter")
         name = submitter.get("name") if isinstance(submitter, dict) else submitter
         return (
             str(declared).strip() if declared else None,
@@ -73,50 +75,91 @@ def extract_identity(text: str, stem: str) -> tuple[str | None, str | None]:
     return (declared, name or None)
 
 
-def _show_main(path: str) -> str:
-    try:
-        return _git("show", f"origin/main:{path}")
-    except subprocess.CalledProcessError:
-        return ""
-
-
-def main() -> int:
-    # Establish the baseline first, and fail closed if it looks empty. ``main``
-    # always has hunts, so an empty result means ``origin/main`` didn't resolve
-    # (e.g. the remote-tracking ref wasn't populated in a fork-PR runner) rather
-    # than a genuinely clean base. Trusting it would let every colliding ID pass.
-    main_out = _git("ls-tree", "-r", "--name-only", "origin/main", "--", *DIRS)
-    main_ids = {Path(p).stem for p in main_out.splitlines() if p.endswith(".md")}
-    if not main_ids:
-        print(
-            "Hunt ID collision check FAILED: found no hunts on origin/main. "
-            "The base didn't resolve (is origin/main fetched?); refusing to pass "
-            "against an empty baseline."
-        )
-        return 1
+def _hunt_stems(rev: str) -> list[str]:
+    out = _git("ls-tree", "-r", "--name-only", rev, "--", *DIRS)
+    return [Path(p).stem for p in out.splitlines() if p.endswith(".md")]
 
-    added_out = _git(
-        "diff", "--diff-filter=A", "--name-only", "origin/main...HEAD", "--", *DIRS
-    )
-    added_paths = [Path(p) for p in added_out.splitlines() if p.endswith(".md")]
-    added = [
-        (p.stem, extract_identity(p.read_text(encoding="utf-8"), p.stem)[0])
-        for p in added_paths
-    ]
-
-    modified_out = _git(
-        "diff", "--diff-filter=M", "--name-only", "origin/main...HEAD", "--", *DIRS
+
+def _changed_hunts(base: str, head: str) -> list[tuple[str, str, str]]:
+    """``(status, path, blob)`` for each hunt ``head`` adds (A) or modifies (M)
+    since its merge base with ``base``.
+
+    Renames are not detected: a hunt renamed to a new ID is an added ID and
+    must be checked as one.
+    """
+    merge_base = _git("merge-base", base, head).strip()
+    out = _git(
+        "diff-tree", "-r", "--no-renames", "--diff-filter=AM", merge_base, head, "--", *DIRS
     )
-    modified_paths = [Path(p) for p in modified_out.splitlines() if p.endswith(".md")]
+    changed = []
+    for line in out.splitlines():
+        # ":<old mode> <new mode> <old blob> <new blob> <status>\t<path>"
+        meta, path = line.split("\t", 1)
+        _, _, _, blob, status = meta.split()
+        if path.endswith(".md"):
+            changed.append((status, path, blob))
+    return changed
+
+
+class Baseline:
+    """The base side of a collision check, resolved once and shareable.
+
+    ``commit`` pins ``base`` to one commit and ``ids`` holds its hunt stems.
+    ``submitter`` reads a path's submitter on that commit the first time it is
+    asked for. recheck_open_prs shares one instance across threads to check
+    every open PR against the same main.
+    """
+
+    def __init__(self, base: str = "origin/main"):
+        self.name = base
+        self.commit = _git("rev-parse", "--verify", f"{base}^{{commit}}").strip()
+        self.ids = set(_hunt_stems(self.commit))
+        self._submitters: dict[str, str | None] = {}
+
+    def submitter(self, path: str, objects: GitObjectReader) -> str | None:
+        # Two threads may both miss and read the same blob; the result is the
+        # same either way, so no lock.
+        if path not in self._submitters:
+            text = objects.text(f"{self.commit}:{path}")
+            self._submitters[path] = extract_identity(text, Path(path).stem)[1]
+        return self._submitters[path]
+
+
+def collision_problems(
+    head: str = "HEAD", base: str = "origin/main", baseline: Baseline | None = None
+) -> list[str]:
+    """Every collision ``head`` introduces against ``base`` (empty = clean).
+
+    Pass a ``baseline`` to reuse one already resolved; ``base`` is then ignored.
+    """
+    baseline = baseline or Baseline(base)
+    # Fail closed if the baseline looks empty. ``main`` always has hunts, so an
+    # empty result means ``origin/main`` didn't resolve (e.g. the
+    # remote-tracking ref wasn't populated in a fork-PR runner) rather than a
+    # genuinely clean base. Trusting it would let every colliding ID pass.
+    if not baseline.ids:
+        return [
+            f"found no hunts on {baseline.name}. The base didn't resolve (is it "
+            "fetched?); refusing to pass against an empty baseline."
+        ]
+
+    added: list[tuple[str, str | None]] = []
     modified: list[tuple[str, str | None, str | None, str | None]] = []
-    for p in modified_paths:
-        pr_id, pr_submitter = extract_identity(p.read_text(encoding="utf-8"), p.stem)
-        _, main_submitter = extract_identity(_show_main(p.as_posix()), p.stem)
-        modified.append((p.stem, pr_id, pr_submitter, main_submitter))
+    with GitObjectReader() as objects:
+        for status, path, blob in _changed_hunts(baseline.commit, head):
+            stem = Path(path).stem
+            pr_id, pr_submitter = extract_identity(objects.text(blob), stem)
+            if status == "A":
+                added.append((stem, pr_id))
+            else:
+                main_submitter = baseline.submitter(path, objects)
+                modified.append((stem, pr_id, pr_submitter, main_submitter))
+
+    return find_id_problems(added, baseline.ids, _hunt_stems(head), modified)
 
-    all_stems = [p.stem for d in DIRS for p in Path(d).glob("*.md")]
 
-    problems = find_id_problems(added, main_ids, all_stems, modified)
+def main(head: str = "HEAD", base: str = "origin/main") -> int:
+    problems = collision_problems(head, base)
     if problems:
         print("Hunt ID collision check FAILED:")
         for problem in problems:
@@ -8,8 +8,6 @@ unavailable or fails.
 
 from __future__ import annotations
 
-from bs4 import BeautifulSoup
-
 _BLOCK_TAGS = ["p", "h1", "h2", "h3", "h4", "li", "blockquote"]
 
 
@@ -33,6 +31,8 @@ def extract_readable_text(html, min_paragraph_len: int = 20) -> str:
     except Exception:
         pass
 
+    from bs4 import BeautifulSoup
+
     soup = BeautifulSoup(html, "html.parser")
     for junk in soup(["script", "style", "meta", "noscript"]):
         junk.decompose()
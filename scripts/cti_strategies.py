@@ -0,0 +1,218 @@
+"""
+Per-domain memory of which CTI extraction strategy works.
+
+``process_issue.get_cti_content`` extracts HTML with a ladder of strategies:
+a plain parse, then readability, then a headless browser that may launch
+Chromium three times and poll for half a minute each. The ladder used to start
+from the bottom for every URL, so each article from a JS-challenged site paid
+for the cheap steps failing first, and each article from a site nothing can
+read paid for every browser attempt failing.
+
+``StrategyMemory`` records, per domain, the strategy that won and how long the
+full ladder took to reach it. The next URL on that domain goes straight to the
+winner. When nothing worked (``"none"``), later URLs run only the cheap steps
+and skip the heavy ones. Every ``REPROBE_EVERY`` uses, or after
+``REPROBE_AFTER`` seconds, the whole ladder runs again in case the site
+changed. The memory shares ``.hearth/http-cache.db`` with the HTTP cache, so
+the CTI workflows carry both between runs.
+
+    python scripts/cti_strategies.py        # time saved per domain
+"""
+
+from __future__ import annotations
+
+import sqlite3
+import sys
+import time
+from collections.abc import Callable
+from functools import cache
+from pathlib import Path
+from urllib.parse import urlsplit
+
+_REPO_ROOT = str(Path(__file__).resolve().parent.parent)
+if _REPO_ROOT not in sys.path:
+    sys.path.insert(0, _REPO_ROOT)
+
+from scripts.http_cache import DEFAULT_CACHE
+
+NONE = "none"  # the whole ladder came up short
+MIN_WORDS = 100
+REPROBE_EVERY = 10
+REPROBE_AFTER = 14 * 24 * 3600
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS domain_strategies (
+    domain         TEXT PRIMARY KEY,
+    strategy       TEXT NOT NULL,   -- step name, or 'none'
+    ladder_seconds REAL NOT NULL,   -- what the last full probe took
+    probed_at      REAL NOT NULL,
+    uses           INTEGER NOT NULL DEFAULT 0,  -- shortcuts since that probe
+    runs           INTEGER NOT NULL DEFAULT 0,
+    saved_seconds  REAL NOT NULL DEFAULT 0
+);
+"""
+
+
+def domain_of(url: str) -> str:
+    host = (urlsplit(url).hostname or "").lower()
+    return host.removeprefix("www.")
+
+
+class StrategyMemory:
+    """Winning extraction strategy per domain, stored at ``path``."""
+
+    def __init__(self, path: str | Path = DEFAULT_CACHE):
+        Path(path).parent.mkdir(parents=True, exist_ok=True)
+        self._conn = sqlite3.connect(str(path))
+        self._conn.executescript(_SCHEMA)
+
+    def close(self) -> None:
+        self._conn.close()
+
+    def __enter__(self) -> StrategyMemory:
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+    def plan(self, url: str, now: float | None = None) -> str | None:
+        """Strategy to start with for ``url``, or None to probe the whole ladder."""
+        row = self._conn.execute(
+            "SELECT strategy, probed_at, uses FROM domain_strategies WHERE domain = ?",
+            (domain_of(url),),
+        ).fetchone()
+        if row is None:
+            return None
+        strategy, probed_at, uses = row
+        now = time.time() if now is None else now
+        if uses >= REPROBE_EVERY or now - probed_at >= REPROBE_AFTER:
+            return None
+        return strategy
+
+    def record(self, url: str, strategy: str, seconds: float, probed: bool,
+               now: float | None = None) -> float:
+        """Record a run on ``url``'s domain; return the seconds it saved.
+
+        A probe (``probed``) ran the ladder from the top, so ``strategy`` is
+        the new winner and ``seconds`` the new baseline. A shortcut saved the
+        difference between that baseline and ``seconds``.
+        """
+        domain = domain_of(url)
+        now = time.time() if now is None else now
+        with self._conn:
+            if probed:
+                self._conn.execute(
+                    "INSERT INTO domain_strategies (domain, strategy, ladder_seconds, probed_at, runs) "
+                    "VALUES (?, ?, ?, ?, 1) ON CONFLICT (domain) DO UPDATE SET "
+                    "strategy = excluded.strategy, ladder_seconds = excluded.ladder_seconds, "
+                    "probed_at = excluded.probed_at, uses = 0, runs = runs + 1",
+                    (domain, strategy, seconds, now),
+                )
+                return 0.0
+            (ladder_seconds,) = self._conn.execute(
+                "SELECT ladder_seconds FROM domain_strategies WHERE domain = ?", (domain,)
+            ).fetchone()
+            saved = max(0.0, ladder_seconds - seconds)
+            self._conn.execute(
+                "UPDATE domain_strategies SET uses = uses + 1, runs = runs + 1, "
+                "saved_seconds = saved_seconds + ? WHERE domain = ?",
+                (saved, domain),
+            )
+        return saved
+
+    def report(self) -> list[tuple[str, str, int, float]]:
+        """``(domain, strategy, runs, saved_seconds)``, most time saved first."""
+        return self._conn.execute(
+            "SELECT domain, strategy, runs, saved_seconds FROM domain_strategies "
+            "ORDER BY saved_seconds DESC, domain"
+        ).fetchall()
+
+
+def run_ladder(
+    url: str,
+    steps: dict[str, Callable[[], str | None]],
+    memory: StrategyMemory,
+    heavy: tuple[str, ...] = (),
+    min_words: int = MIN_WORDS,
+) -> tuple[str, str]:
+    """Run ``steps`` (cheapest first) until one succeeds.
+
+    A step succeeds with ``min_words`` words. A fallback step (any but the
+    first) also succeeds once the first step has run and it returned more
+    words than that, as ``get_cti_content`` always accepted: a short article
+    that JS rendering reads better than the plain parse is a result, not a
+    hard domain.
+
+    Starts from the domain's remembered winner; a domain where nothing worked
+    skips the ``heavy`` steps. If the shortcut fails, the remaining steps run
+    and the outcome is recorded as a fresh probe. Returns ``(text, strategy)``
+    where ``text`` is the longest result seen if no step succeeded.
+    """
+    planned = memory.plan(url)
+    if planned is not None and planned != NONE and planned not in steps:
+        planned = None  # a step that no longer exists
+    if planned is None:
+        order = list(steps)
+    elif planned == NONE:
+        order = [name for name in steps if name not in heavy]
+    else:
+        order = [planned, *(name for name in steps if name != planned)]
+
+    first = next(iter(steps))
+    best, winner = "", NONE
+    seconds: dict[str, float] = {}
+    words: dict[str, int] = {}
+    for position, name in enumerate(order):
+        start = time.perf_counter()
+        text = steps[name]() or ""
+        seconds[name] = time.perf_counter() - start
+        words[name] = len(text.split())
+        if words[name] > len(best.split()):
+            best = text
+        if words[name] >= min_words:
+            winner = name
+        elif first in words:
+            # The longest fallback so far, if it beat the first step.
+            fallback = max((n for n in words if n != first), key=words.get, default=None)
+            if fallback is not None and words[fallback] > words[first]:
+                winner = fallback
+        if winner != NONE:
+            if position:
+                print(f"✅ '{winner}' extraction succeeded ({words[winner]} words)")
+            break
+        print(f"⚠️  '{name}' extraction too short ({words[name]} words)")
+
+    # Only a shortcut that held up (the remembered step won again, or a
+    # known-hard domain stayed hard) counts as one; anything else re-learns
+    # the domain, costed as the ladder would have run: every step up to the
+    # winner, in order.
+    shortcut = planned is not None and winner == planned
+    if shortcut:
+        saved = memory.record(url, winner, sum(seconds.values()), probed=False)
+        print(f"⏱️  {domain_of(url)}: went straight to '{planned}', saved ~{saved:.1f}s")
+    else:
+        ladder = list(steps)
+        reached = ladder if winner == NONE else ladder[:ladder.index(winner) + 1]
+        memory.record(url, winner, sum(seconds.get(n, 0.0) for n in reached), probed=True)
+    return best, winner
+
+
+@cache
+def default_memory() -> StrategyMemory:
+    """The process-wide memory at ``DEFAULT_CACHE``, opened on first use."""
+    return StrategyMemory()
+
+
+def main() -> None:
+    rows = default_memory().report()
+    if not rows:
+        print("No extraction strategies recorded yet.")
+        return
+    print(f"{'Domain':40} {'Strategy':10} {'Runs':>5} {'Saved':>9}")
+    for domain, strategy, runs, saved in rows:
+        print(f"{domain:40} {strategy:10} {runs:5d} {saved:8.1f}s")
+    print(f"{'Total':40} {'':10} {sum(r[2] for r in rows):5d} {sum(r[3] for r in rows):8.1f}s")
+
+
+if __name__ == "__main__":
+    main()
@@ -9,11 +9,22 @@ GitHub issue comment posted after each draft is generated.
 import json
 import os
 import re
+import sqlite3
+import sys
+import warnings
 from pathlib import Path
 from typing import Optional
 
 from dotenv import load_dotenv
 
+_REPO_ROOT = str(Path(__file__).resolve().parent.parent)
+if _REPO_ROOT not in sys.path:
+    sys.path.insert(0, _REPO_ROOT)
+
+from scripts.hunt_index import DEFAULT_DB, HuntIndex
+from scripts.hunt_parser import split_table_row
+from scripts.migrate_to_frontmatter import SKIP_FILENAMES
+
 load_dotenv()
 
 CLAUDE_MODEL = os.getenv("CLAUDE_MODEL", "claude-sonnet-5")
@@ -26,8 +37,9 @@ MODERATE_SIMILARITY = 60
 
 
 def extract_hunt_info(content: str, filename: str, filepath: str) -> Optional[dict]:
-    """Parse a hunt markdown file into a dict with hypothesis/tactic/tags.
+    """Parse a new submission's markdown into a dict with hypothesis/tactic/tags.
 
+    Existing hunts go through the hunt parser instead (load_existing_hunts).
     Returns None if no hypothesis can be located.
     """
     lines = content.splitlines()
@@ -47,8 +59,9 @@ def extract_hunt_info(content: str, filename: str, filepath: str) -> Optional[di
         if "|" in line and "Tactic" in line and "Hypothesis" in line:
             for follow in lines[i + 1:i + 4]:
                 if "|" in follow and "---" not in follow:
-                    cells = [c.strip() for c in follow.split("|")]
-                    cells = [c for c in cells if c]
+                    # Empty cells keep their position, so an empty
+                    # hypothesis cell does not pull Notes into Tactic.
+                    cells = split_table_row(follow)
                     if len(cells) >= 3:
                         tactic = cells[2]
                     break
@@ -65,25 +78,88 @@ def extract_hunt_info(content: str, filename: str, filepath: str) -> Optional[di
     }
 
 
+def _existing_record(filename: str, filepath: str, hypothesis: str, tactic: str,
+                     tags) -> dict:
+    """One existing hunt as both the index and the parse fallback return it."""
+    return {
+        "filename": filename,
+        "filepath": filepath,
+        "hypothesis": hypothesis,
+        "tactic": tactic or "",
+        "tags": sorted({f"#{tag.lstrip('#')}" for tag in tags}),
+    }
+
+
+def _hunts_from_index(hunt_files: list[Path], db_path: Path = DEFAULT_DB) -> Optional[list[dict]]:
+    """Hunt info from hunts.db, or None if the index is missing or out of date.
+
+    The index only counts as current when it holds exactly the hunt files on
+    disk, each at the same path and with the content hash it was indexed
+    from, so a submission or an edit that landed after the last database
+    update falls back to parsing the markdown. Hunts come back in
+    ``hunt_files`` order, as the parse fallback returns them.
+    """
+    from scripts.build_hunt_database import get_file_hash
+
+    if not Path(db_path).exists():
+        return None
+    try:
+        with HuntIndex(db_path) as index:
+            rows = {row["filename"]: row for row in index.all()}
+            with index.connection() as conn:
+                indexed = {
+                    filename: (file_path, file_hash)
+                    for filename, file_path, file_hash in conn.execute(
+                        "SELECT filename, file_path, file_hash FROM hunts"
+                    )
+                }
+    except sqlite3.Error:
+        return None
+    on_disk = [f for f in hunt_files if f.name not in SKIP_FILENAMES]
+    if set(indexed) != {f.name for f in on_disk}:
+        return None
+    for hunt_file in on_disk:
+        if indexed[hunt_file.name] != (str(hunt_file), get_file_hash(hunt_file)):
+            return None
+    return [
+        _existing_record(row["filename"], row["file_path"], row["hypothesis"],
+                         row["tactic"], row["tags"])
+        for row in (rows[f.name] for f in on_disk)
+    ]
+
+
 def load_existing_hunts() -> list[dict]:
-    """Walk Flames/Embers/Alchemy and return parsed hunt info for every file."""
+    """Return hunt info for every file in Flames/Embers/Alchemy.
+
+    Reads database/hunts.db when it is current; otherwise parses the
+    markdown with the same parser and skip list the index is built with, so
+    both paths return the same records.
+    """
+    from scripts.build_hunt_database import extract_hunt_info as parse_existing
+
+    hunt_files = [
+        hunt_file
+        for directory in HUNT_DIRECTORIES
+        if Path(directory).exists()
+        for hunt_file in sorted(Path(directory).glob("*.md"))
+    ]
+    indexed = _hunts_from_index(hunt_files)
+    if indexed is not None:
+        return indexed
+
     hunts: list[dict] = []
-    for directory in HUNT_DIRECTORIES:
-        dir_path = Path(directory)
-        if not dir_path.exists():
+    for hunt_file in hunt_files:
+        if hunt_file.name in SKIP_FILENAMES:
+            continue
+        try:
+            with warnings.catch_warnings():
+                warnings.simplefilter("ignore", DeprecationWarning)  # legacy tables
+                info = parse_existing(hunt_file)
+        except Exception as exc:
+            print(f"⚠️ Could not parse {hunt_file}: {exc}")
             continue
-        for hunt_file in sorted(dir_path.glob("*.md")):
-            try:
-                info = extract_hunt_info(
-                    hunt_file.read_text(encoding="utf-8"),
-                    hunt_file.name,
-                    str(hunt_file),
-                )
-            except Exception as exc:
-                print(f"⚠️ Could not parse {hunt_file}: {exc}")
-                continue
-            if info:
-                hunts.append(info)
+        hunts.append(_existing_record(hunt_file.name, str(hunt_file), info["hypothesis"],
+                                      info["tactic"], info["tags"]))
     return hunts
 
 
@@ -2,35 +2,17 @@ import os
 import random
 import re
 import time
+from functools import cache
 from pathlib import Path
 
 from dotenv import load_dotenv
-from pypdf import PdfReader
 
-# Add Anthropic (Claude) support
-try:
-    import anthropic
+from hunt_id_ledger import allocate
+from llm_clients import anthropic_client, client_for, openai_client
+from techniques import extract_techniques
 
-    CLAUDE_AVAILABLE = True
-except ImportError:
-    CLAUDE_AVAILABLE = False
-
-# Import MITRE ATT&CK data
-try:
-    from mitre_attack import get_mitre_attack
-
-    MITRE_AVAILABLE = True
-except ImportError:
-    print("⚠️ MITRE ATT&CK data not available. Using fallback tactic matching.")
-    MITRE_AVAILABLE = False
-
-# Import duplicate detection
-try:
-    from duplicate_detection import check_duplicates_for_new_submission
-
-    DUPLICATE_DETECTION_AVAILABLE = True
-except ImportError:
-    DUPLICATE_DETECTION_AVAILABLE = False
+# pypdf, the LLM SDKs, MITRE data and duplicate detection are imported on first
+# use, so importing this module (tests, tooling) stays cheap and needs no key.
 
 load_dotenv()
 
@@ -40,19 +22,16 @@ AI_PROVIDER = os.getenv("AI_PROVIDER", "claude").lower()
 # Claude model configuration - use environment variable or default to latest
 CLAUDE_MODEL = os.getenv("CLAUDE_MODEL", "claude-sonnet-5")
 
-if AI_PROVIDER == "claude":
-    if not CLAUDE_AVAILABLE:
-        raise ImportError(
-            "Anthropic (Claude) client not installed. Please install 'anthropic' Python package."
-        )
-    ANTHROPIC_API_KEY = os.getenv("ANTHROPIC_API_KEY")
-    if not ANTHROPIC_API_KEY:
-        raise ValueError("ANTHROPIC_API_KEY not set in environment.")
-    anthropic_client = anthropic.Anthropic(api_key=ANTHROPIC_API_KEY)
-else:
-    from openai import OpenAI
 
-    client = OpenAI(api_key=os.getenv("OPENAI_API_KEY"))
+@cache
+def _mitre_attack():
+    """The MITRE ATT&CK helper, or None if unavailable (fallback tactic matching)."""
+    try:
+        from mitre_attack import get_mitre_attack
+    except ImportError:
+        print("⚠️ MITRE ATT&CK data not available. Using fallback tactic matching.")
+        return None
+    return get_mitre_attack()
 
 
 # HTTP status codes worth retrying: 429 (rate limit), 5xx, and Anthropic's
@@ -94,18 +73,16 @@ def _call_with_retries(
 
 
 def _anthropic_create_with_retries(**kwargs):
-    return _call_with_retries(lambda: anthropic_client.messages.create(**kwargs))
+    return _call_with_retries(lambda: anthropic_client().messages.create(**kwargs))
 
 
 def _openai_create_with_retries(**kwargs):
-    return _call_with_retries(lambda: client.chat.completions.create(**kwargs))
+    return _call_with_retries(lambda: openai_client().chat.completions.create(**kwargs))
 
 
 CTI_INPUT_DIR = Path(".hearth/intel-drops/")
 OUTPUT_DIR = Path("Flames/")
 PROCESSED_DIR = Path(".hearth/processed-intel-drops/")
-OUTPUT_DIR.mkdir(parents=True, exist_ok=True)
-PROCESSED_DIR.mkdir(parents=True, exist_ok=True)
 
 
 def extract_technique_and_tactic(content: str) -> tuple:
@@ -116,15 +93,13 @@ def extract_technique_and_tactic(content: str) -> tuple:
     Returns:
         tuple: (technique_id, tactic, confidence_score)
     """
-    import re
-
-    # Try to extract technique ID from content
-    technique_pattern = r"T\d{4}(?:\.\d{3})?"
-    techniques_found = re.findall(technique_pattern, content)
+    # Try to extract technique ID from content. The shared extractor also
+    # catches underscore spellings (T1059_001) and returns them dotted.
+    techniques_found = extract_techniques(content)
 
-    if techniques_found and MITRE_AVAILABLE:
+    mitre = _mitre_attack() if techniques_found else None
+    if mitre:
         # Validate using MITRE data
-        mitre = get_mitre_attack()
         for tech_id in techniques_found:
             tech_data = mitre.validate_technique(tech_id)
             if tech_data:
@@ -145,8 +120,8 @@ def extract_technique_and_tactic(content: str) -> tuple:
                 )
                 if potential_tactic and potential_tactic.lower() != "tactic":
                     # Validate tactic name if MITRE available
-                    if MITRE_AVAILABLE:
-                        mitre = get_mitre_attack()
+                    mitre = _mitre_attack()
+                    if mitre:
                         # Normalize tactic name
                         for mitre_tactic in mitre.tactics.keys():
                             if mitre_tactic.lower() == potential_tactic.lower():
@@ -194,16 +169,9 @@ def extract_technique_and_tactic(content: str) -> tuple:
 
 
 def get_next_hunt_id():
-    """Next Flames hunt number: max existing ``HNNN`` + 1."""
-    flames_dir = Path("Flames/")
-    flames_dir.mkdir(exist_ok=True)
-    max_id = 0
-    hunt_pattern = re.compile(r"^H(\d+)$")
-    for f in flames_dir.glob("H*.md"):
-        match = hunt_pattern.match(f.stem)
-        if match:
-            max_id = max(max_id, int(match.group(1)))
-    return max_id + 1
+    """Reserve the next Flames hunt number in the hunt-ID ledger."""
+    Path("Flames/").mkdir(exist_ok=True)
+    return allocate("Flames", owner=f"issue-{os.getenv('ISSUE_NUMBER', '')}")
 
 
 SYSTEM_PROMPT = """You are a threat hunter generating HEARTH markdown files.
@@ -505,6 +473,8 @@ def read_file_content(file_path):
     """Read content from either PDF or text file."""
     if file_path.suffix.lower() == ".pdf":
         try:
+            from pypdf import PdfReader
+
             reader = PdfReader(file_path)
             text = ""
             for page in reader.pages:
@@ -522,6 +492,11 @@ def read_file_content(file_path):
 
 
 if __name__ == "__main__":
+    # Fail fast on a missing SDK or key, before any work is done.
+    client_for(AI_PROVIDER)
+    OUTPUT_DIR.mkdir(parents=True, exist_ok=True)
+    PROCESSED_DIR.mkdir(parents=True, exist_ok=True)
+
     existing_hunt_path = os.getenv("EXISTING_HUNT_FILE")
     is_regeneration = bool(existing_hunt_path)
 
@@ -604,7 +579,11 @@ if __name__ == "__main__":
                     print("EOF", file=f)
 
             # 7. Run duplicate detection
-            if DUPLICATE_DETECTION_AVAILABLE:
+            try:
+                from duplicate_detection import check_duplicates_for_new_submission
+            except ImportError:
+                check_duplicates_for_new_submission = None
+            if check_duplicates_for_new_submission:
                 duplicate_analysis = check_duplicates_for_new_submission(
                     final_content, out_md_path.name
                 )
@@ -1,125 +1,48 @@
 #!/usr/bin/env python3
-"""Generate the HEARTH Contributors Leaderboard (standalone, no external deps)."""
-
+"""Generate the HEARTH Contributors Leaderboard.
+
+Counts come from the ``stats_submitter`` table in ``database/hunts.db``.
+Before reading it, the hunt index is brought up to date incrementally, so an
+unchanged corpus costs one ``stat()`` per hunt and nothing is re-parsed.
+Submitters are parsed by scripts/hunt_parser.py and canonicalized with
+``SUBMITTER_MAP`` (scripts/rebuild_hunts_data.py), the same identity the site
+shows. The CLI skips all of this when public/build-manifest.json shows no
+input changed since the last run (``--force`` overrides).
+"""
+
+import sqlite3
+import sys
 from pathlib import Path
-import re
-from collections import Counter
 
+_REPO_ROOT = str(Path(__file__).resolve().parent.parent)
+if _REPO_ROOT not in sys.path:
+    sys.path.insert(0, _REPO_ROOT)
+
+from scripts.build_hunt_database import (
+    configure_connection,
+    create_database_schema,
+    scan_and_update_hunts,
+)
 
 HUNT_DIRS = ["Flames", "Embers", "Alchemy"]
-SKIP_NAMES = {"hearth-auto-intel"}
-NO_RESPONSE_RE = re.compile(r'^[_*()\s]*no\s+response[_*()\s]*$', re.IGNORECASE)
-
-
-def find_hunt_files():
-    files = []
-    for d in HUNT_DIRS:
-        p = Path(d)
-        if p.is_dir():
-            files.extend(sorted(p.glob("*.md")))
-    return files
-
-
-def normalize_name(raw):
-    """Strip markdown link syntax, leading @, and reject no-response placeholders."""
-    m = re.match(r'\[([^\]]+)\]', raw)
-    name = m.group(1).strip() if m else raw.strip()
-    name = name.lstrip('@')
-    if not name or NO_RESPONSE_RE.match(name):
-        return None
-    return name
-
-
-def submitter_from_frontmatter(lines):
-    """Parse YAML frontmatter (no external deps) and return submitter name."""
-    if not lines or lines[0].strip() != '---':
-        return None
-    in_submitter_block = False
-    for line in lines[1:]:
-        if line.strip() == '---':
-            break
-        if re.match(r'^submitter\s*:', line):
-            # Inline: submitter: Name  (plain string)
-            value = line.split(':', 1)[1].strip().strip('"').strip("'")
-            if value:
-                return normalize_name(value)
-            in_submitter_block = True
-            continue
-        if in_submitter_block:
-            m = re.match(r'^\s+name\s*:\s*(.+)', line)
-            if m:
-                return normalize_name(m.group(1).strip().strip('"').strip("'"))
-            # Stop if we hit another top-level key
-            if re.match(r'^\S', line):
-                break
-    return None
-
-
-def split_table_row(row):
-    """Split a markdown table row on unescaped pipes."""
-    cells, current, i = [], [], 0
-    while i < len(row):
-        if row[i] == '\\' and i + 1 < len(row) and row[i + 1] == '|':
-            current.append('|')
-            i += 2
-        elif row[i] == '|':
-            cells.append(''.join(current).strip())
-            current = []
-            i += 1
-        else:
-            current.append(row[i])
-            i += 1
-    cells.append(''.join(current).strip())
-    return [c for c in cells if c]
-
-
-def submitter_from_table(lines):
-    """Parse the legacy markdown table format and return submitter name."""
-    for i, line in enumerate(lines):
-        if '|' not in line or 'Submitter' not in line:
-            continue
-        columns = split_table_row(line)
-        submitter_index = next(
-            (ci for ci, col in enumerate(columns)
-             if 'Submitter' in re.sub(r'\*\*|\*', '', col)),
-            -1,
-        )
-        if submitter_index < 0:
-            continue
-        is_last_col = submitter_index == len(columns) - 1
-        data_row_index = i + 2
-        if data_row_index >= len(lines):
-            break
-        data_row = lines[data_row_index]
-        if not data_row.strip() or '|' not in data_row:
-            break
-        data_cells = split_table_row(data_row)
-        # If Submitter is the last column, always use the last cell — unescaped
-        # pipes in earlier columns can shift the index but the submitter is last.
-        if is_last_col:
-            return normalize_name(data_cells[-1])
-        if submitter_index >= len(data_cells):
-            break
-        return normalize_name(data_cells[submitter_index])
-    return None
-
-
-def generate_leaderboard():
-    all_hunts = find_hunt_files()
-    contributors = []
-
-    for hunt_file in all_hunts:
-        try:
-            lines = hunt_file.read_text().splitlines()
-            name = submitter_from_frontmatter(lines) or submitter_from_table(lines)
-            if name and name not in SKIP_NAMES:
-                contributors.append(name)
-        except Exception as e:
-            print(f"Could not process {hunt_file}: {e}")
-
-    counts = Counter(contributors)
-    sorted_contribs = sorted(counts.items(), key=lambda x: x[1], reverse=True)
+DEFAULT_DB = Path("database/hunts.db")
+OUTPUT = Path("Keepers/Contributors.md")
+
+# Canonical names that are not people: automated submissions, and submissions
+# with no name given.
+SKIP_NAMES = {"HEARTH Bot", "Anonymous"}
+
 
+def contributor_counts(conn):
+    """``(name, hunts)`` pairs, most hunts first, ties by name ignoring case."""
+    rows = conn.execute(
+        "SELECT submitter, hunts FROM stats_submitter "
+        "ORDER BY hunts DESC, submitter COLLATE NOCASE, submitter"
+    )
+    return [(name, count) for name, count in rows if name not in SKIP_NAMES]
+
+
+def render_leaderboard(counts):
     output_lines = [
         "# \U0001f525 HEARTH Contributors Leaderboard \U0001f525\n",
         "",
@@ -130,14 +53,47 @@ def generate_leaderboard():
         "| Rank | Contributor | Hunts Submitted |",
         "|------|-------------|-----------------|",
     ]
-    for rank, (name, count) in enumerate(sorted_contribs, 1):
+    for rank, (name, count) in enumerate(counts, 1):
         output_lines.append(f"| {rank} | {name} | {count} |")
+    return "\n".join(output_lines) + "\n"
+
+
+def generate_leaderboard(db_path=DEFAULT_DB, hunt_dirs=HUNT_DIRS, out=OUTPUT, parsed=None):
+    """Refresh hunts.db, then write the leaderboard from its submitter counts.
 
-    out = Path("Keepers/Contributors.md")
+    ``parsed`` is passed through to scan_and_update_hunts.
+    """
+    db_path = Path(db_path)
+    db_path.parent.mkdir(parents=True, exist_ok=True)
+    conn = sqlite3.connect(str(db_path))
+    try:
+        configure_connection(conn)
+        create_database_schema(conn)
+        stats = scan_and_update_hunts(conn, hunt_dirs, verbose=False, parsed=parsed)
+        counts = contributor_counts(conn)
+    finally:
+        conn.close()
+
+    if stats["errors"]:
+        print(f"⚠️  {stats['errors']} hunt files could not be parsed and were not counted")
+
+    out = Path(out)
     out.parent.mkdir(exist_ok=True)
-    out.write_text("\n".join(output_lines) + "\n")
-    print(f"✅ Generated Contributors.md ({len(sorted_contribs)} contributors)")
+    out.write_text(render_leaderboard(counts))
+    print(f"✅ Generated Contributors.md ({len(counts)} contributors)")
 
 
-if __name__ == "__main__":
+def main():
+    from scripts.build_manifest import REPO_ROOT, Manifest
+
+    manifest = Manifest(REPO_ROOT)
+    if "--force" not in sys.argv[1:] and manifest.status("leaderboard") is None:
+        print(f"✅ {OUTPUT} is up to date (public/build-manifest.json)")
+        return
     generate_leaderboard()
+    manifest.record("leaderboard")
+    manifest.save()
+
+
+if __name__ == "__main__":
+    main()
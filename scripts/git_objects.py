@@ -0,0 +1,55 @@
+"""
+Read git objects without a checkout.
+
+``GitObjectReader`` keeps one ``git cat-file --batch`` process open and reads
+any number of blobs through it, so looking at N files in another commit costs
+one subprocess rather than N ``git show`` calls.
+"""
+
+from __future__ import annotations
+
+import subprocess
+
+
+class GitObjectReader:
+    """Blob contents by object name (``<sha>``, ``<rev>:<path>``, ...).
+
+    Use as a context manager, or call ``close()``.
+    """
+
+    def __init__(self, cwd=None):
+        self._proc = subprocess.Popen(
+            ["git", "cat-file", "--batch"],
+            stdin=subprocess.PIPE,
+            stdout=subprocess.PIPE,
+            cwd=cwd,
+        )
+
+    def read(self, name: str) -> bytes | None:
+        """The object's raw contents, or None if it does not exist."""
+        self._proc.stdin.write(name.encode() + b"\n")
+        self._proc.stdin.flush()
+        # "<sha> <type> <size>", or "<name> missing" / "<name> ambiguous",
+        # where <name> may itself contain spaces.
+        header = self._proc.stdout.readline().split()
+        if header[-1] in (b"missing", b"ambiguous"):
+            return None
+        data = self._proc.stdout.read(int(header[2]))
+        self._proc.stdout.read(1)  # the newline after every object
+        return data
+
+    def text(self, name: str) -> str:
+        """The object decoded as UTF-8, or ``""`` if it does not exist."""
+        data = self.read(name)
+        return data.decode("utf-8", errors="replace") if data is not None else ""
+
+    def close(self) -> None:
+        self._proc.stdin.close()
+        self._proc.wait()
+        self._proc.stdout.close()
+
+    def __enter__(self) -> GitObjectReader:
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
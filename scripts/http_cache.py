@@ -0,0 +1,192 @@
+"""
+Persistent HTTP cache for the CTI fetch pipeline.
+
+``process_issue.get_cti_content`` used to fetch every source with a fresh
+``requests.get``. A regeneration or re-run downloaded the same article again
+and, for a JS-challenged page, went all the way back to the headless browser.
+``HttpCache`` keeps one keep-alive ``requests.Session`` and an SQLite store
+(``.hearth/http-cache.db``, not committed) keyed by normalized URL, holding the
+body, the response headers, and the text extracted from that body.
+
+A cached URL is revalidated with ``If-None-Match`` / ``If-Modified-Since``. A
+``304`` replays the stored body and keeps its extracted text, as does a ``200``
+whose body is byte-identical to the stored one (servers that send no
+validators). Any other ``200`` replaces the entry and drops the stale text.
+
+    cache = default_cache()
+    response = cache.get(url, headers=headers, timeout=15)
+    response.raise_for_status()
+    text = cache.extracted_text(url)
+    if text is None:
+        text = extract(response)
+        cache.store_extracted_text(url, text)
+"""
+
+from __future__ import annotations
+
+import json
+import re
+import sqlite3
+import sys
+import time
+from functools import cache
+from pathlib import Path
+from urllib.parse import parse_qsl, urlencode, urlsplit, urlunsplit
+
+import requests
+from requests.structures import CaseInsensitiveDict
+from requests.utils import get_encoding_from_headers
+
+_REPO_ROOT = str(Path(__file__).resolve().parent.parent)
+if _REPO_ROOT not in sys.path:
+    sys.path.insert(0, _REPO_ROOT)
+
+DEFAULT_CACHE = Path(_REPO_ROOT) / ".hearth" / "http-cache.db"
+
+# Entries not fetched for this long are dropped when the cache is opened.
+EXPIRE_AFTER = 90 * 24 * 3600
+
+_DEFAULT_PORTS = {"http": 80, "https": 443}
+_TRACKING_PARAM = re.compile(r"utm_\w+|fbclid|gclid|mc_cid|mc_eid", re.IGNORECASE)
+# requests hands back a decoded body, so these no longer describe what is stored.
+_UNSTORED_HEADERS = {"content-encoding", "content-length", "transfer-encoding",
+                     "connection", "keep-alive"}
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS responses (
+    url        TEXT PRIMARY KEY,  -- normalize_url()
+    headers    TEXT NOT NULL,     -- JSON object
+    body       BLOB NOT NULL,
+    extracted  TEXT,              -- text extracted from body; NULL until stored
+    fetched_at REAL NOT NULL
+);
+"""
+
+
+def normalize_url(url: str) -> str:
+    """Cache key for ``url``: case, default port, fragment and tracking params removed."""
+    parts = urlsplit(url.strip())
+    scheme = parts.scheme.lower()
+    host = (parts.hostname or "").lower()
+    if ":" in host:
+        host = f"[{host}]"
+    netloc = host if parts.port in (None, _DEFAULT_PORTS.get(scheme)) else f"{host}:{parts.port}"
+    if parts.username is not None:
+        netloc = f"{parts.netloc.rpartition('@')[0]}@{netloc}"
+    query = urlencode(sorted(
+        (key, value)
+        for key, value in parse_qsl(parts.query, keep_blank_values=True)
+        if not _TRACKING_PARAM.fullmatch(key)
+    ))
+    return urlunsplit((scheme, netloc, parts.path or "/", query, ""))
+
+
+def _storable(headers) -> dict[str, str]:
+    return {k: v for k, v in headers.items() if k.lower() not in _UNSTORED_HEADERS}
+
+
+class HttpCache:
+    """Conditional GETs through one pooled session, cached at ``path``."""
+
+    def __init__(self, path: str | Path = DEFAULT_CACHE):
+        Path(path).parent.mkdir(parents=True, exist_ok=True)
+        self._conn = sqlite3.connect(str(path))
+        self._conn.executescript(_SCHEMA)
+        with self._conn:
+            self._conn.execute(
+                "DELETE FROM responses WHERE fetched_at < ?", (time.time() - EXPIRE_AFTER,)
+            )
+        self.session = requests.Session()
+
+    def close(self) -> None:
+        self.session.close()
+        self._conn.close()
+
+    def __enter__(self) -> HttpCache:
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+    def get(self, url: str, headers: dict | None = None, timeout: float = 15) -> requests.Response:
+        """GET ``url``, revalidating any cached copy.
+
+        The response has a ``from_cache`` attribute: True when the stored body
+        was still current (``304``, or an identical ``200``). Error statuses are
+        returned as-is and never cached; call ``raise_for_status()`` as usual.
+        """
+        key = normalize_url(url)
+        row = self._conn.execute(
+            "SELECT headers, body FROM responses WHERE url = ?", (key,)
+        ).fetchone()
+        request_headers = dict(headers or {})
+        stored = CaseInsensitiveDict(json.loads(row[0])) if row else None
+        if stored is not None:
+            if "etag" in stored:
+                request_headers["If-None-Match"] = stored["etag"]
+            if "last-modified" in stored:
+                request_headers["If-Modified-Since"] = stored["last-modified"]
+
+        response = self.session.get(url, headers=request_headers, timeout=timeout,
+                                    allow_redirects=True)
+        response.from_cache = False
+
+        if response.status_code == 304 and stored is not None:
+            # A 304 may carry updated headers for the stored response.
+            stored.update(_storable(response.headers))
+            self._touch(key, stored)
+            return self._replay(response, stored, row[1])
+        if response.status_code == 200:
+            if row is not None and response.content == row[1]:
+                self._touch(key, CaseInsensitiveDict(_storable(response.headers)))
+                response.from_cache = True
+            else:
+                with self._conn:
+                    self._conn.execute(
+                        "INSERT OR REPLACE INTO responses VALUES (?, ?, ?, NULL, ?)",
+                        (key, json.dumps(_storable(response.headers)),
+                         response.content, time.time()),
+                    )
+        return response
+
+    def extracted_text(self, url: str) -> str | None:
+        """Text stored for the current cached body of ``url``, if any."""
+        row = self._conn.execute(
+            "SELECT extracted FROM responses WHERE url = ?", (normalize_url(url),)
+        ).fetchone()
+        return row[0] if row else None
+
+    def store_extracted_text(self, url: str, text: str) -> None:
+        """Remember ``text`` as extracted from the cached body of ``url``."""
+        with self._conn:
+            self._conn.execute(
+                "UPDATE responses SET extracted = ? WHERE url = ?", (text, normalize_url(url))
+            )
+
+    def _touch(self, key: str, headers: CaseInsensitiveDict) -> None:
+        with self._conn:
+            self._conn.execute(
+                "UPDATE responses SET headers = ?, fetched_at = ? WHERE url = ?",
+                (json.dumps(dict(headers)), time.time(), key),
+            )
+
+    @staticmethod
+    def _replay(not_modified: requests.Response, headers: CaseInsensitiveDict,
+                body: bytes) -> requests.Response:
+        replay = requests.Response()
+        replay._content = body
+        replay.status_code = 200
+        replay.reason = "OK"
+        replay.headers = headers
+        replay.url = not_modified.url
+        replay.request = not_modified.request
+        replay.history = not_modified.history
+        replay.encoding = get_encoding_from_headers(headers)
+        replay.from_cache = True
+        return replay
+
+
+@cache
+def default_cache() -> HttpCache:
+    """The process-wide cache at ``DEFAULT_CACHE``, opened on first use."""
+    return HttpCache()
@@ -0,0 +1,274 @@
+"""
+Hunt-ID ledger: atomic reservation of the next hunt number per category.
+
+Drafting scripts used to pick ``max+1`` by globbing a category directory, and
+two runs that globbed before either wrote got the same ID. The ledger
+(``database/hunt-ids.db``, SQLite, not committed) keeps one row per known
+number with its state:
+
+* ``allocated`` — the hunt is on the reconciled commit (normally main);
+* ``claimed`` — held by a draft, or reserved by a run that has not landed
+  yet. A run's reservation lapses after ``CLAIM_TTL`` unless its file exists;
+* ``released`` — a claim that no longer holds.
+
+The next number is still ``max+1``, taken over allocated numbers, live
+claims, and a caller-supplied floor (``allocate`` passes the hunt files in the
+working tree, committed or not). A number released or lapsed above that
+maximum is handed out again, as the old glob did for a run that failed before
+writing its file; gaps below it stay gaps. ``reserve`` is one ``BEGIN
+IMMEDIATE`` transaction, so two processes on the same ledger can never receive
+the same number. ``sync`` reconciles with a commit in one ``git ls-tree``
+across every category and is skipped when that commit was already synced;
+outside a git checkout ``allocate`` works from the working tree alone.
+
+The ledger is per machine. The reassign workflow (``pr-from-approval.yml``)
+carries it between runs with ``actions/cache``, so its draft-scan cache and
+claims survive; the drafting workflows start from an empty one and rebuild it
+from git. Collisions between runners are still caught by
+``reassign_hunt_id.py`` and the collision checks.
+
+    with HuntIdLedger() as ledger:
+        ledger.sync("origin/main")
+        number = ledger.reserve("H", owner="issue-412")
+"""
+
+from __future__ import annotations
+
+import sqlite3
+import subprocess
+import sys
+import time
+from collections.abc import Iterable, Iterator
+from contextlib import contextmanager
+from pathlib import Path
+
+_REPO_ROOT = str(Path(__file__).resolve().parent.parent)
+if _REPO_ROOT not in sys.path:
+    sys.path.insert(0, _REPO_ROOT)
+
+from scripts.hunt_ids import CATEGORY_PREFIXES, existing_numbers
+
+DEFAULT_LEDGER = Path(_REPO_ROOT) / "database" / "hunt-ids.db"
+
+# How long a run's reservation holds without its hunt file appearing. Drafting
+# runs write the file within minutes; a claim older than this is a failed run.
+CLAIM_TTL = 3600
+
+# Upserts that never downgrade an allocated number. Draft claims do not lapse.
+_UPSERT_CLAIM = (
+    "INSERT INTO ids (prefix, number, state, owner) VALUES (?, ?, 'claimed', ?) "
+    "ON CONFLICT (prefix, number) DO UPDATE SET state = 'claimed', "
+    "owner = excluded.owner, expires_at = NULL WHERE state != 'allocated'"
+)
+_UPSERT_ALLOCATED = (
+    "INSERT INTO ids (prefix, number, state, owner) VALUES (?, ?, 'allocated', '') "
+    "ON CONFLICT (prefix, number) DO UPDATE SET state = 'allocated', owner = '', "
+    "expires_at = NULL"
+)
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS ids (
+    prefix     TEXT NOT NULL,
+    number     INTEGER NOT NULL,
+    state      TEXT NOT NULL CHECK (state IN ('allocated', 'claimed', 'released')),
+    owner      TEXT NOT NULL DEFAULT '',
+    expires_at REAL,  -- when a run's reservation lapses; NULL for draft claims
+    PRIMARY KEY (prefix, number)
+) WITHOUT ROWID;
+CREATE TABLE IF NOT EXISTS synced (
+    rev TEXT PRIMARY KEY,
+    sha TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS draft_additions (
+    tip   TEXT PRIMARY KEY,
+    paths TEXT NOT NULL  -- newline-separated hunt paths the commit adds vs main
+);
+"""
+
+
+def worktree_numbers(category: str, root: str | Path = ".") -> set[int]:
+    """Hunt numbers with a file in ``category`` under ``root``, committed or not."""
+    directory = Path(root) / category
+    return existing_numbers(
+        (p.name for p in directory.glob("*.md")), CATEGORY_PREFIXES[category]
+    )
+
+
+def git_numbers(rev: str, cwd=None) -> dict[str, set[int]]:
+    """Hunt numbers on ``rev`` for every prefix, from one ``git ls-tree``."""
+    out = subprocess.run(
+        ["git", "ls-tree", "-r", "--name-only", rev, "--", *CATEGORY_PREFIXES],
+        check=True, capture_output=True, text=True, cwd=cwd,
+    ).stdout.splitlines()
+    return {
+        prefix: existing_numbers(
+            (p for p in out if p.startswith(f"{category}/") and p.endswith(".md")), prefix
+        )
+        for category, prefix in CATEGORY_PREFIXES.items()
+    }
+
+
+class HuntIdLedger:
+    """The ledger at ``path``; writers wait up to ``timeout`` seconds for the lock."""
+
+    def __init__(self, path: str | Path = DEFAULT_LEDGER, timeout: float = 30.0):
+        Path(path).parent.mkdir(parents=True, exist_ok=True)
+        # Autocommit; every write below opens its own BEGIN IMMEDIATE.
+        self._conn = sqlite3.connect(str(path), timeout=timeout, isolation_level=None)
+        self._conn.execute("PRAGMA journal_mode = WAL")
+        self._conn.executescript(_SCHEMA)
+        columns = {row[1] for row in self._conn.execute("PRAGMA table_info(ids)")}
+        if "expires_at" not in columns:  # a ledger from before claims could lapse
+            self._conn.execute("ALTER TABLE ids ADD COLUMN expires_at REAL")
+
+    def close(self) -> None:
+        self._conn.close()
+
+    def __enter__(self) -> HuntIdLedger:
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+    @contextmanager
+    def _write(self) -> Iterator[sqlite3.Connection]:
+        # IMMEDIATE takes the write lock up front, so the read of ``next`` and
+        # the update that follows cannot interleave with another writer.
+        self._conn.execute("BEGIN IMMEDIATE")
+        try:
+            yield self._conn
+        except BaseException:
+            self._conn.execute("ROLLBACK")
+            raise
+        self._conn.execute("COMMIT")
+
+    def next_number(self, prefix: str, floor: int = 0, now: float | None = None) -> int:
+        """The number ``reserve`` would hand out now: ``max+1`` over allocated
+        numbers, live claims and ``floor``."""
+        now = time.time() if now is None else now
+        (top,) = self._conn.execute(
+            "SELECT max(number) FROM ids WHERE prefix = ? AND (state = 'allocated' "
+            "OR (state = 'claimed' AND (expires_at IS NULL OR expires_at > ?)))",
+            (prefix, now),
+        ).fetchone()
+        return max(top or 0, floor) + 1
+
+    def reserve(self, prefix: str, owner: str = "", floor: int = 0,
+                now: float | None = None) -> int:
+        """Claim the next number for ``prefix`` and return it.
+
+        The claim lapses after ``CLAIM_TTL`` seconds unless the number shows
+        up in git or the working tree (``floor``) by then.
+        """
+        now = time.time() if now is None else now
+        with self._write() as conn:
+            number = self.next_number(prefix, floor, now)
+            conn.execute(
+                "INSERT OR REPLACE INTO ids VALUES (?, ?, 'claimed', ?, ?)",
+                (prefix, number, owner, now + CLAIM_TTL),
+            )
+        return number
+
+    def claim(self, prefix: str, number: int, owner: str = "") -> None:
+        """Record that ``owner`` holds ``number`` (e.g. a draft keeping its ID)."""
+        with self._write() as conn:
+            conn.execute(_UPSERT_CLAIM, (prefix, number, owner))
+
+    def release(self, prefix: str, number: int) -> None:
+        with self._write() as conn:
+            conn.execute(
+                "UPDATE ids SET state = 'released' "
+                "WHERE prefix = ? AND number = ? AND state = 'claimed'",
+                (prefix, number),
+            )
+
+    def state(self, prefix: str, number: int) -> tuple[str, str] | None:
+        """``(state, owner)`` of a number, or None if the ledger never saw it."""
+        return self._conn.execute(
+            "SELECT state, owner FROM ids WHERE prefix = ? AND number = ?", (prefix, number)
+        ).fetchone()
+
+    def reconcile(
+        self,
+        prefix: str,
+        allocated: Iterable[int],
+        claims: dict[int, str] | None = None,
+    ) -> None:
+        """Bring ``prefix`` in line with git in one transaction.
+
+        ``allocated`` are the numbers on the reconciled commit. ``claims`` maps
+        each number held by a draft to its owner; when given, it is the whole
+        truth about draft claims, and any other claim is released.
+        """
+        allocated = set(allocated)
+        with self._write() as conn:
+            conn.executemany(_UPSERT_ALLOCATED, ((prefix, n) for n in allocated))
+            if claims is not None:
+                conn.execute(
+                    "UPDATE ids SET state = 'released' WHERE prefix = ? AND state = 'claimed'",
+                    (prefix,),
+                )
+                conn.executemany(
+                    _UPSERT_CLAIM, ((prefix, n, owner) for n, owner in claims.items())
+                )
+
+    def draft_additions(self, tips: Iterable[str]) -> dict[str, list[str]]:
+        """Cached hunt paths added by each draft tip; unknown tips are absent."""
+        cached: dict[str, list[str]] = {}
+        for tip in tips:
+            row = self._conn.execute(
+                "SELECT paths FROM draft_additions WHERE tip = ?", (tip,)
+            ).fetchone()
+            if row:
+                cached[tip] = row[0].split("\n") if row[0] else []
+        return cached
+
+    def record_draft_additions(self, additions: dict[str, list[str]],
+                               current: Iterable[str] | None = None) -> None:
+        """Cache ``additions``; with ``current``, drop every other tip first
+        (drafts that moved on or closed), so a carried ledger stays small."""
+        with self._write() as conn:
+            if current is not None:
+                conn.execute("CREATE TEMP TABLE IF NOT EXISTS current_tips (tip TEXT PRIMARY KEY)")
+                conn.execute("DELETE FROM current_tips")
+                conn.executemany("INSERT OR IGNORE INTO current_tips VALUES (?)",
+                                 ((tip,) for tip in current))
+                conn.execute(
+                    "DELETE FROM draft_additions WHERE tip NOT IN (SELECT tip FROM current_tips)"
+                )
+            conn.executemany(
+                "INSERT OR REPLACE INTO draft_additions VALUES (?, ?)",
+                ((tip, "\n".join(paths)) for tip, paths in additions.items()),
+            )
+
+    def sync(self, rev: str = "HEAD", cwd=None) -> bool:
+        """Reconcile every category with ``rev``; False if it was already synced."""
+        sha = subprocess.run(
+            ["git", "rev-parse", "--verify", f"{rev}^{{commit}}"],
+            check=True, capture_output=True, text=True, cwd=cwd,
+        ).stdout.strip()
+        row = self._conn.execute("SELECT sha FROM synced WHERE rev = ?", (rev,)).fetchone()
+        if row and row[0] == sha:
+            return False
+        for prefix, numbers in git_numbers(sha, cwd).items():
+            self.reconcile(prefix, numbers)
+        with self._write() as conn:
+            conn.execute("INSERT OR REPLACE INTO synced VALUES (?, ?)", (rev, sha))
+        return True
+
+
+def allocate(category: str, owner: str = "", rev: str = "HEAD",
+             path: str | Path = DEFAULT_LEDGER, root: str | Path = ".") -> int:
+    """Reserve the next number for ``category``.
+
+    Syncs with ``rev`` when ``root`` is a git checkout, and never hands out a
+    number at or below a hunt file already in the working tree, so
+    uncommitted drafts count as the old directory glob counted them.
+    """
+    with HuntIdLedger(path) as ledger:
+        try:
+            ledger.sync(rev, cwd=root)
+        except (OSError, subprocess.CalledProcessError):
+            print(f"⚠️  Could not read {rev} from git; numbering from the working tree")
+        floor = max(worktree_numbers(category, root), default=0)
+        return ledger.reserve(CATEGORY_PREFIXES[category], owner, floor=floor)
@@ -0,0 +1,184 @@
+"""
+Read-only query API over ``database/hunts.db``.
+
+``scripts/build_hunt_database.py`` owns the schema and is the only writer;
+this module is how everything else reads it. Lookups go through a fixed set of
+parameterized queries (sqlite3 caches the prepared statements per connection)
+and a small pool of read-only connections that any thread may borrow::
+
+    with HuntIndex() as index:
+        index.get("H042")
+        index.by_technique("T1059.*")
+        index.stats()["tactics"]
+
+Connections are opened ``mode=ro``. By default they are also ``immutable``:
+SQLite skips locking and change detection entirely. That is right for a
+checked-out hunts.db nobody is writing. Pass ``immutable=False`` to read a
+database that a builder may update concurrently.
+"""
+
+from __future__ import annotations
+
+import queue
+import sqlite3
+import threading
+from collections.abc import Iterator
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Any
+
+REPO_ROOT = Path(__file__).resolve().parent.parent
+DEFAULT_DB = REPO_ROOT / "database" / "hunts.db"
+
+_SELECT = """
+    SELECT h.hunt_id, h.filename, h.file_path, h.hypothesis, h.tactic,
+           h.submitter, h.created_date, h.last_modified,
+           (SELECT group_concat(technique, ' ') FROM hunt_techniques
+             WHERE hunt_rowid = h.id) AS techniques,
+           (SELECT group_concat(tag, ' ') FROM hunt_tags
+             WHERE hunt_rowid = h.id) AS tags
+    FROM hunts h
+"""
+
+_QUERIES = {
+    "all": _SELECT + " ORDER BY h.hunt_id",
+    "get": _SELECT + " WHERE h.hunt_id = ?",
+    "technique": _SELECT + """
+        WHERE h.id IN (SELECT hunt_rowid FROM hunt_techniques WHERE technique = ?)
+        ORDER BY h.hunt_id""",
+    "technique_family": _SELECT + """
+        WHERE h.id IN (SELECT hunt_rowid FROM hunt_techniques WHERE parent_technique = ?)
+        ORDER BY h.hunt_id""",
+    "tactic": _SELECT + """
+        WHERE h.id IN (SELECT hunt_rowid FROM hunt_tactics WHERE tactic = ?)
+        ORDER BY h.hunt_id""",
+    "tag": _SELECT + """
+        WHERE h.id IN (SELECT hunt_rowid FROM hunt_tags WHERE tag = ?)
+        ORDER BY h.hunt_id""",
+    "submitter": _SELECT + " WHERE h.submitter = ? ORDER BY h.hunt_id",
+    "created_between": _SELECT + """
+        WHERE h.created_date >= ? AND h.created_date < ?
+        ORDER BY h.created_date, h.hunt_id""",
+}
+
+
+def _hunt(row: sqlite3.Row) -> dict[str, Any]:
+    hunt = dict(row)
+    hunt["techniques"] = (row["techniques"] or "").split()
+    hunt["tags"] = (row["tags"] or "").split()
+    hunt["tactics"] = [t.strip() for t in (row["tactic"] or "").split(",") if t.strip()]
+    return hunt
+
+
+class HuntIndex:
+    """Thread-safe, read-only access to hunts.db.
+
+    Every lookup returns hunt dicts with ``hunt_id``, ``filename``,
+    ``file_path``, ``hypothesis``, ``tactic`` (the joined string),
+    ``tactics``, ``techniques``, ``tags`` (without ``#``), ``submitter``,
+    ``created_date`` and ``last_modified``.
+
+    Raises FileNotFoundError when the database does not exist; opening one
+    never creates it.
+    """
+
+    def __init__(self, db_path: Path | str = DEFAULT_DB, pool_size: int = 4,
+                 immutable: bool = True):
+        path = Path(db_path).resolve()
+        if not path.is_file():
+            raise FileNotFoundError(f"{path} not found; run scripts/build_hunt_database.py")
+        self.path = path
+        self._uri = path.as_uri() + "?mode=ro" + ("&immutable=1" if immutable else "")
+        self._pool_size = pool_size
+        self._idle: queue.LifoQueue[sqlite3.Connection] = queue.LifoQueue()
+        self._opened: list[sqlite3.Connection] = []
+        self._lock = threading.Lock()
+
+    def __enter__(self) -> HuntIndex:
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.close()
+
+    def close(self) -> None:
+        """Close every pooled connection. The index must not be used afterwards."""
+        with self._lock:
+            for conn in self._opened:
+                conn.close()
+            self._opened.clear()
+
+    @contextmanager
+    def connection(self) -> Iterator[sqlite3.Connection]:
+        """Borrow a pooled connection; blocks while all ``pool_size`` are in use."""
+        try:
+            conn = self._idle.get_nowait()
+        except queue.Empty:
+            with self._lock:
+                conn = self._open() if len(self._opened) < self._pool_size else None
+            if conn is None:
+                conn = self._idle.get()
+        try:
+            yield conn
+        finally:
+            self._idle.put(conn)
+
+    def _open(self) -> sqlite3.Connection:
+        # Callers hold self._lock. A pooled connection is only ever used by one
+        # thread at a time, so handing it between threads is safe.
+        conn = sqlite3.connect(self._uri, uri=True, check_same_thread=False)
+        conn.row_factory = sqlite3.Row
+        self._opened.append(conn)
+        return conn
+
+    def _fetch(self, name: str, *params: Any) -> list[dict[str, Any]]:
+        with self.connection() as conn:
+            return [_hunt(row) for row in conn.execute(_QUERIES[name], params)]
+
+    def all(self) -> list[dict[str, Any]]:
+        return self._fetch("all")
+
+    def get(self, hunt_id: str) -> dict[str, Any] | None:
+        found = self._fetch("get", hunt_id)
+        return found[0] if found else None
+
+    def by_technique(self, technique: str) -> list[dict[str, Any]]:
+        """Exact match, or the whole family for ``T1059.*``."""
+        if technique.endswith(".*"):
+            return self._fetch("technique_family", technique[:-2])
+        return self._fetch("technique", technique)
+
+    def by_tactic(self, tactic: str) -> list[dict[str, Any]]:
+        return self._fetch("tactic", tactic)
+
+    def by_tag(self, tag: str) -> list[dict[str, Any]]:
+        return self._fetch("tag", tag.lstrip("#"))
+
+    def by_submitter(self, submitter: str) -> list[dict[str, Any]]:
+        return self._fetch("submitter", submitter)
+
+    def created_between(self, start: str, end: str) -> list[dict[str, Any]]:
+        """Hunts first committed in ``[start, end)``; ISO dates or timestamps."""
+        return self._fetch("created_between", start, end)
+
+    def stats(self) -> dict[str, Any]:
+        """Corpus totals and hunt counts per tactic, technique, submitter,
+        category and creation month (``YYYY-MM``), largest first.
+
+        Reads the stats_* tables the builder maintains; nothing is aggregated
+        at read time.
+        """
+        with self.connection() as conn:
+            def counts(table: str, key: str) -> dict[str, int]:
+                return dict(conn.execute(
+                    f"SELECT {key}, hunts FROM {table} ORDER BY hunts DESC, {key}"
+                ).fetchall())
+
+            categories = counts("stats_category", "category")
+            return {
+                "total": sum(categories.values()),
+                "tactics": counts("stats_tactic", "tactic"),
+                "techniques": counts("stats_technique", "technique"),
+                "submitters": counts("stats_submitter", "submitter"),
+                "categories": categories,
+                "months": counts("stats_month", "month"),
+            }
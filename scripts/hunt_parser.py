@@ -8,10 +8,10 @@ format during the transition period — emits a DeprecationWarning when it does.
 
 from __future__ import annotations
 
-import datetime as _dt
 import re
 import sys as _sys
 import warnings
+from collections.abc import Iterable
 from pathlib import Path
 from typing import Any
 
@@ -19,31 +19,22 @@ _REPO_ROOT = str(Path(__file__).resolve().parent.parent)
 if _REPO_ROOT not in _sys.path:
     _sys.path.insert(0, _REPO_ROOT)
 
-import frontmatter
-
+from scripts import hunt_yaml
 from scripts.hunt_schema import validate_hunt
+from scripts.techniques import TECHNIQUE_RE as _TECHNIQUE_RE
+from scripts.techniques import extract_techniques
 
 
 class HuntValidationError(ValueError):
     """Raised when a hunt file fails schema validation."""
 
 
-_TECHNIQUE_RE = re.compile(r"T(\d{4})(?:[._/](\d{3}))?")
 _TAG_RE = re.compile(r"#([\w\-\.]+)")
 _SUBMITTER_LINK_RE = re.compile(r"\[([^\]]+)\]\(([^)]+)\)")
 
 
 def _normalize_techniques(text: str) -> list[str]:
-    seen: set[str] = set()
-    out: list[str] = []
-    for match in _TECHNIQUE_RE.finditer(text):
-        tid = f"T{match.group(1)}"
-        if match.group(2):
-            tid = f"{tid}.{match.group(2)}"
-        if tid not in seen:
-            seen.add(tid)
-            out.append(tid)
-    return out
+    return extract_techniques(text)
 
 
 def _normalize_tags(text: str) -> list[str]:
@@ -76,7 +67,11 @@ def _split_tactics(raw: str) -> list[str]:
     return parts or [raw.strip()]
 
 
-def _split_table_row(row: str) -> list[str]:
+# The only characters that can end a cell or change how a pipe is read.
+_TABLE_ROW_TOKEN = re.compile(r"\\\||[`|]")
+
+
+def split_table_row(row: str) -> list[str]:
     """Split a markdown table row on unescaped pipes outside code spans.
 
     Two things are treated as literal pipes rather than delimiters:
@@ -90,32 +85,37 @@ def _split_table_row(row: str) -> list[str]:
     Code-span protection is skipped when the row has an odd number of backticks,
     since an unbalanced span would otherwise swallow the rest of the row.
 
-    Unlike the leaderboard helper, this one PRESERVES empty cells so positional
-    alignment is maintained (we drop only the leading/trailing bookend cells).
+    Empty cells are PRESERVED so positional alignment is maintained; only the
+    leading/trailing bookend cells are dropped.
     """
     # Only honour code spans when they are balanced across the row.
     protect_code = row.count("`") % 2 == 0
-
-    cells: list[str] = []
-    current: list[str] = []
-    in_code = False
-    i = 0
-    while i < len(row):
-        if row[i] == "\\" and i + 1 < len(row) and row[i + 1] == "|":
-            current.append("|")
-            i += 2
-        elif row[i] == "`" and protect_code:
-            in_code = not in_code
-            current.append("`")
-            i += 1
-        elif row[i] == "|" and not in_code:
-            cells.append("".join(current).strip())
-            current = []
-            i += 1
-        else:
-            current.append(row[i])
-            i += 1
-    cells.append("".join(current).strip())
+    if "\\|" not in row and not (protect_code and "`" in row):
+        cells = [c.strip() for c in row.split("|")]
+    else:
+        # Visit only the tokens and slice the text between them.
+        cells = []
+        parts: list[str] = []
+        start = 0
+        in_code = False
+        for m in _TABLE_ROW_TOKEN.finditer(row):
+            token = m.group()
+            if token == "|":
+                if in_code:
+                    continue
+                parts.append(row[start:m.start()])
+                cells.append("".join(parts).strip())
+                parts = []
+            elif token == "`":
+                if protect_code:
+                    in_code = not in_code
+                continue
+            else:
+                parts.append(row[start:m.start()])
+                parts.append("|")
+            start = m.end()
+        parts.append(row[start:])
+        cells.append("".join(parts).strip())
     # Drop leading/trailing bookends from "| a | b | c |"
     if cells and cells[0] == "":
         cells = cells[1:]
@@ -124,10 +124,48 @@ def _split_table_row(row: str) -> list[str]:
     return cells
 
 
-def _extract_section(body: str, header: str) -> str:
-    pattern = rf"^## {header}\s*\n(.*?)(?=^## |\Z)"
-    match = re.search(pattern, body, re.MULTILINE | re.DOTALL)
-    return match.group(1).strip() if match else ""
+def _heading_lines(lines: list[str]):
+    """Yield ``(index, heading)`` for each ``## `` line outside fenced code."""
+    fence = ""
+    for index, line in enumerate(lines):
+        stripped = line.lstrip(" ")
+        # Fences per CommonMark: at most 3 spaces of indent; a closing fence
+        # is the opening character alone, so ``` text ``` closes nothing.
+        if len(line) - len(stripped) <= 3 and stripped[:3] in ("```", "~~~"):
+            if not fence:
+                fence = stripped[:3]
+            elif not stripped.rstrip().strip(fence[0]):
+                fence = ""
+        elif not fence and line.startswith("## "):
+            yield index, line[3:].rstrip()
+
+
+def split_sections(body: str) -> dict[str, str]:
+    """Split a markdown body into its ``## `` sections in one pass.
+
+    Returns ``{heading: text}`` in document order, with text stripped; text
+    before the first heading is not included (see split_preamble). A section
+    runs to the next ``## `` line, so ``###`` subsections stay inside it, and
+    lines inside fenced code blocks are never headings. If a heading repeats,
+    the first one wins.
+    """
+    lines = body.split("\n")
+    headings = list(_heading_lines(lines))
+    sections: dict[str, str] = {}
+    for (start, heading), (end, _) in zip(headings, [*headings[1:], (len(lines), None)]):
+        sections.setdefault(heading, "\n".join(lines[start + 1:end]).strip())
+    return sections
+
+
+def split_preamble(body: str) -> tuple[str, str]:
+    """Split ``body`` at its first ``## `` heading, found as split_sections
+    finds it: ``(text before it, the heading onwards)``, verbatim. With no
+    heading, ``(body, "")``."""
+    lines = body.split("\n")
+    first = next(_heading_lines(lines), None)
+    if first is None:
+        return body, ""
+    return "\n".join(lines[:first[0]]), "\n".join(lines[first[0]:])
 
 
 def _parse_legacy_table(content: str, hunt_id: str, category: str) -> dict[str, Any]:
@@ -139,7 +177,7 @@ def _parse_legacy_table(content: str, hunt_id: str, category: str) -> dict[str,
             break
     cells: list[str] = ["", "", "", "", "", ""]
     if table_start is not None and table_start + 2 < len(lines):
-        raw = _split_table_row(lines[table_start + 2])
+        raw = split_table_row(lines[table_start + 2])
         # A legacy row is exactly 6 cells. More means an unescaped delimiter
         # split one of them; truncating to raw[:6] would silently shift every
         # later field (#384 put Notes text into submitter.name on 12 hunts).
@@ -182,30 +220,65 @@ def _parse_legacy_table(content: str, hunt_id: str, category: str) -> dict[str,
     }
 
 
+_FENCE_RE = re.compile(r"-{3,}")
+
+
+def frontmatter_header(lines: Iterable[str]) -> dict[str, Any]:
+    """Frontmatter metadata from a hunt's lines, reading no further than the
+    closing ``---``.
+
+    Agrees with ``frontmatter.loads(text).metadata``: ``{}`` when the text has
+    no frontmatter or the header is never closed. Malformed YAML raises
+    ``yaml.YAMLError``.
+    """
+    lines = iter(lines)
+    for line in lines:
+        if line.strip():
+            break
+    else:
+        return {}
+    if not _FENCE_RE.fullmatch(line.strip()):
+        return {}
+    header: list[str] = []
+    for line in lines:
+        if line.startswith("---") and _FENCE_RE.fullmatch(line.rstrip()):
+            metadata = hunt_yaml.load("".join(header))
+            return metadata if isinstance(metadata, dict) else {}
+        header.append(line)
+    return {}
+
+
+def read_frontmatter(path: str | Path) -> dict[str, Any]:
+    """Frontmatter metadata of a hunt file, without reading its body."""
+    with open(path, encoding="utf-8") as fh:
+        return frontmatter_header(fh)
+
+
+def frontmatter_data(metadata: dict, category: str) -> dict[str, Any]:
+    """Frontmatter metadata as the dict the schema validates."""
+    data = hunt_yaml.iso_dates(metadata)
+    data.setdefault("category", category)
+    return data
+
+
 def parse_hunt_file(path: str | Path, category: str) -> dict[str, Any]:
     """Parse a hunt markdown file into a structured dict.
 
-    Returns a dict containing all schema fields plus `why`, `references`,
+    Returns a dict containing all schema fields plus `sections` (every
+    ``## `` section of the body, see split_sections), `why`, `references`,
     and `file_path` for downstream consumers.
     """
     path = Path(path)
     raw = path.read_text(encoding="utf-8")
-    post = frontmatter.loads(raw)
-
-    if post.metadata:
-        data = dict(post.metadata)
-        # Coerce date/datetime metadata to ISO strings for schema validation
-        # (PyYAML auto-parses ISO dates into datetime.date objects).
-        for k, v in list(data.items()):
-            if isinstance(v, (_dt.date, _dt.datetime)):
-                data[k] = v.isoformat()
-        data.setdefault("category", category)
+    metadata, body = hunt_yaml.split(raw)
+
+    if metadata:
+        data = frontmatter_data(metadata, category)
         errors = validate_hunt(data)
         if errors:
             raise HuntValidationError(
                 f"{path.name}: invalid frontmatter:\n  - " + "\n  - ".join(errors)
             )
-        body = post.content
     else:
         warnings.warn(
             f"{path.name} uses legacy table format; run "
@@ -218,7 +291,9 @@ def parse_hunt_file(path: str | Path, category: str) -> dict[str, Any]:
 
     # Title is canonical only when authored explicitly in frontmatter.
     # Consumers are responsible for fallback display logic.
-    data["why"] = _extract_section(body, "Why")
-    data["references"] = _extract_section(body, "References")
+    sections = split_sections(body)
+    data["sections"] = sections
+    data["why"] = sections.get("Why", "")
+    data["references"] = sections.get("References", "")
     data["file_path"] = f"{category}/{path.name}"
     return data
@@ -7,7 +7,9 @@ must carry. Used by the parser at runtime and by the validator in CI.
 
 from __future__ import annotations
 
-from jsonschema import Draft202012Validator, FormatChecker
+import datetime as _dt
+import re
+from functools import cache
 
 CATEGORIES = ("Flames", "Embers", "Alchemy")
 SEVERITIES = ("critical", "high", "medium", "low", "informational")
@@ -91,13 +93,137 @@ HUNT_SCHEMA: dict = {
     },
 }
 
-_VALIDATOR = Draft202012Validator(HUNT_SCHEMA, format_checker=FormatChecker())
+@cache
+def _validator():
+    # jsonschema is ~150 ms to import; callers that never validate (the
+    # collision check, table helpers) should not pay for it.
+    from jsonschema import Draft202012Validator, FormatChecker
+
+    return Draft202012Validator(HUNT_SCHEMA, format_checker=FormatChecker())
+
+
+# --- fast path -----------------------------------------------------------------
+#
+# Nearly every hunt is valid, and for those all validate_hunt needs is a yes.
+# _compile_check turns a schema into straight-line Python that answers exactly
+# that, and jsonschema runs only to explain a failure. Each keyword is emitted
+# with the same type guard jsonschema applies (minLength only constrains
+# strings, and so on), and patterns use re.search as jsonschema does. A keyword
+# the compiler does not know raises _Unsupported, and validate_hunt then uses
+# jsonschema for everything. test_hunt_schema fuzzes both tiers for agreement.
+
+_TYPES = {"object": "dict", "array": "list", "string": "str"}
+_IGNORED = {"$schema", "title", "description"}
+_RE_DATE = re.compile(r"^\d{4}-\d{2}-\d{2}$")
+
+
+class _Unsupported(Exception):
+    pass
+
+
+def _is_date(value: str) -> bool:
+    """jsonschema's ``date`` format check."""
+    try:
+        return bool(_RE_DATE.fullmatch(value) and _dt.date.fromisoformat(value))
+    except ValueError:
+        return False
+
+
+def _emit(schema: dict, var: str, out: list, consts: dict, indent: int) -> None:
+    pad = "    " * indent
+
+    def line(code):
+        out.append(pad + code)
+
+    def const(value):
+        name = f"_c{len(consts)}"
+        consts[name] = value
+        return name
+
+    for key, value in schema.items():
+        if key in _IGNORED or key == "properties":
+            continue
+        if key == "type":
+            if value not in _TYPES:
+                raise _Unsupported(f"type {value!r}")
+            line(f"if not isinstance({var}, {_TYPES[value]}): return False")
+        elif key == "enum":
+            if not all(isinstance(v, str) for v in value):
+                raise _Unsupported("non-string enum")
+            line(f"if {var} not in {const(tuple(value))}: return False")
+        elif key == "pattern":
+            line(f"if isinstance({var}, str) and not {const(re.compile(value))}.search({var}): "
+                 "return False")
+        elif key == "format":
+            if value != "date":
+                raise _Unsupported(f"format {value!r}")
+            line(f"if isinstance({var}, str) and not _is_date({var}): return False")
+        elif key == "minLength":
+            line(f"if isinstance({var}, str) and len({var}) < {int(value)}: return False")
+        elif key == "minItems":
+            line(f"if isinstance({var}, list) and len({var}) < {int(value)}: return False")
+        elif key == "required":
+            for name in value:
+                line(f"if isinstance({var}, dict) and {name!r} not in {var}: return False")
+        elif key == "additionalProperties":
+            if value is not False:
+                raise _Unsupported("additionalProperties other than false")
+            allowed = const(frozenset(schema.get("properties", {})))
+            line(f"if isinstance({var}, dict) and not {var}.keys() <= {allowed}: return False")
+        elif key == "items":
+            item = f"v{indent + 1}"
+            line(f"if isinstance({var}, list):")
+            line(f"    for {item} in {var}:")
+            _emit(value, item, out, consts, indent + 2)
+        else:
+            raise _Unsupported(key)
+
+    properties = schema.get("properties", {})
+    if properties:
+        line(f"if isinstance({var}, dict):")
+        for name, subschema in properties.items():
+            child = f"v{indent + 1}"
+            line(f"    if {name!r} in {var}:")
+            line(f"        {child} = {var}[{name!r}]")
+            _emit(subschema, child, out, consts, indent + 2)
+
+
+def _compile_check(schema: dict):
+    """Compile ``schema`` into ``check(instance) -> bool``; raises _Unsupported."""
+    consts: dict = {}
+    body: list = []
+    _emit(schema, "v1", body, consts, 1)
+    source = "def check(v1):\n" + "\n".join(body) + "\n    return True\n"
+    namespace = {"_is_date": _is_date, **consts}
+    exec(compile(source, "<hunt_schema check>", "exec"), namespace)
+    check = namespace["check"]
+    check.source = source
+    return check
+
+
+@cache
+def _fast_check():
+    try:
+        return _compile_check(HUNT_SCHEMA)
+    except _Unsupported:
+        return None
+
+
+def schema_errors(data: dict) -> list[tuple[str, str]]:
+    """``(field path, message)`` for every schema violation, sorted by path.
+
+    The path is dotted (``submitter.name``, ``tags.0``), or ``<root>`` for
+    errors about the document itself, such as a missing required field.
+    """
+    check = _fast_check()
+    if check is not None and check(data):
+        return []
+    return [
+        (".".join(str(p) for p in err.path) or "<root>", err.message)
+        for err in sorted(_validator().iter_errors(data), key=lambda e: list(e.path))
+    ]
 
 
 def validate_hunt(data: dict) -> list[str]:
     """Return a list of human-readable validation errors (empty if valid)."""
-    errors = []
-    for err in sorted(_VALIDATOR.iter_errors(data), key=lambda e: list(e.path)):
-        path = ".".join(str(p) for p in err.path) or "<root>"
-        errors.append(f"{path}: {err.message}")
-    return errors
+    return [f"{path}: {message}" for path, message in schema_errors(data)]
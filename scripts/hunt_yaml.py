@@ -0,0 +1,69 @@
+"""
+YAML for hunt frontmatter: one loader, one dumper, one date rule.
+
+Loads and dumps with libyaml's CSafeLoader/CSafeDumper when PyYAML was built
+with it, and the pure-Python safe classes otherwise. ``split`` and ``join``
+read and write a hunt file with the same results as python-frontmatter's
+``loads`` and ``dumps``, so output stays byte-identical whichever is used.
+"""
+
+from __future__ import annotations
+
+import datetime as _dt
+import re
+from typing import Any
+
+import yaml
+
+try:
+    from yaml import CSafeDumper as Dumper
+    from yaml import CSafeLoader as Loader
+except ImportError:  # PyYAML built without libyaml
+    from yaml import SafeDumper as Dumper
+    from yaml import SafeLoader as Loader
+
+# python-frontmatter's fence: three or more dashes on a line of their own.
+_FENCE_RE = re.compile(r"^-{3,}\s*$", re.MULTILINE)
+
+
+def load(text: str) -> Any:
+    return yaml.load(text, Loader=Loader)
+
+
+def dump(data: Any) -> str:
+    return yaml.dump(data, Dumper=Dumper, default_flow_style=False, allow_unicode=True).strip()
+
+
+def iso_dates(metadata: dict) -> dict[str, Any]:
+    """A copy of ``metadata`` with top-level dates and datetimes as ISO strings.
+
+    YAML parses unquoted ISO dates into ``datetime.date``; the schema and every
+    JSON consumer expect strings.
+    """
+    return {
+        k: v.isoformat() if isinstance(v, (_dt.date, _dt.datetime)) else v
+        for k, v in metadata.items()
+    }
+
+
+def split(text: str) -> tuple[dict[str, Any], str]:
+    """``(metadata, body)`` of a hunt file, as ``frontmatter.loads`` gives them.
+
+    ``metadata`` is ``{}`` when there is no closed frontmatter block or it is
+    not a mapping; the body is then the whole text. Malformed YAML raises
+    ``yaml.YAMLError``.
+    """
+    text = text.strip()
+    if not _FENCE_RE.match(text):
+        return {}, text
+    try:
+        _, header, body = _FENCE_RE.split(text, 2)
+    except ValueError:
+        return {}, text
+    metadata = load(header)
+    return (metadata if isinstance(metadata, dict) else {}), body.strip()
+
+
+def join(metadata: dict, body: str) -> str:
+    """A hunt file from its metadata and body, as ``frontmatter.dumps`` writes it."""
+    return f"---\n{dump(metadata)}\n---\n\n{body}".strip()
@@ -0,0 +1,168 @@
+"""
+Inverted index over hunts-data.json.
+
+Every filter the site and the Python tooling apply — by tag, technique, tactic,
+category, severity or submitter — used to be a scan over every hunt's arrays.
+This module precomputes postings lists instead: for each facet value, the
+sorted offsets of the hunts carrying it in the hunts-data.json array. A filter
+then becomes an intersection of a few short integer lists.
+
+Postings are stored delta-encoded by default (first offset, then gaps), which
+keeps the JSON small because most gaps are one or two digits.
+
+Artifact shape (``public/hunts-index.json``)::
+
+    {
+      "version": 1,
+      "encoding": "delta",
+      "ids": ["B001", "B002", ...],          # offset -> hunt ID
+      "postings": {
+        "tag": {"persistence": [3, 1, 7, ...], ...},
+        "technique": {...}, "parent_technique": {...}, "tactic": {...},
+        "category": {...}, "severity": {...}, "submitter": {...}
+      }
+    }
+"""
+
+from __future__ import annotations
+
+import json
+from collections.abc import Iterable
+from itertools import accumulate
+from pathlib import Path
+from typing import Any
+
+from scripts.techniques import parent_technique
+
+INDEX_VERSION = 1
+FACETS = (
+    "tag",
+    "technique",
+    "parent_technique",
+    "tactic",
+    "category",
+    "severity",
+    "submitter",
+)
+
+REPO_ROOT = Path(__file__).resolve().parent.parent
+DEFAULT_INDEX = REPO_ROOT / "public" / "hunts-index.json"
+
+
+def encode_postings(offsets: list[int]) -> list[int]:
+    """Delta-encode a sorted offset list: ``[3, 4, 9]`` → ``[3, 1, 5]``."""
+    return [b - a for a, b in zip([0] + offsets, offsets)]
+
+
+def decode_postings(deltas: list[int]) -> list[int]:
+    """Inverse of :func:`encode_postings`."""
+    return list(accumulate(deltas))
+
+
+def facet_values(hunt: dict[str, Any]) -> dict[str, list[str]]:
+    """The indexed values of one hunts-data.json entry, per facet."""
+    techniques = hunt.get("techniques") or []
+    tactics = [t.strip() for t in (hunt.get("tactic") or "").split(",") if t.strip()]
+    submitter = (hunt.get("submitter") or {}).get("name", "")
+    return {
+        "tag": list(hunt.get("tags") or []),
+        "technique": list(techniques),
+        "parent_technique": list(dict.fromkeys(parent_technique(t) for t in techniques)),
+        "tactic": tactics,
+        "category": [hunt["category"]] if hunt.get("category") else [],
+        "severity": [hunt["severity"]] if hunt.get("severity") else [],
+        "submitter": [submitter] if submitter else [],
+    }
+
+
+def build_inverted_index(hunts: list[dict[str, Any]], delta: bool = True) -> dict[str, Any]:
+    """Build the index for ``hunts`` in their given order."""
+    postings: dict[str, dict[str, list[int]]] = {facet: {} for facet in FACETS}
+    for offset, hunt in enumerate(hunts):
+        for facet, values in facet_values(hunt).items():
+            for value in dict.fromkeys(values):
+                postings[facet].setdefault(value, []).append(offset)
+
+    encode = encode_postings if delta else list
+    return {
+        "version": INDEX_VERSION,
+        "encoding": "delta" if delta else "plain",
+        "ids": [hunt.get("id", "") for hunt in hunts],
+        "postings": {
+            facet: {value: encode(offs) for value, offs in sorted(values.items())}
+            for facet, values in postings.items()
+        },
+    }
+
+
+def write_inverted_index(
+    hunts: list[dict[str, Any]], path: Path = DEFAULT_INDEX
+) -> dict[str, Any]:
+    """Build and write the index as compact JSON; returns the written dict."""
+    index = build_inverted_index(hunts)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(
+        json.dumps(index, separators=(",", ":"), ensure_ascii=False) + "\n",
+        encoding="utf-8",
+    )
+    return index
+
+
+class InvertedIndex:
+    """Query helper over a loaded hunts-index.json.
+
+    Postings are decoded once at load. Each keyword argument to :meth:`query`
+    names a facet; a string value must match exactly, a list of values matches
+    any of them (OR within a facet). Facets are ANDed together::
+
+        idx = InvertedIndex.load()
+        idx.hunt_ids(idx.query(technique="T1059.001", category="Flames"))
+    """
+
+    def __init__(self, data: dict[str, Any]):
+        if data.get("version") != INDEX_VERSION:
+            raise ValueError(f"unsupported hunts-index version: {data.get('version')!r}")
+        decode = decode_postings if data.get("encoding") == "delta" else list
+        self.ids: list[str] = data["ids"]
+        self.postings: dict[str, dict[str, list[int]]] = {
+            facet: {value: decode(offs) for value, offs in values.items()}
+            for facet, values in data["postings"].items()
+        }
+
+    @classmethod
+    def load(cls, path: Path = DEFAULT_INDEX) -> InvertedIndex:
+        return cls(json.loads(Path(path).read_text(encoding="utf-8")))
+
+    def values(self, facet: str) -> list[str]:
+        """All indexed values of ``facet``, sorted."""
+        return sorted(self._facet(facet))
+
+    def count(self, facet: str, value: str) -> int:
+        return len(self._facet(facet).get(value, ()))
+
+    def query(self, **filters: str | Iterable[str]) -> list[int]:
+        """Sorted offsets of hunts matching every filter."""
+        if not filters:
+            return list(range(len(self.ids)))
+        candidates: list[set[int]] = []
+        for facet, wanted in filters.items():
+            postings = self._facet(facet)
+            values = [wanted] if isinstance(wanted, str) else list(wanted)
+            matched: set[int] = set()
+            for value in values:
+                matched.update(postings.get(value, ()))
+            if not matched:
+                return []
+            candidates.append(matched)
+        # Intersect smallest-first so the working set only ever shrinks.
+        candidates.sort(key=len)
+        result = candidates[0].intersection(*candidates[1:])
+        return sorted(result)
+
+    def hunt_ids(self, offsets: Iterable[int]) -> list[str]:
+        return [self.ids[i] for i in offsets]
+
+    def _facet(self, facet: str) -> dict[str, list[int]]:
+        if facet not in self.postings:
+            raise KeyError(f"unknown facet {facet!r}; expected one of {', '.join(FACETS)}")
+        return self.postings[facet]
@@ -0,0 +1,37 @@
+"""
+Lazily constructed LLM clients for the hunt-drafting scripts.
+
+generate_from_cti.py and process_hunt_submission.py used to import the
+Anthropic/OpenAI SDKs and build a client at import time, which cost well over a
+second and raised when no API key was set. Here the SDK is imported and the key
+checked on first use, and each client is built once per process.
+"""
+
+import os
+from functools import cache
+
+
+@cache
+def anthropic_client():
+    api_key = os.getenv("ANTHROPIC_API_KEY")
+    if not api_key:
+        raise ValueError("ANTHROPIC_API_KEY not set in environment.")
+    try:
+        import anthropic
+    except ImportError as exc:
+        raise ImportError(
+            "Anthropic (Claude) client not installed. Please install 'anthropic' Python package."
+        ) from exc
+    return anthropic.Anthropic(api_key=api_key)
+
+
+@cache
+def openai_client():
+    from openai import OpenAI
+
+    return OpenAI(api_key=os.getenv("OPENAI_API_KEY"))
+
+
+def client_for(provider):
+    """The client for ``AI_PROVIDER``. Call it at startup to fail fast on a missing key."""
+    return anthropic_client() if provider == "claude" else openai_client()
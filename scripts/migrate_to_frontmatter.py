@@ -18,9 +18,8 @@ _REPO_ROOT = str(Path(__file__).resolve().parent.parent)
 if _REPO_ROOT not in sys.path:
     sys.path.insert(0, _REPO_ROOT)
 
-import frontmatter
-
-from scripts.hunt_parser import _parse_legacy_table
+from scripts import hunt_yaml
+from scripts.hunt_parser import _parse_legacy_table, split_preamble
 from scripts.hunt_schema import validate_hunt
 
 CATEGORY_DIRS = ("Flames", "Embers", "Alchemy")
@@ -29,9 +28,6 @@ SKIP_FILENAMES = {"secret.md"}  # Easter egg / non-hunt files
 _TABLE_BLOCK_RE = re.compile(r"^\|.*Hunt\s*#.*\n\|.*\n\|.*\n", re.MULTILINE)
 
 
-_INTRO_RE = re.compile(r"^([^\n#].*?)\n+(?=## )", re.DOTALL)
-
-
 def _build_body(raw: str) -> str:
     """Strip leading HTML comments, the H1 and the legacy table; keep the rest.
 
@@ -40,19 +36,17 @@ def _build_body(raw: str) -> str:
     hunts it is the only place certain CVEs, registry paths, IOC filenames and
     API names appear (see #386); dropping it silently lost that content. Where
     it merely paraphrases the hypothesis the section is redundant but harmless
-    — losing detection detail is not.
+    — losing detection detail is not. The first heading is found by
+    hunt_parser.split_preamble, so a ``## `` line in a fenced block is not one.
     """
     no_html_comment = re.sub(r"^<!--.*?-->\s*\n", "", raw, count=1, flags=re.DOTALL)
     no_table = _TABLE_BLOCK_RE.sub("", no_html_comment, count=1)
     no_h1 = re.sub(r"^# .+\n+", "", no_table, count=1)
 
-    match = _INTRO_RE.match(no_h1)
-    if not match:
+    intro, rest = split_preamble(no_h1)
+    if not rest or not intro or intro[0] in "#\n":
         return no_h1.strip() + "\n"
-
-    intro = match.group(1).strip()
-    rest = no_h1[match.end() :]
-    return f"## Summary\n\n{intro}\n\n{rest}".strip() + "\n"
+    return f"## Summary\n\n{intro.strip()}\n\n{rest}".strip() + "\n"
 
 
 def migrate_file(path: Path, category: str, dry_run: bool) -> bool:
@@ -61,8 +55,7 @@ def migrate_file(path: Path, category: str, dry_run: bool) -> bool:
         return False
 
     raw = path.read_text(encoding="utf-8")
-    post = frontmatter.loads(raw)
-    if post.metadata:
+    if hunt_yaml.split(raw)[0]:
         return False  # already migrated
 
     parsed = _parse_legacy_table(raw, hunt_id=path.stem, category=category)
@@ -98,8 +91,7 @@ def migrate_file(path: Path, category: str, dry_run: bool) -> bool:
         )
 
     body = _build_body(raw)
-    new_post = frontmatter.Post(content=body, **metadata)
-    output = frontmatter.dumps(new_post) + "\n"
+    output = hunt_yaml.join(metadata, body) + "\n"
 
     if dry_run:
         return True
@@ -4,13 +4,8 @@ from pathlib import Path
 
 from dotenv import load_dotenv
 
-# Add Anthropic (Claude) support
-try:
-    import anthropic
-
-    CLAUDE_AVAILABLE = True
-except ImportError:
-    CLAUDE_AVAILABLE = False
+from hunt_id_ledger import allocate
+from llm_clients import anthropic_client, client_for, openai_client
 
 load_dotenv()
 
@@ -20,20 +15,6 @@ AI_PROVIDER = os.getenv("AI_PROVIDER", "claude").lower()
 # Claude model configuration - use environment variable or default to latest
 CLAUDE_MODEL = os.getenv("CLAUDE_MODEL", "claude-sonnet-5")
 
-if AI_PROVIDER == "claude":
-    if not CLAUDE_AVAILABLE:
-        raise ImportError(
-            "Anthropic (Claude) client not installed. Please install 'anthropic' Python package."
-        )
-    ANTHROPIC_API_KEY = os.getenv("ANTHROPIC_API_KEY")
-    if not ANTHROPIC_API_KEY:
-        raise ValueError("ANTHROPIC_API_KEY not set in environment.")
-    anthropic_client = anthropic.Anthropic(api_key=ANTHROPIC_API_KEY)
-else:
-    from openai import OpenAI
-
-    client = OpenAI(api_key=os.getenv("OPENAI_API_KEY"))
-
 SYSTEM_PROMPT = """You are an expert threat hunter, and your task is to reformat a manually submitted hunt idea into the official HEARTH markdown format.
 You will be given the raw components of a hunt from a GitHub issue.
 Your job is to assemble these into a complete and perfectly formatted markdown file.
@@ -141,7 +122,7 @@ def generate_hunt_file(details):
     )
 
     if AI_PROVIDER == "claude":
-        response = anthropic_client.messages.create(
+        response = anthropic_client().messages.create(
             model=CLAUDE_MODEL,
             max_tokens=4096,
             thinking={"type": "disabled"},
@@ -150,7 +131,7 @@ def generate_hunt_file(details):
         )
         return response.content[0].text.strip()
 
-    response = client.chat.completions.create(
+    response = openai_client().chat.completions.create(
         model="gpt-4",
         messages=[
             {"role": "system", "content": SYSTEM_PROMPT},
@@ -162,18 +143,15 @@ def generate_hunt_file(details):
     return response.choices[0].message.content.strip()
 
 
-def get_next_hunt_id(hunt_type_prefix, hunt_dir):
-    """Next number for a prefix: max existing ``<prefix>NNN`` + 1 (1 if none)."""
-    stem_re = re.compile(rf"^{re.escape(hunt_type_prefix)}(\d+)$")
-    numbers = [
-        int(m.group(1))
-        for f in Path(hunt_dir).glob(f"{hunt_type_prefix}*.md")
-        if (m := stem_re.match(f.stem))
-    ]
-    return max(numbers) + 1 if numbers else 1
+def get_next_hunt_id(hunt_dir):
+    """Reserve the next number in ``hunt_dir``'s sequence in the hunt-ID ledger."""
+    return allocate(hunt_dir, owner=f"issue-{os.getenv('ISSUE_NUMBER', '')}")
 
 
 if __name__ == "__main__":
+    # Fail fast on a missing SDK or key, before any work is done.
+    client_for(AI_PROVIDER)
+
     issue_body = os.getenv("ISSUE_BODY")
     if not issue_body:
         raise ValueError("ISSUE_BODY environment variable not set.")
@@ -195,7 +173,7 @@ if __name__ == "__main__":
     Path(directory).mkdir(exist_ok=True)
 
     # 3. Determine next hunt ID (HNNN / BNNN / MNNN, continuing the sequence)
-    next_id = get_next_hunt_id(prefix, directory)
+    next_id = get_next_hunt_id(directory)
     hunt_id = f"{prefix}{next_id:03d}"
     out_md_path = Path(f"{directory}/{hunt_id}.md")
 
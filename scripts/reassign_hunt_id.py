@@ -12,6 +12,9 @@ Covers all three categories (Flames ``HNNN``, Embers ``BNNN``, Alchemy
 ``MNNN``). Each is an independent number space, so a draft's ``B035`` is only
 blocked by other Embers IDs; ``H035`` on main is irrelevant to it.
 
+Numbers come from the hunt-ID ledger (``hunt_id_ledger.py``), reconciled with
+main and the draft claims first, so a fresh number is one atomic reservation.
+
 Tiebreak by issue number makes a batch of approvals collision-free regardless
 of the order they run in: the earliest issue keeps the contested number and
 each later one yields. The workflow also serialises these jobs (a concurrency
@@ -33,11 +36,10 @@ _REPO_ROOT = str(Path(__file__).resolve().parent.parent)
 if _REPO_ROOT not in sys.path:
     sys.path.insert(0, _REPO_ROOT)
 
+from scripts.hunt_id_ledger import HuntIdLedger, git_numbers
 from scripts.hunt_ids import (
     CATEGORY_PREFIXES,
-    existing_numbers,
     format_hunt_id,
-    next_free_number,
     parse_hunt_number,
     rewrite_hunt_id,
 )
@@ -51,34 +53,17 @@ def _git(*args: str) -> str:
     ).stdout
 
 
-def _added_numbers(ref: str, category: str, prefix: str) -> set[int]:
-    """Hunt numbers a ref ADDS under ``category/`` relative to main."""
+def _added_files() -> dict[str, list[Path]]:
+    """Hunt files HEAD adds relative to main, per category, from one diff."""
     out = _git(
-        "diff",
-        "--diff-filter=A",
-        "--name-only",
-        f"origin/main...{ref}",
-        "--",
-        f"{category}/",
+        "diff", "--diff-filter=A", "--name-only", "origin/main...HEAD", "--", *CATEGORY_PREFIXES
     )
-    return existing_numbers((p for p in out.splitlines() if p.endswith(".md")), prefix)
-
-
-def _main_numbers(category: str, prefix: str) -> set[int]:
-    out = _git("ls-tree", "-r", "--name-only", "origin/main", "--", f"{category}/")
-    return existing_numbers(out.splitlines(), prefix)
-
-
-def _added_files(category: str) -> list[Path]:
-    out = _git(
-        "diff",
-        "--diff-filter=A",
-        "--name-only",
-        "origin/main...HEAD",
-        "--",
-        f"{category}/",
-    )
-    return [Path(p) for p in out.splitlines() if p.endswith(".md")]
+    added: dict[str, list[Path]] = {category: [] for category in CATEGORY_PREFIXES}
+    for p in out.splitlines():
+        category = p.split("/", 1)[0]
+        if p.endswith(".md") and category in added:
+            added[category].append(Path(p))
+    return added
 
 
 def _fetch_draft_refs() -> None:
@@ -91,29 +76,105 @@ def _fetch_draft_refs() -> None:
     )
 
 
-def _other_draft_claims(
-    current_issue: int, category: str, prefix: str
-) -> dict[int, int]:
-    """Map each hunt number claimed by another open draft branch to the lowest
-    issue number claiming it. Scoped to one category. Assumes draft refs are
-    already fetched."""
-    claims: dict[int, int] = {}
+def _draft_tips() -> dict[int, str]:
+    """Tip commit of each fetched draft branch, by issue number."""
     out = subprocess.run(
-        ["git", "for-each-ref", "--format=%(refname)", "refs/remotes/origin/draft/"],
+        ["git", "for-each-ref", "--format=%(objectname) %(refname)", "refs/remotes/origin/draft/"],
         check=False,
         capture_output=True,
         text=True,
     ).stdout
-    for ref in out.splitlines():
+    tips: dict[int, str] = {}
+    for line in out.splitlines():
+        sha, ref = line.split(" ", 1)
         match = _DRAFT_RE.search(ref)
-        if not match:
+        if match:
+            tips[int(match.group(1))] = sha
+    return tips
+
+
+def _merge_bases(tips: list[str]) -> dict[str, str]:
+    """Merge base with main of each tip, from one ``rev-list`` walk.
+
+    Walking back from a tip through the commits main lacks ends at the
+    boundary commits main has. A draft branched once from main reaches
+    exactly one, its merge base; a tip main already contains is its own. Any
+    other shape (main merged into the draft) asks ``git merge-base``.
+    """
+    out = _git("rev-list", "--parents", "--boundary", *tips, "--not", "origin/main")
+    parents: dict[str, list[str]] = {}
+    for line in out.splitlines():
+        if not line.startswith("-"):
+            sha, *rest = line.split()
+            parents[sha] = rest
+    bases: dict[str, str] = {}
+    for tip in tips:
+        if tip not in parents:
+            bases[tip] = tip
             continue
-        issue = int(match.group(1))
-        if issue == current_issue:
-            continue
-        for num in _added_numbers(ref, category, prefix):
-            if num not in claims or issue < claims[num]:
-                claims[num] = issue
+        seen, stack, reached = {tip}, [tip], set()
+        while stack:
+            for parent in parents[stack.pop()]:
+                if parent in parents:
+                    if parent not in seen:
+                        seen.add(parent)
+                        stack.append(parent)
+                else:
+                    reached.add(parent)
+        bases[tip] = (
+            reached.pop() if len(reached) == 1 else _git("merge-base", "origin/main", tip).strip()
+        )
+    return bases
+
+
+def _draft_additions(tips: list[str], ledger: HuntIdLedger) -> dict[str, list[str]]:
+    """Hunt paths each tip adds relative to main.
+
+    Tips already in the ledger's cache cost nothing; the workflow carries the
+    ledger between runs with ``actions/cache``. The rest share one
+    ``rev-list`` walk for their merge bases and one ``git diff-tree --stdin``
+    for every diff. A tip's additions cannot change while it stays the tip,
+    so the cache is keyed by tip alone. Tips no longer open are dropped
+    whenever new ones are recorded.
+    """
+    additions = ledger.draft_additions(tips)
+    missing = [tip for tip in tips if tip not in additions]
+    if not missing:
+        return additions
+    bases = _merge_bases(missing)
+    # "<commit> <parent>" diffs parent -> commit; --always prints the commit
+    # line even when the diff is empty, so every tip gets an entry.
+    out = subprocess.run(
+        ["git", "diff-tree", "--stdin", "--always", "-r", "--name-only", "--no-renames",
+         "--diff-filter=A", "--", *CATEGORY_PREFIXES],
+        input="".join(f"{tip} {bases[tip]}\n" for tip in missing),
+        check=True, capture_output=True, text=True,
+    ).stdout
+    found: dict[str, list[str]] = {}
+    paths: list[str] = []
+    for line in out.splitlines():
+        if line in bases:
+            paths = found.setdefault(line, [])
+        elif line.endswith(".md"):
+            paths.append(line)
+    ledger.record_draft_additions(found, current=tips)
+    additions.update(found)
+    return additions
+
+
+def _other_draft_claims(current_issue: int, ledger: HuntIdLedger) -> dict[str, dict[int, int]]:
+    """Per prefix, map each hunt number claimed by another open draft branch to
+    the lowest issue number claiming it. Assumes draft refs are already fetched."""
+    tips = {issue: sha for issue, sha in _draft_tips().items() if issue != current_issue}
+    additions = _draft_additions(sorted(set(tips.values())), ledger) if tips else {}
+    claims: dict[str, dict[int, int]] = {prefix: {} for prefix in CATEGORY_PREFIXES.values()}
+    for issue, sha in sorted(tips.items()):
+        for path in additions.get(sha, []):
+            category, name = path.split("/", 1)
+            prefix = CATEGORY_PREFIXES.get(category)
+            num = parse_hunt_number(Path(name).stem, prefix) if prefix else None
+            if num is not None:
+                claims[prefix].setdefault(num, issue)
     return claims
 
 
@@ -128,46 +189,58 @@ def _set_output(changed: bool, hunt_id: str) -> None:
 
 def main() -> int:
     current_issue = int(os.environ.get("ISSUE_NUMBER", "0") or "0")
+    owner = f"issue-{current_issue}"
     _fetch_draft_refs()
 
     changed = False
     final_id = ""
-
-    # Each category is an independent number space, so state is per-category.
-    for category, prefix in CATEGORY_PREFIXES.items():
-        added = _added_files(category)
-        if not added:
-            continue
-
-        main_nums = _main_numbers(category, prefix)
-        other_claims = _other_draft_claims(current_issue, category, prefix)
-
-        # Must not KEEP a number on main or held by a lower-numbered issue.
-        blocked = set(main_nums) | {
-            num for num, issue in other_claims.items() if issue < current_issue
-        }
-        # When allocating a fresh number, avoid everything known to be claimed.
-        claimed = set(main_nums) | set(other_claims)
-
-        for path in added:
-            num = parse_hunt_number(path.stem, prefix)
-            if num is None:
+    added_by_category = _added_files()
+    if not any(added_by_category.values()):
+        print("No hunt-ID collisions to fix.")
+        _set_output(False, "")
+        return 0
+    main_numbers = git_numbers("origin/main")
+
+    with HuntIdLedger() as ledger:
+        # Every draft's additions, for all categories at once.
+        draft_claims = _other_draft_claims(current_issue, ledger)
+        # Each category is an independent number space, so state is per-category.
+        for category, prefix in CATEGORY_PREFIXES.items():
+            added = added_by_category[category]
+            if not added:
                 continue
-            final_id = path.stem
-            if num in blocked:
-                new_num = next_free_number(claimed)
-                new_id = format_hunt_id(new_num, prefix)
-                new_path = rewrite_hunt_id(path, new_id)
-                _git("add", "-A", "--", category)
-                claimed.add(new_num)
-                blocked.add(new_num)
-                final_id = new_id
-                changed = True
-                print(f"Reassigned {path.name} -> {new_path.name} (id already claimed)")
-            else:
-                claimed.add(num)
-                blocked.add(num)
-                print(f"{path.name}: ID free, no change")
+
+            main_nums = main_numbers[prefix]
+            other_claims = draft_claims[prefix]
+            ledger.reconcile(
+                prefix, main_nums, {num: f"issue-{issue}" for num, issue in other_claims.items()}
+            )
+
+            # Must not KEEP a number on main or held by a lower-numbered issue.
+            blocked = set(main_nums) | {
+                num for num, issue in other_claims.items() if issue < current_issue
+            }
+
+            for path in added:
+                num = parse_hunt_number(path.stem, prefix)
+                if num is None:
+                    continue
+                final_id = path.stem
+                if num in blocked:
+                    # The ledger's sequence is past everything on main and
+                    # every draft, and past any number handed out before.
+                    new_num = ledger.reserve(prefix, owner)
+                    new_id = format_hunt_id(new_num, prefix)
+                    new_path = rewrite_hunt_id(path, new_id)
+                    _git("add", "-A", "--", category)
+                    blocked.add(new_num)
+                    final_id = new_id
+                    changed = True
+                    print(f"Reassigned {path.name} -> {new_path.name} (id already claimed)")
+                else:
+                    ledger.claim(prefix, num, owner)
+                    blocked.add(num)
+                    print(f"{path.name}: ID free, no change")
 
     if not changed:
         print("No hunt-ID collisions to fix.")
@@ -1,9 +1,16 @@
 #!/usr/bin/env python3
 """
 Standalone script to rebuild hunts-data.js from markdown files.
-No external dependencies — pure stdlib.
+Hunts are parsed by scripts/hunt_parser.py, which reads frontmatter through
+scripts/hunt_yaml.py and so needs PyYAML (requirements.txt).
+
+Also writes public/hunts-data.json and its inverted index,
+public/hunts-index.json (see scripts/inverted_index.py). Does nothing unless
+public/build-manifest.json shows an input changed; pass --force to rebuild
+anyway.
 """
 
+import argparse
 import json
 import re
 import subprocess
@@ -13,6 +20,9 @@ from pathlib import Path
 # A hunt markdown file: H### (Flames), B### (Embers), M### (Alchemy).
 HUNT_FILE_RE = re.compile(r"^[HBM]\d+\.md$")
 
+# Category directory -> category name.
+CATEGORIES = {"Flames": "Flames", "Embers": "Embers", "Alchemy": "Alchemy"}
+
 # Directories that legitimately contain no hunts; skipped when scanning for
 # hunt files that have been filed outside a category directory.
 NON_HUNT_DIRS = {
@@ -86,12 +96,19 @@ SUBMITTER_MAP = {
     "**Submitter**": None,  # Header row — skip
 }
 
+# Issue-form placeholders for a blank field: "_No response_", "(no response)".
+NO_RESPONSE_RE = re.compile(r"^[_*()\s]*no\s+response[_*()\s]*$", re.IGNORECASE)
+
 
 def parse_hunt_file(path, category):
     """Delegate to scripts.hunt_parser; reshape for frontend consumption."""
     from scripts.hunt_parser import parse_hunt_file as _parse
 
-    parsed = _parse(path, category)
+    return shape_hunt(_parse(path, category), category)
+
+
+def shape_hunt(parsed, category):
+    """Reshape a scripts.hunt_parser record for the frontend; None for non-hunts."""
     if parsed["id"].lower() == "secret":
         return None
 
@@ -129,6 +146,8 @@ def parse_submitter_from_dict(submitter):
         if override is None:
             return {"name": "Anonymous", "link": ""}
         return override
+    if NO_RESPONSE_RE.match(name):
+        return {"name": "Anonymous", "link": ""}
     result = {"name": name or "Anonymous", "link": submitter.get("link", "")}
     if submitter.get("links"):
         result["links"] = list(submitter["links"])
@@ -156,10 +175,8 @@ def find_stray_hunts(base, categories):
     return stray
 
 
-def main():
-    base = Path(__file__).parent.parent
-    categories = {"Flames": "Flames", "Embers": "Embers", "Alchemy": "Alchemy"}
-
+def check_layout(base, categories):
+    """Exit with an error if any hunt file sits outside the category directories."""
     stray = find_stray_hunts(base, categories)
     if stray:
         print(
@@ -175,6 +192,14 @@ def main():
         )
         sys.exit(1)
 
+
+def collect_hunts(base, categories, parse=parse_hunt_file, verbose=True):
+    """Parse every category directory into the sorted hunts-data.json list.
+
+    ``parse(path, category)`` defaults to reading the file; the build
+    orchestrator passes one that reshapes an already-parsed record instead.
+    Exits with an error on duplicate hunt IDs.
+    """
     all_hunts = []
     id_sources = {}
     for dirname, cat_name in categories.items():
@@ -182,11 +207,12 @@ def main():
         if not cat_dir.exists():
             continue
         for md in sorted(cat_dir.glob("*.md")):
-            hunt = parse_hunt_file(md, cat_name)
+            hunt = parse(md, cat_name)
             if hunt:
                 all_hunts.append(hunt)
                 id_sources.setdefault(hunt["id"], []).append(str(md.relative_to(base)))
-                print(f"  Parsed {hunt['id']}")
+                if verbose:
+                    print(f"  Parsed {hunt['id']}")
 
     # Two hunts claiming one ID means whichever sorts last silently wins in the
     # index, and the site renders one of them under the other's number.
@@ -199,7 +225,11 @@ def main():
         sys.exit(1)
 
     all_hunts.sort(key=lambda x: x["id"])
+    return all_hunts
 
+
+def write_hunts_data(all_hunts, base):
+    """Write hunts-data.js, public/hunts-data.json and public/hunts-index.json."""
     # Write JS version
     js_path = base / "hunts-data.js"
     with open(js_path, "w", encoding="utf-8") as f:
@@ -214,21 +244,50 @@ def main():
     with open(json_path, "w", encoding="utf-8") as f:
         json.dump(all_hunts, f, indent=2, ensure_ascii=False)
 
-    print(f"\nGenerated {len(all_hunts)} hunts")
-    for cat in categories:
-        count = len([h for h in all_hunts if h["category"] == cat])
-        print(f"  {cat}: {count}")
+    # Precomputed postings lists so filters are set intersections, not scans.
+    from scripts.inverted_index import write_inverted_index
+
+    write_inverted_index(all_hunts, base / "public" / "hunts-index.json")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Rebuild hunts-data.js and the site's hunt JSON.")
+    parser.add_argument("--force", action="store_true",
+                        help="rebuild even if public/build-manifest.json says nothing changed")
+    args = parser.parse_args(argv)
+
+    from scripts.build_manifest import Manifest
+
+    base = Path(__file__).parent.parent
+    manifest = Manifest(base)
+    all_hunts = None
+
+    if not args.force and manifest.status("hunts-data") is None:
+        print("hunts-data is up to date (public/build-manifest.json)")
+    else:
+        check_layout(base, CATEGORIES)
+        all_hunts = collect_hunts(base, CATEGORIES)
+        write_hunts_data(all_hunts, base)
+        manifest.record("hunts-data")
+
+        print(f"\nGenerated {len(all_hunts)} hunts")
+        for cat in CATEGORIES:
+            count = len([h for h in all_hunts if h["category"] == cat])
+            print(f"  {cat}: {count}")
 
     # Refresh the actor-mentions index so the Actors page stays in sync with hunt prose.
     # Failure here is non-fatal — the page falls back to technique-only matching if the
     # mentions file is stale or missing.
-    try:
-        from scripts.build_actor_mentions import build as build_actor_mentions
+    if args.force or manifest.status("actor-mentions") is not None:
+        try:
+            from scripts.build_actor_mentions import build as build_actor_mentions
 
-        result = build_actor_mentions()
-        print(f"  Refreshed actor-mentions.json ({len(result['mentions'])} actors)")
-    except Exception as exc:  # noqa: BLE001 — non-fatal best-effort refresh
-        print(f"  ! actor-mentions refresh failed: {exc}")
+            result = build_actor_mentions(hunts=all_hunts)
+            manifest.record("actor-mentions")
+            print(f"  Refreshed actor-mentions.json ({len(result['mentions'])} actors)")
+        except Exception as exc:  # noqa: BLE001 — non-fatal best-effort refresh
+            print(f"  ! actor-mentions refresh failed: {exc}")
+    manifest.save()
 
 
 if __name__ == "__main__":
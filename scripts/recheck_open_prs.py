@@ -4,9 +4,19 @@
 Runs on ``push`` to ``main``. When a hunt lands on main it can retroactively
 collide with an open PR that was green when it was last checked (the per-PR
 ``validate`` check only re-runs when the PR head changes, not when main moves).
-This sweep closes that staleness window: for each open PR it replays
-``check_hunt_id_collisions.py`` with the PR head checked out against the current
-main, and reports the result as a ``hunt-id-recheck`` commit status on the PR.
+This sweep closes that staleness window: it replays the
+``check_hunt_id_collisions.py`` check for each open PR that touches hunt files
+against the current main, and reports the result as a ``hunt-id-recheck``
+commit status on the PR.
+
+Main is resolved once and shared by every check. All PR heads come down in one
+fetch and are checked straight from their objects (no checkout) in a bounded
+thread pool, with statuses posted from a second pool as results arrive.
+PRs that touch no hunt file cannot collide: they get a ``success`` status
+without being fetched or checked, so the sweep's cost follows the hunt PRs, not
+the open-PR count. A check that raises posts an ``error`` status, as does every
+hunt PR when main itself cannot be read, so a PR is never left showing a
+result from an older main.
 
 The status is advisory — it surfaces a now-stale collision as a red check on the
 PR so it isn't merged blind; it does not hard-block the merge. Reassigning the
@@ -19,13 +29,22 @@ import json
 import os
 import subprocess
 import sys
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from pathlib import Path
 
+_REPO_ROOT = str(Path(__file__).resolve().parent.parent)
+if _REPO_ROOT not in sys.path:
+    sys.path.insert(0, _REPO_ROOT)
+
+from scripts.check_hunt_id_collisions import DIRS, Baseline, collision_problems
+
 REPO = os.environ["GITHUB_REPOSITORY"]  # "owner/repo"
-CHECK = Path(__file__).resolve().parent / "check_hunt_id_collisions.py"
-TMP = Path(os.environ.get("RUNNER_TEMP", "/tmp"))
 
 STATUS_CONTEXT = "hunt-id-recheck"
+MAX_WORKERS = 8
+# `gh pr list --json files` lists at most this many files per PR; a PR at the
+# cap may touch hunts beyond it.
+GH_FILES_LIMIT = 100
 
 
 def _run(*args: str, check: bool = True) -> subprocess.CompletedProcess:
@@ -42,11 +61,28 @@ def _open_prs() -> list[dict]:
         "--limit",
         "200",
         "--json",
-        "number,headRefOid",
+        "number,headRefOid,files",
     ).stdout
     return json.loads(out)
 
 
+def _touches_hunts(pr: dict) -> bool:
+    files = pr.get("files") or []
+    return len(files) >= GH_FILES_LIMIT or any(
+        f["path"].split("/", 1)[0] in DIRS for f in files
+    )
+
+
+def _fetch_heads(numbers: list[int]) -> None:
+    """Fetch every PR head in one go. A PR closed since it was listed fails
+    the batch, so fall back to one fetch per PR; a head still missing
+    afterwards errors that PR's check alone."""
+    refspecs = [f"pull/{n}/head" for n in numbers]
+    if _run("git", "fetch", "origin", *refspecs, check=False).returncode:
+        for refspec in refspecs:
+            _run("git", "fetch", "origin", refspec, check=False)
+
+
 def _post_status(sha: str, state: str, description: str) -> None:
     _run(
         "gh",
@@ -63,43 +99,16 @@ def _post_status(sha: str, state: str, description: str) -> None:
     )
 
 
-def _recheck(number: int, sha: str) -> bool:
-    """Return True if PR #number now collides with main; post its status."""
-    worktree = TMP / f"recheck-pr-{number}"
-    _run("git", "fetch", "origin", f"pull/{number}/head", check=False)
-    _run(
-        "git",
-        "worktree",
-        "add",
-        "--detach",
-        "--force",
-        str(worktree),
-        "FETCH_HEAD",
-        check=False,
-    )
-    try:
-        result = subprocess.run(
-            [sys.executable, str(CHECK)],
-            cwd=worktree,
-            capture_output=True,
-            text=True,
-        )
-    finally:
-        _run("git", "worktree", "remove", "--force", str(worktree), check=False)
-
-    collided = result.returncode != 0
-    if collided:
-        _post_status(
-            sha,
-            "failure",
-            "Hunt ID now collides with main since this PR was opened — "
-            "reassign a free ID and rebase.",
-        )
-        print(f"PR #{number}: COLLISION\n{result.stdout}{result.stderr}")
-    else:
-        _post_status(sha, "success", "No hunt-ID collision with current main.")
-        print(f"PR #{number}: ok")
-    return collided
+def _status_for(problems: list[str]) -> tuple[str, str]:
+    if problems:
+        return ("failure", "Hunt ID now collides with main since this PR was opened — "
+                           "reassign a free ID and rebase.")
+    return "success", "No hunt-ID collision with current main."
+
+
+SKIPPED_STATUS = ("success", "No hunt files changed, so no hunt-ID collision with main.")
+ERROR_STATUS = ("error", "Hunt-ID recheck could not run against current main; "
+                         "see the recheck-open-prs workflow log.")
 
 
 def main() -> int:
@@ -107,16 +116,55 @@ def main() -> int:
     if not prs:
         print("No open PRs to recheck.")
         return 0
+    hunt_prs = [pr for pr in prs if _touches_hunts(pr)]
+    skipped = [pr for pr in prs if not _touches_hunts(pr)]
+    checked, unchecked = hunt_prs, []
+    if hunt_prs:
+        try:
+            baseline = Baseline()
+            _fetch_heads([pr["number"] for pr in hunt_prs])
+        except Exception as exc:  # no check can run; say so on every hunt PR
+            print(f"Could not read current main: {exc}", file=sys.stderr)
+            checked, unchecked = [], hunt_prs
 
     collisions = 0
-    for pr in prs:
-        try:
-            if _recheck(pr["number"], pr["headRefOid"]):
+    with ThreadPoolExecutor(MAX_WORKERS) as checks, ThreadPoolExecutor(MAX_WORKERS) as posts:
+        pending = {
+            checks.submit(collision_problems, pr["headRefOid"], baseline=baseline): pr
+            for pr in checked
+        }
+        posted = {
+            posts.submit(_post_status, pr["headRefOid"], *SKIPPED_STATUS): pr
+            for pr in skipped
+        }
+        posted.update({
+            posts.submit(_post_status, pr["headRefOid"], *ERROR_STATUS): pr
+            for pr in unchecked
+        })
+        # Results are printed here, on one thread, so reports never interleave.
+        for future in as_completed(pending):
+            pr = pending[future]
+            try:
+                problems = future.result()
+            except Exception as exc:  # never let one PR abort the sweep
+                print(f"PR #{pr['number']}: recheck errored: {exc}", file=sys.stderr)
+                posted[posts.submit(_post_status, pr["headRefOid"], *ERROR_STATUS)] = pr
+                continue
+            if problems:
                 collisions += 1
-        except Exception as exc:  # never let one PR abort the sweep
-            print(f"PR #{pr['number']}: recheck errored: {exc}", file=sys.stderr)
-
-    print(f"Rechecked {len(prs)} open PR(s); {collisions} now colliding.")
+                print(f"PR #{pr['number']}: COLLISION")
+                for problem in problems:
+                    print(f"  - {problem}")
+            else:
+                print(f"PR #{pr['number']}: ok")
+            posted[posts.submit(_post_status, pr["headRefOid"], *_status_for(problems))] = pr
+        for future in as_completed(posted):
+            if future.exception():
+                print(f"PR #{posted[future]['number']}: posting status failed: "
+                      f"{future.exception()}", file=sys.stderr)
+
+    print(f"Rechecked {len(checked)} of {len(prs)} open PR(s) (the rest touch no hunt "
+          f"files); {collisions} now colliding.")
     # The signal is carried by per-PR commit statuses, not the workflow result.
     return 0
 
@@ -0,0 +1,126 @@
+"""
+Shared MITRE ATT&CK technique-ID extraction and normalization.
+
+Technique IDs reach HEARTH in several spellings: ``T1070.004`` in frontmatter,
+``#T1070_004`` in legacy tag cells, ``T1070/004`` in the odd ATT&CK URL. Every
+consumer should go through this module so they all agree on the canonical
+dotted form and on what counts as a technique at all.
+
+Extraction works on batches: one compiled pattern, a C-level ``findall`` per
+text (no per-match ``Match`` objects) and a shared cache of canonical IDs, so a
+whole-corpus pass costs little more than the regex scan itself.
+
+Classification against ATT&CK reads the slim matrix written by
+``scripts/build_mitre_matrix.py`` (``public/mitre-matrix.json``).
+"""
+
+from __future__ import annotations
+
+import json
+import re
+from collections.abc import Iterable
+from functools import lru_cache
+from pathlib import Path
+
+#: A technique or sub-technique in any of the separators seen in the corpus.
+TECHNIQUE_RE = re.compile(r"T(\d{4})(?:[._/](\d{3}))?")
+
+DEFAULT_MATRIX = Path(__file__).resolve().parent.parent / "public" / "mitre-matrix.json"
+
+# (digits, sub-digits) -> canonical ID. Bounded by the ATT&CK ID space, so it
+# never needs evicting.
+_CANONICAL: dict[tuple[str, str], str] = {}
+
+
+def _canonical(technique: str, sub: str) -> str:
+    key = (technique, sub)
+    tid = _CANONICAL.get(key)
+    if tid is None:
+        tid = _CANONICAL[key] = f"T{technique}.{sub}" if sub else f"T{technique}"
+    return tid
+
+
+def normalize_technique_id(raw: str) -> str | None:
+    """Canonical dotted form of a single ID (``T1070_004`` → ``T1070.004``).
+
+    Returns None when ``raw`` is not exactly one technique ID.
+    """
+    match = TECHNIQUE_RE.fullmatch(raw.strip())
+    return _canonical(match.group(1), match.group(2) or "") if match else None
+
+
+def parent_technique(technique_id: str) -> str:
+    """``T1059.001`` → ``T1059``; a parent technique is returned unchanged."""
+    return technique_id.split(".", 1)[0]
+
+
+def extract_techniques(text: str) -> list[str]:
+    """Canonical technique IDs in ``text``, deduplicated, in first-seen order."""
+    return extract_techniques_batch([text])[0]
+
+
+def extract_techniques_batch(texts: Iterable[str]) -> list[list[str]]:
+    """Extract technique IDs from many texts with one compiled pattern.
+
+    Returns one list per input text, each deduplicated and in first-seen order
+    — the same result as calling :func:`extract_techniques` on each text.
+    """
+    findall = TECHNIQUE_RE.findall
+    canonical = _CANONICAL
+    results: list[list[str]] = []
+    for text in texts:
+        # findall yields (digits, sub) tuples without building Match objects.
+        # The separator is not captured, so T1059_001 and T1059.001 share a key
+        # and one dedupe pass over the raw keys is enough.
+        results.append(
+            [canonical.get(key) or _canonical(*key) for key in dict.fromkeys(findall(text))]
+        )
+    return results
+
+
+@lru_cache(maxsize=4)
+def load_attack_index(path: Path = DEFAULT_MATRIX) -> tuple[frozenset[str], dict]:
+    """``(active_ids, deprecated)`` from a mitre-matrix.json file.
+
+    ``deprecated`` maps each retired ID to its ``revoked_by`` successor (or
+    None). Cached per path; the matrix only changes when it is rebuilt.
+    """
+    matrix = json.loads(Path(path).read_text(encoding="utf-8"))
+    active = frozenset(t["id"] for t in matrix.get("techniques", []))
+    deprecated = {
+        tid: info.get("revoked_by") for tid, info in matrix.get("deprecated", {}).items()
+    }
+    return active, deprecated
+
+
+def classify_techniques(
+    technique_ids: Iterable[str], matrix_path: Path = DEFAULT_MATRIX
+) -> dict:
+    """Report which IDs are sub-techniques, deprecated, or unknown to ATT&CK.
+
+    IDs are normalized first, so underscore spellings classify like their
+    dotted form. Returns::
+
+        {
+            "techniques": [...],       # canonical, deduplicated, input order
+            "subtechniques": [...],
+            "deprecated": {id: successor_or_None},
+            "unknown": [...],          # neither active nor retired
+        }
+    """
+    active, deprecated = load_attack_index(matrix_path)
+    report: dict = {"techniques": [], "subtechniques": [], "deprecated": {}, "unknown": []}
+    seen: set[str] = set()
+    for raw in technique_ids:
+        tid = normalize_technique_id(raw)
+        if tid is None or tid in seen:
+            continue
+        seen.add(tid)
+        report["techniques"].append(tid)
+        if "." in tid:
+            report["subtechniques"].append(tid)
+        if tid in deprecated:
+            report["deprecated"][tid] = deprecated[tid]
+        elif tid not in active:
+            report["unknown"].append(tid)
+    return report
@@ -0,0 +1,96 @@
+"""Tests for the stage runner in scripts/build_all.py."""
+
+import scripts.build_all as build_all
+import scripts.hunt_parser as hunt_parser
+from scripts.build_all import BuildContext, Stage, run_stages
+from scripts.tests.test_build_hunt_database import _hunt
+
+
+def _stage(name, runs, inputs=("in/*.txt",), outputs=None, fail=False):
+    outputs = outputs or (f"out/{name}.txt",)
+
+    def run(ctx):
+        runs.append(name)
+        if fail:
+            raise RuntimeError("boom")
+        for out in outputs:
+            (ctx.root / out).parent.mkdir(exist_ok=True)
+            (ctx.root / out).write_text(name)
+
+    return Stage(name, inputs, outputs, run)
+
+
+def _run(tmp_path, stages, **kwargs):
+    return run_stages(stages, BuildContext(root=tmp_path), **kwargs)
+
+
+def test_unchanged_inputs_skip_the_stage(tmp_path):
+    (tmp_path / "in").mkdir()
+    (tmp_path / "in" / "a.txt").write_text("1")
+    runs = []
+    stages = [_stage("one", runs)]
+    assert _run(tmp_path, stages) == {"one": "built"}
+    assert _run(tmp_path, stages) == {"one": "unchanged"}
+    assert runs == ["one"]
+
+    (tmp_path / "in" / "a.txt").write_text("2")
+    assert _run(tmp_path, stages) == {"one": "built"}
+    (tmp_path / "in" / "b.txt").write_text("new file")
+    assert _run(tmp_path, stages) == {"one": "built"}
+    assert _run(tmp_path, stages, force=True) == {"one": "built"}
+
+
+def test_missing_or_edited_output_forces_a_rebuild(tmp_path):
+    (tmp_path / "in").mkdir()
+    (tmp_path / "in" / "a.txt").write_text("1")
+    runs = []
+    stages = [_stage("one", runs)]
+    _run(tmp_path, stages)
+    (tmp_path / "out" / "one.txt").unlink()
+    assert _run(tmp_path, stages) == {"one": "built"}
+    (tmp_path / "out" / "one.txt").write_text("hand edit")
+    assert _run(tmp_path, stages) == {"one": "built"}
+
+
+def test_stages_without_inputs_always_run(tmp_path):
+    runs = []
+    stages = [_stage("incremental", runs, inputs=())]
+    _run(tmp_path, stages)
+    _run(tmp_path, stages)
+    assert runs == ["incremental", "incremental"]
+
+
+def test_missing_literal_input_and_failures(tmp_path):
+    (tmp_path / "in").mkdir()
+    runs = []
+    stages = [
+        _stage("needs-stix", runs, inputs=("data/enterprise-attack.json",)),
+        _stage("broken", runs, fail=True),
+        _stage("after", runs),
+    ]
+    outcomes = _run(tmp_path, stages)
+    assert outcomes == {"needs-stix": "missing input", "broken": "failed", "after": "built"}
+    # A failed stage is retried next time; the others are not.
+    assert _run(tmp_path, stages)["broken"] == "failed"
+    assert runs == ["broken", "after", "broken"]
+
+
+def test_context_parses_the_corpus_once(tmp_path, monkeypatch):
+    flames = tmp_path / "Flames"
+    flames.mkdir()
+    (flames / "H001.md").write_text(_hunt("H001", "A hypothesis.", ["T1059"], ["x"], "- Why."))
+    calls = []
+    real_parse = hunt_parser.parse_hunt_file
+    monkeypatch.setattr(hunt_parser, "parse_hunt_file", lambda *a: calls.append(a) or real_parse(*a))
+
+    ctx = BuildContext(root=tmp_path)
+    assert [h["id"] for h in ctx.hunts] == ["H001"]
+    assert ctx.hunts[0]["submitter"]["name"] == "Tester"
+    assert list(ctx.parsed) == [build_all.Path("Flames/H001.md")]
+    assert len(calls) == 1
+
+
+def test_stage_inputs_cover_their_producing_script():
+    for stage in build_all.STAGES:
+        if stage.inputs:
+            assert any(p.startswith("scripts/") for p in stage.inputs), stage.name
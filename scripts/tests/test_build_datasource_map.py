@@ -0,0 +1,97 @@
+"""Tests for STIX-derived data-source coverage in build_datasource_map."""
+
+import json
+
+from scripts.build_datasource_map import (
+    MANUAL_TECHNIQUE_MAP,
+    build_detects_index,
+    build_stix_mapping,
+    derive_technique_map,
+    hunt_technique_ids,
+    normalized_manual_map,
+)
+
+
+def _technique(stix_id: str, ext_id: str) -> dict:
+    return {
+        "type": "attack-pattern",
+        "id": stix_id,
+        "external_references": [{"source_name": "mitre-attack", "external_id": ext_id}],
+    }
+
+
+def _bundle() -> list[dict]:
+    return [
+        _technique("attack-pattern--1", "T1059"),
+        _technique("attack-pattern--2", "T9001"),
+        {"type": "x-mitre-data-source", "id": "x-mitre-data-source--p", "name": "Process"},
+        {"type": "x-mitre-data-source", "id": "x-mitre-data-source--n", "name": "Network Traffic"},
+        {
+            "type": "x-mitre-data-component",
+            "id": "x-mitre-data-component--pc",
+            "name": "Process Creation",
+            "x_mitre_data_source_ref": "x-mitre-data-source--p",
+        },
+        {
+            "type": "x-mitre-data-component",
+            "id": "x-mitre-data-component--nf",
+            "name": "Network Traffic Flow",
+            "x_mitre_data_source_ref": "x-mitre-data-source--n",
+        },
+        {
+            "type": "relationship",
+            "relationship_type": "detects",
+            "source_ref": "x-mitre-data-component--pc",
+            "target_ref": "attack-pattern--1",
+        },
+        {
+            "type": "relationship",
+            "relationship_type": "detects",
+            "source_ref": "x-mitre-data-component--nf",
+            "target_ref": "attack-pattern--2",
+        },
+        {
+            "type": "relationship",
+            "relationship_type": "detects",
+            "revoked": True,
+            "source_ref": "x-mitre-data-component--nf",
+            "target_ref": "attack-pattern--1",
+        },
+    ]
+
+
+def test_detects_index_resolves_component_to_data_source():
+    index = build_detects_index(_bundle())
+    assert index == {"T1059": {"Process"}, "T9001": {"Network Traffic"}}
+
+
+def test_subtechnique_inherits_parent_data_sources():
+    index = build_detects_index(_bundle())
+    derived = derive_technique_map(["T1059.999", "T9001", "T0000"], index)
+    assert derived == {"T1059.999": ["endpoint"], "T9001": ["network"]}
+
+
+def test_manual_map_is_keyed_by_dotted_ids_only():
+    manual = normalized_manual_map()
+    assert all("_" not in tid for tid in manual)
+    assert manual["T1070.004"] == ["endpoint"]
+    assert "T1036_005" in MANUAL_TECHNIQUE_MAP and "T1036.005" in manual
+
+
+def test_hunt_technique_ids_normalizes_tags():
+    hunts = [{"techniques": ["T1110"], "tags": ["persistence", "T1070_004"]}]
+    assert hunt_technique_ids(hunts) == {"T1110", "T1070.004"}
+
+
+def test_stix_mapping_layers_manual_overrides(tmp_path):
+    stix = tmp_path / "enterprise-attack.json"
+    stix.write_text(json.dumps({"objects": _bundle()}))
+    hunts = [{"techniques": ["T1059", "T9001"], "tags": []}]
+    mapping = build_stix_mapping(hunts, stix)
+    by_cat = {c["id"]: set(c["techniques"]) for c in mapping["categories"]}
+    # Derived from STIX: no manual entry exists for T9001.
+    assert "T9001" in by_cat["network"]
+    # Manual entry for T1059 (["endpoint"]) wins over the derived one.
+    assert "T1059" in by_cat["endpoint"]
+    # Every manual technique still appears even if no hunt references it.
+    assert "T1110" in by_cat["identity"]
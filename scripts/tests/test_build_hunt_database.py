@@ -0,0 +1,269 @@
+"""Tests for the SQLite hunt index built by scripts/build_hunt_database.py."""
+
+import os
+import sqlite3
+
+import pytest
+
+import scripts.build_hunt_database as db
+
+
+def _hunt(hunt_id, hypothesis, techniques, tags, why, tactics=("Execution",)) -> str:
+    return (
+        "---\n"
+        f"id: {hunt_id}\n"
+        "category: Flames\n"
+        f"hypothesis: {hypothesis}\n"
+        "tactics:\n" + "".join(f"  - {t}\n" for t in tactics)
+        +         "techniques:\n" + "".join(f"  - {t}\n" for t in techniques)
+        + "tags:\n" + "".join(f"  - {t}\n" for t in tags)
+        + "submitter:\n  name: Tester\n"
+        "---\n\n"
+        f"## Why\n\n{why}\n\n"
+        "## References\n\n- https://attack.mitre.org/\n"
+    )
+
+
+@pytest.fixture
+def corpus(tmp_path, monkeypatch):
+    # No git history for tmp files; skip the per-file git subprocesses.
+    monkeypatch.setattr(db, "get_git_dates", lambda path: (None, None))
+    flames = tmp_path / "Flames"
+    flames.mkdir()
+    (flames / "H001.md").write_text(_hunt(
+        "H001", "Adversaries run encoded PowerShell from Office macros.",
+        ["T1059.001"], ["powershell", "macros"], "- Encoded commands hide intent from defenders."))
+    (flames / "H002.md").write_text(_hunt(
+        "H002", "Threat actors tunnel C2 traffic over DNS TXT records.",
+        ["T1071.004"], ["dns", "tunneling"], "- DNS is rarely inspected at the payload level.",
+        tactics=["Command and Control", "Exfiltration"]))
+    (flames / "H003.md").write_text(_hunt(
+        "H003", "Attackers launch cmd.exe from unusual parents.",
+        ["T1059", "T1059.003"], ["cmd"], "- Interpreter abuse is common."))
+    return flames
+
+
+@pytest.fixture
+def conn():
+    connection = sqlite3.connect(":memory:")
+    db.create_database_schema(connection)
+    yield connection
+    connection.close()
+
+
+def test_search_ranks_and_snippets(corpus, conn):
+    db.scan_and_update_hunts(conn, [str(corpus)], verbose=False)
+    results = db.search_hunts(conn, "powershell")
+    assert [r["hunt_id"] for r in results] == ["H001"]
+    assert "[" in results[0]["snippet"]
+
+
+def test_search_covers_why_and_techniques(corpus, conn):
+    db.scan_and_update_hunts(conn, [str(corpus)], verbose=False)
+    assert [r["hunt_id"] for r in db.search_hunts(conn, "inspected")] == ["H002"]
+    # Punctuated technique IDs are quoted rather than rejected as FTS syntax.
+    assert [r["hunt_id"] for r in db.search_hunts(conn, "T1071.004")] == ["H002"]
+
+
+def test_fts_follows_updates_and_deletes(corpus, conn):
+    db.scan_and_update_hunts(conn, [str(corpus)], verbose=False)
+    (corpus / "H001.md").write_text(_hunt(
+        "H001", "Adversaries abuse WMI event subscriptions for persistence.",
+        ["T1546.003"], ["wmi"], "- Fileless persistence survives reboots."))
+    stats = db.scan_and_update_hunts(conn, [str(corpus)], verbose=False)
+    assert stats["updated"] == 1
+    assert db.search_hunts(conn, "powershell") == []
+    assert [r["hunt_id"] for r in db.search_hunts(conn, "wmi")] == ["H001"]
+
+    (corpus / "H002.md").unlink()
+    stats = db.scan_and_update_hunts(conn, [str(corpus)], verbose=False)
+    assert stats["deleted"] == 1
+    assert db.search_hunts(conn, "dns") == []
+    assert conn.execute("SELECT COUNT(*) FROM hunts_fts").fetchone()[0] == 2
+
+
+def _ids(rows):
+    return [r["hunt_id"] for r in rows]
+
+
+def test_relation_tables_hold_every_value(corpus, conn):
+    db.scan_and_update_hunts(conn, [str(corpus)], verbose=False)
+    rows = conn.execute(
+        "SELECT h.hunt_id, t.technique, t.parent_technique FROM hunt_techniques t "
+        "JOIN hunts h ON h.id = t.hunt_rowid ORDER BY 1, 2"
+    ).fetchall()
+    assert ("H003", "T1059", "T1059") in rows
+    assert ("H003", "T1059.003", "T1059") in rows
+    assert _ids(db.find_hunts(conn, tactic="Exfiltration")) == ["H002"]
+    assert _ids(db.find_hunts(conn, tag="#cmd")) == ["H003"]
+
+
+def test_find_hunts_technique_family_and_intersection(corpus, conn):
+    db.scan_and_update_hunts(conn, [str(corpus)], verbose=False)
+    assert _ids(db.find_hunts(conn, technique="T1059.*")) == ["H001", "H003"]
+    assert _ids(db.find_hunts(conn, technique="T1059")) == ["H003"]
+    assert _ids(db.find_hunts(conn, technique="T1059.*", tag="powershell")) == ["H001"]
+    assert db.find_hunts(conn, technique="T1059.*", tactic="Exfiltration") == []
+
+
+def test_find_hunts_uses_covering_indexes(corpus, conn):
+    plan = " ".join(row[-1] for row in conn.execute(
+        "EXPLAIN QUERY PLAN SELECT hunt_rowid FROM hunt_techniques WHERE parent_technique = ?",
+        ("T1059",),
+    ))
+    assert "COVERING INDEX idx_hunt_techniques_parent" in plan
+
+
+def test_relations_follow_updates_and_deletes(corpus, conn):
+    db.scan_and_update_hunts(conn, [str(corpus)], verbose=False)
+    (corpus / "H003.md").write_text(_hunt(
+        "H003", "Attackers launch cmd.exe from unusual parents.",
+        ["T1106"], ["native_api"], "- Interpreter abuse is common."))
+    (corpus / "H002.md").unlink()
+    db.scan_and_update_hunts(conn, [str(corpus)], verbose=False)
+    assert _ids(db.find_hunts(conn, technique="T1059.*")) == ["H001"]
+    assert _ids(db.find_hunts(conn, tag="native_api")) == ["H003"]
+    for table in db.RELATION_TABLES:
+        orphans = conn.execute(
+            f"SELECT COUNT(*) FROM {table} WHERE hunt_rowid NOT IN (SELECT id FROM hunts)"
+        ).fetchone()[0]
+        assert orphans == 0
+
+
+def test_unchanged_files_are_skipped(corpus, conn):
+    db.scan_and_update_hunts(conn, [str(corpus)], verbose=False)
+    stats = db.scan_and_update_hunts(conn, [str(corpus)], verbose=False)
+    assert stats["skipped"] == 3 and stats["added"] == 0
+
+
+def test_unchanged_stat_skips_hashing(corpus, conn, monkeypatch):
+    db.scan_and_update_hunts(conn, [str(corpus)], verbose=False)
+
+    def fail(path):
+        raise AssertionError(f"hashed {path}")
+
+    monkeypatch.setattr(db, "get_file_hash", fail)
+    stats = db.scan_and_update_hunts(conn, [str(corpus)], verbose=False)
+    assert stats["skipped"] == 3 and stats["errors"] == 0
+
+
+def test_touched_file_is_hashed_once_then_skipped(corpus, conn, monkeypatch):
+    db.scan_and_update_hunts(conn, [str(corpus)], verbose=False)
+    path = corpus / "H001.md"
+    stat = path.stat()
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10**9))
+
+    hashed = []
+    real_hash = db.get_file_hash
+    monkeypatch.setattr(db, "get_file_hash", lambda p: hashed.append(p) or real_hash(p))
+    stats = db.scan_and_update_hunts(conn, [str(corpus)], verbose=False)
+    assert len(hashed) == 1 and stats["updated"] == 0 and stats["skipped"] == 3
+
+    db.scan_and_update_hunts(conn, [str(corpus)], verbose=False)
+    assert len(hashed) == 1
+
+
+def _recount(conn):
+    """The stats_* contents, recomputed from scratch with GROUP BY."""
+    return {
+        "stats_tactic": "SELECT tactic, COUNT(*) FROM hunt_tactics GROUP BY 1",
+        "stats_technique": "SELECT technique, COUNT(*) FROM hunt_techniques GROUP BY 1",
+        "stats_submitter": "SELECT submitter, COUNT(*) FROM hunts GROUP BY 1",
+        "stats_category": "SELECT category, COUNT(*) FROM hunts GROUP BY 1",
+        "stats_month": "SELECT substr(created_date, 1, 7), COUNT(*) FROM hunts "
+                       "WHERE created_date IS NOT NULL GROUP BY 1",
+    }
+
+
+def _assert_stats_consistent(conn):
+    for table, sql in _recount(conn).items():
+        assert dict(conn.execute(f"SELECT * FROM {table}")) == dict(conn.execute(sql)), table
+
+
+def test_stats_tables_track_every_change(corpus, conn, monkeypatch):
+    months = {"H001.md": "2025-01-05", "H002.md": "2025-02-10", "H003.md": "2025-02-11"}
+    monkeypatch.setattr(db, "get_git_dates", lambda path: (months.get(path.name), None))
+    db.scan_and_update_hunts(conn, [str(corpus)], verbose=False)
+    _assert_stats_consistent(conn)
+    assert dict(conn.execute("SELECT * FROM stats_month")) == {"2025-01": 1, "2025-02": 2}
+    assert dict(conn.execute("SELECT * FROM stats_category")) == {"Flames": 3}
+
+    (corpus / "H003.md").write_text(_hunt(
+        "H003", "Attackers launch cmd.exe from unusual parents.",
+        ["T1106"], ["native_api"], "- Interpreter abuse is common.", tactics=["Execution"]))
+    (corpus / "H002.md").unlink()
+    db.scan_and_update_hunts(conn, [str(corpus)], verbose=False)
+    _assert_stats_consistent(conn)
+    assert conn.execute("SELECT hunts FROM stats_tactic WHERE tactic = 'Exfiltration'").fetchone() is None
+    assert dict(conn.execute("SELECT * FROM stats_technique")) == {"T1059.001": 1, "T1106": 1}
+
+
+def test_moved_file_updates_path(corpus, conn):
+    db.scan_and_update_hunts(conn, [str(corpus)], verbose=False)
+    embers = corpus.parent / "Embers"
+    embers.mkdir()
+    (corpus / "H002.md").rename(embers / "H002.md")
+    stats = db.scan_and_update_hunts(conn, [str(corpus), str(embers)], verbose=False)
+    assert stats["updated"] == 1 and stats["deleted"] == 0
+    path = conn.execute("SELECT file_path FROM hunts WHERE hunt_id = 'H002'").fetchone()[0]
+    assert path == str(embers / "H002.md")
+
+
+def test_unparseable_file_keeps_its_row(corpus, conn):
+    db.scan_and_update_hunts(conn, [str(corpus)], verbose=False)
+    (corpus / "H002.md").write_text("---\nid: [broken\n---\n")
+    stats = db.scan_and_update_hunts(conn, [str(corpus)], verbose=False)
+    assert stats["errors"] == 1 and stats["deleted"] == 0
+    assert _ids(db.find_hunts(conn, tag="dns")) == ["H002"]
+
+
+def test_file_database_uses_wal(tmp_path, corpus):
+    connection = sqlite3.connect(tmp_path / "hunts.db")
+    db.configure_connection(connection)
+    db.create_database_schema(connection)
+    db.scan_and_update_hunts(connection, [str(corpus)], verbose=False)
+    assert connection.execute("PRAGMA journal_mode").fetchone()[0] == "wal"
+    assert connection.execute("SELECT COUNT(*) FROM hunts").fetchone()[0] == 3
+    connection.close()
+
+
+def test_fresh_checkout_leaves_committed_database_unchanged(tmp_path, corpus):
+    def scan():
+        connection = sqlite3.connect(tmp_path / "hunts.db")
+        db.configure_connection(connection)
+        db.create_database_schema(connection)
+        stats = db.scan_and_update_hunts(connection, [str(corpus)], verbose=False)
+        connection.close()
+        return stats
+
+    scan()
+    committed = (tmp_path / "hunts.db").read_bytes()
+    for path in corpus.glob("*.md"):
+        stat = path.stat()
+        os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10**9))
+    (tmp_path / "hunts-stat.db").unlink()  # not committed, so absent after checkout
+
+    assert scan()["skipped"] == 3
+    assert (tmp_path / "hunts.db").read_bytes() == committed
+    cached = sqlite3.connect(tmp_path / "hunts-stat.db")
+    assert cached.execute("SELECT COUNT(*) FROM file_stats").fetchone()[0] == 3
+    cached.close()
+
+
+def test_outdated_schema_is_dropped_and_rebuilt(tmp_path):
+    path = tmp_path / "hunts.db"
+    old = sqlite3.connect(path)
+    old.execute("CREATE TABLE hunts (id INTEGER PRIMARY KEY, filename TEXT)")
+    old.execute("CREATE TABLE metadata (key TEXT PRIMARY KEY, value TEXT)")
+    old.execute("INSERT INTO hunts (filename) VALUES ('H001.md')")
+    old.commit()
+    db.create_database_schema(old)
+    assert old.execute("SELECT COUNT(*) FROM hunts").fetchone()[0] == 0
+    version = old.execute("SELECT value FROM metadata WHERE key = 'schema_version'").fetchone()[0]
+    assert int(version) == db.SCHEMA_VERSION
+    old.close()
+
+
+def test_fts_query_quotes_punctuation():
+    assert db._fts_query("cmd.exe OR rundll32*") == '"cmd.exe" OR rundll32*'
+    assert db._fts_query('"exact phrase" T1059.001') == '"exact phrase" "T1059.001"'
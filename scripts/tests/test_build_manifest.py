@@ -0,0 +1,78 @@
+"""Tests for public/build-manifest.json bookkeeping in scripts/build_manifest.py."""
+
+import json
+
+import pytest
+
+import scripts.build_manifest as bm
+from scripts.build_manifest import Artifact, Manifest
+
+ART = Artifact("thing", ("in/*.txt", "scripts/make_thing.py"), ("out/thing.json",))
+
+
+@pytest.fixture
+def tree(tmp_path, monkeypatch):
+    monkeypatch.setitem(bm.ARTIFACTS, "thing", ART)
+    for rel, text in {
+        "in/a.txt": "a",
+        "scripts/make_thing.py": "v1",
+        "out/thing.json": "{}",
+    }.items():
+        (tmp_path / rel).parent.mkdir(parents=True, exist_ok=True)
+        (tmp_path / rel).write_text(text)
+    manifest = Manifest(tmp_path)
+    manifest.record(ART)
+    manifest.save()
+    return tmp_path
+
+
+def _status(root, extra=None):
+    return Manifest(root).status(ART, extra)
+
+
+def test_fresh_after_record(tree):
+    assert _status(tree) is None
+    entry = json.loads((tree / bm.MANIFEST).read_text())["thing"]
+    assert sorted(entry) == ["extra", "inputs", "outputs", "script"]
+    assert list(entry["outputs"]) == ["out/thing.json"]
+
+
+@pytest.mark.parametrize(
+    "edit, reason",
+    [
+        (lambda t: (t / "in/a.txt").write_text("b"), "inputs changed"),
+        (lambda t: (t / "in/new.txt").write_text("n"), "inputs changed"),
+        (lambda t: (t / "scripts/make_thing.py").write_text("v2"), "script changed"),
+        (lambda t: (t / "out/thing.json").write_text("[]"), "output modified out/thing.json"),
+        (lambda t: (t / "out/thing.json").unlink(), "missing output out/thing.json"),
+        (lambda t: (t / "scripts/make_thing.py").unlink(), "missing input scripts/make_thing.py"),
+    ],
+)
+def test_stale_reasons(tree, edit, reason):
+    edit(tree)
+    assert _status(tree) == reason
+
+
+def test_extra_inputs_are_recorded_and_checked(tree):
+    (tree / "data").mkdir()
+    (tree / "data/extra.json").write_text("1")
+    assert _status(tree, ("data/extra.json",)) == "options changed"
+
+    manifest = Manifest(tree)
+    manifest.record(ART, ("data/extra.json",))
+    manifest.save()
+    assert _status(tree) is None
+    (tree / "data/extra.json").write_text("2")
+    assert _status(tree) == "inputs changed"
+
+
+def test_check_cli(tree, monkeypatch, capsys):
+    monkeypatch.setattr(bm, "REPO_ROOT", tree)
+    assert bm.main(["--check", "thing"]) == 0
+    (tree / "in/a.txt").write_text("b")
+    assert bm.main(["--check", "thing"]) == 1
+    assert "inputs changed" in capsys.readouterr().out
+
+
+def test_unknown_artifacts_are_never_built(tmp_path):
+    assert Manifest(tmp_path).status("hunts-data") == "never built"
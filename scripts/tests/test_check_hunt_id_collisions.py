@@ -1,5 +1,9 @@
 """Tests for identity extraction used by the hunt-ID collision check."""
 
+import subprocess
+
+import pytest
+
 from scripts import check_hunt_id_collisions as collisions
 from scripts.check_hunt_id_collisions import extract_identity
 
@@ -71,3 +75,64 @@ def test_main_fails_closed_when_origin_main_empty(monkeypatch, capsys):
     monkeypatch.setattr(collisions, "_git", lambda *args: "")
     assert collisions.main() == 1
     assert "no hunts on origin/main" in capsys.readouterr().out
+
+
+def _git(repo, *args):
+    return subprocess.run(["git", *args], cwd=repo, check=True,
+                          capture_output=True, text=True).stdout.strip()
+
+
+@pytest.fixture
+def repo(tmp_path, monkeypatch):
+    """A repo whose ``main`` holds H210 (legacy) and H211; the PR branches off it."""
+    _git(tmp_path, "init", "-q", "-b", "main")
+    _git(tmp_path, "config", "user.email", "t@example.com")
+    _git(tmp_path, "config", "user.name", "t")
+    (tmp_path / "Flames").mkdir()
+    (tmp_path / "Flames" / "H210.md").write_text(LEGACY_H210)
+    (tmp_path / "Flames" / "H211.md").write_text(LEGACY_H210.replace("H210", "H211"))
+    _git(tmp_path, "add", "-A")
+    _git(tmp_path, "commit", "-q", "-m", "main")
+    _git(tmp_path, "checkout", "-q", "-b", "pr")
+    monkeypatch.chdir(tmp_path)
+    return tmp_path
+
+
+def _commit(repo, message="pr"):
+    _git(repo, "add", "-A")
+    _git(repo, "commit", "-q", "-m", message)
+    return _git(repo, "rev-parse", "HEAD")
+
+
+def test_checks_a_head_from_its_objects_alone(repo):
+    (repo / "Flames" / "H210.md").write_text(FRONTMATTER_H210_OVERWRITE)
+    (repo / "Flames" / "H300.md").write_text(FRONTMATTER_H210_OVERWRITE)
+    head = _commit(repo)
+    # Main moves on, and the working tree goes back to main: only objects count.
+    _git(repo, "checkout", "-q", "main")
+    (repo / "Flames" / "H300.md").write_text(LEGACY_H210.replace("H210", "H300"))
+    _commit(repo, "main adds H300")
+
+    problems = collisions.collision_problems(head, base="main")
+    assert len(problems) == 3
+    assert any("H300.md: hunt ID 'H300' already exists on main" in p for p in problems)
+    assert any("H300.md: declared ID 'H210'" in p for p in problems)
+    assert any("changes its submitter ('th3CyF0x' -> 'Joshua Strickland')" in p
+               for p in problems)
+
+
+def test_a_hunt_renamed_onto_a_taken_id_counts_as_added(repo):
+    _git(repo, "mv", "Flames/H211.md", "Flames/H210-copy.md")
+    head = _commit(repo)
+    _git(repo, "checkout", "-q", "main")
+    _git(repo, "mv", "Flames/H211.md", "Flames/H210-copy.md")
+    _commit(repo, "main takes the name")
+    problems = collisions.collision_problems(head, base="main")
+    assert any("'H210-copy' already exists on main" in p for p in problems)
+
+
+def test_clean_head_passes(repo, capsys):
+    (repo / "Flames" / "H212.md").write_text(LEGACY_H210.replace("H210", "H212"))
+    head = _commit(repo)
+    assert collisions.main(head, base="main") == 0
+    assert "passed" in capsys.readouterr().out
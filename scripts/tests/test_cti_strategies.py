@@ -0,0 +1,103 @@
+"""Per-domain extraction strategy memory: shortcuts, re-probing, time saved."""
+
+import pytest
+
+from scripts import cti_strategies
+from scripts.cti_strategies import NONE, REPROBE_AFTER, REPROBE_EVERY, StrategyMemory, run_ladder
+
+ARTICLE = "word " * 150
+
+
+class _Ladder:
+    """Fake steps that cost fixed (fake) seconds and succeed on demand."""
+
+    COST = {"plain": 0.1, "js": 1.0, "browser": 30.0}
+
+    def __init__(self, monkeypatch, working=(), texts=None):
+        self.clock = 0.0
+        self.calls = []
+        self.working = set(working)
+        self.texts = texts or {}
+        monkeypatch.setattr(cti_strategies.time, "perf_counter", lambda: self.clock)
+
+    def steps(self):
+        return {name: (lambda name=name: self._run(name)) for name in self.COST}
+
+    def _run(self, name):
+        self.calls.append(name)
+        self.clock += self.COST[name]
+        if name in self.texts:
+            return self.texts[name]
+        return ARTICLE if name in self.working else "blocked"
+
+
+@pytest.fixture
+def memory(tmp_path):
+    with StrategyMemory(tmp_path / "cache.db") as memory:
+        yield memory
+
+
+def test_known_domain_goes_straight_to_the_winner(memory, monkeypatch):
+    ladder = _Ladder(monkeypatch, working={"browser"})
+    url = "https://www.vendor.example/blog/{}"
+    assert run_ladder(url.format(1), ladder.steps(), memory) == (ARTICLE, "browser")
+    assert ladder.calls == ["plain", "js", "browser"]
+
+    ladder.calls.clear()
+    assert run_ladder(url.format(2), ladder.steps(), memory) == (ARTICLE, "browser")
+    assert ladder.calls == ["browser"]
+    assert memory.report() == [("vendor.example", "browser", 2, pytest.approx(1.1))]
+
+
+def test_a_failed_shortcut_relearns_the_domain(memory, monkeypatch):
+    ladder = _Ladder(monkeypatch, working={"browser"})
+    run_ladder("https://a.example/1", ladder.steps(), memory)
+    ladder.working = {"plain"}  # the site dropped its bot challenge
+    ladder.calls.clear()
+    assert run_ladder("https://a.example/2", ladder.steps(), memory) == (ARTICLE, "plain")
+    assert ladder.calls == ["browser", "plain"]
+    assert memory.plan("https://a.example/3") == "plain"
+
+
+def test_hard_domains_skip_the_heavy_steps(memory, monkeypatch):
+    ladder = _Ladder(monkeypatch)
+    text, strategy = run_ladder("https://hard.example/1", ladder.steps(), memory, heavy=("browser",))
+    assert (text, strategy) == ("blocked", NONE)
+    ladder.calls.clear()
+    run_ladder("https://hard.example/2", ladder.steps(), memory, heavy=("browser",))
+    assert ladder.calls == ["plain", "js"]
+    assert memory.report()[0][3] == pytest.approx(30.0)
+
+
+def test_a_short_article_that_beats_plain_is_not_a_hard_domain(memory, monkeypatch):
+    short = "word " * 50
+    ladder = _Ladder(monkeypatch, texts={"plain": "enable javascript to continue please", "js": short})
+    url = "https://short.example/{}"
+    assert run_ladder(url.format(1), ladder.steps(), memory, heavy=("browser",)) == (short, "js")
+    assert ladder.calls == ["plain", "js"]
+    assert memory.plan(url.format(2)) == "js"
+
+    # The shortcut is short too, so plain runs to confirm js still beats it.
+    ladder.calls.clear()
+    assert run_ladder(url.format(2), ladder.steps(), memory, heavy=("browser",)) == (short, "js")
+    assert ladder.calls == ["js", "plain"]
+    assert memory.report() == [("short.example", "js", 2, pytest.approx(0.0))]
+
+
+def test_reprobes_after_enough_uses_or_time(memory):
+    url = "https://b.example/x"
+    memory.record(url, "js", 1.1, probed=True, now=0)
+    for _ in range(REPROBE_EVERY - 1):
+        memory.record(url, "js", 1.0, probed=False)
+    assert memory.plan(url, now=1) == "js"
+    memory.record(url, "js", 1.0, probed=False)
+    assert memory.plan(url, now=1) is None
+
+    memory.record(url, "js", 1.1, probed=True, now=0)
+    assert memory.plan(url, now=REPROBE_AFTER - 1) == "js"
+    assert memory.plan(url, now=REPROBE_AFTER) is None
+
+
+def test_domain_of():
+    assert cti_strategies.domain_of("https://WWW.Example.com:8443/a?b") == "example.com"
+    assert cti_strategies.domain_of("https://blog.example.com/") == "blog.example.com"
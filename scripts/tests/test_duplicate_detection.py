@@ -51,6 +51,14 @@ def test_tags_are_deduplicated_and_sorted():
     assert extract_hunt_info(content, "X.md", "X.md")["tags"] == ["#alpha", "#zeta"]
 
 
+def test_tactic_cell_keeps_its_position_past_empty_cells_and_code_spans():
+    header = "| Hunt # | Idea / Hypothesis | Tactic | Notes | Tags | Submitter |\n|---|---|---|---|---|---|\n"
+    empty = "Hypothesis.\n\n" + header + "| H1 | | Exfiltration | n | #x | t |\n"
+    assert extract_hunt_info(empty, "X.md", "X.md")["tactic"] == "Exfiltration"
+    code = "Hypothesis.\n\n" + header + "| H1 | Run `a | b` | Execution | n | #x | t |\n"
+    assert extract_hunt_info(code, "X.md", "X.md")["tactic"] == "Execution"
+
+
 def test_missing_tactic_does_not_crash():
     # Hunts without the standard table still need to be comparable; tactic
     # just comes back empty and is rendered as "Unknown" in the prompt.
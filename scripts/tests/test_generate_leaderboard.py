@@ -0,0 +1,64 @@
+"""Tests for the hunts.db-backed contributors leaderboard."""
+
+import pytest
+
+import scripts.build_hunt_database as db
+import scripts.generate_leaderboard as lb
+from scripts.tests.test_build_hunt_database import _hunt
+
+
+def _write(directory, hunt_id, submitter):
+    text = _hunt(hunt_id, f"Hypothesis {hunt_id}.", ["T1059"], ["x"], "- Why.")
+    (directory / f"{hunt_id}.md").write_text(
+        text.replace("submitter:\n  name: Tester\n", f"submitter:\n  name: '{submitter}'\n")
+    )
+
+
+@pytest.fixture
+def corpus(tmp_path, monkeypatch):
+    monkeypatch.setattr(db, "get_git_dates", lambda path: (None, None))
+    flames = tmp_path / "Flames"
+    flames.mkdir()
+    _write(flames, "H001", "Ada")
+    _write(flames, "H002", "@p-o-s-t")
+    _write(flames, "H003", "p-o-s-t")
+    _write(flames, "H004", "hearth-auto-intel")
+    _write(flames, "H005", "_No response_")
+    _write(flames, "H006", "Bea")
+    return flames
+
+
+def _table(path):
+    return [line for line in path.read_text().splitlines() if line.startswith("| ") and line[2].isdigit()]
+
+
+def test_counts_use_canonical_names_and_skip_non_people(tmp_path, corpus):
+    out = tmp_path / "Contributors.md"
+    lb.generate_leaderboard(tmp_path / "hunts.db", [str(corpus)], out)
+    assert _table(out) == [
+        "| 1 | p-o-s-t | 2 |",
+        "| 2 | Ada | 1 |",
+        "| 3 | Bea | 1 |",
+    ]
+
+
+def test_reruns_are_incremental(tmp_path, corpus, monkeypatch):
+    out = tmp_path / "Contributors.md"
+    lb.generate_leaderboard(tmp_path / "hunts.db", [str(corpus)], out)
+    _write(corpus, "H006", "Ada")
+    lb.generate_leaderboard(tmp_path / "hunts.db", [str(corpus)], out)
+    assert _table(out)[0] == "| 1 | Ada | 2 |"
+
+    parsed = []
+    monkeypatch.setattr(db, "extract_hunt_info", lambda *args: parsed.append(args))
+    lb.generate_leaderboard(tmp_path / "hunts.db", [str(corpus)], out)
+    assert parsed == []
+    assert _table(out)[0] == "| 1 | Ada | 2 |"
+
+
+def test_ties_are_ordered_by_name_ignoring_case(tmp_path, corpus):
+    _write(corpus, "H007", "alan")
+    _write(corpus, "H008", "Zed")
+    out = tmp_path / "Contributors.md"
+    lb.generate_leaderboard(tmp_path / "hunts.db", [str(corpus)], out)
+    assert [row.split(" | ")[1] for row in _table(out)] == ["p-o-s-t", "Ada", "alan", "Bea", "Zed"]
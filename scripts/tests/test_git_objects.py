@@ -0,0 +1,29 @@
+"""GitObjectReader reads blobs through one cat-file process."""
+
+import subprocess
+
+from scripts.git_objects import GitObjectReader
+
+
+def test_reads_blobs_by_name_and_reports_missing(tmp_path):
+    def git(*args):
+        return subprocess.run(["git", *args], cwd=tmp_path, check=True,
+                              capture_output=True, text=True).stdout.strip()
+
+    git("init", "-q")
+    (tmp_path / "a.md").write_bytes(b"line one\nline two\n\n")
+    (tmp_path / "b.bin").write_bytes(bytes(range(256)))
+    git("add", "-A")
+    git("-c", "user.email=t@example.com", "-c", "user.name=t", "commit", "-q", "-m", "x")
+    blob = git("rev-parse", "HEAD:a.md")
+
+    with GitObjectReader(cwd=tmp_path) as objects:
+        assert objects.read("HEAD:a.md") == b"line one\nline two\n\n"
+        assert objects.read("HEAD:b.bin") == bytes(range(256))
+        assert objects.read("HEAD:nope.md") is None
+        # "HEAD:no such.md missing" splits into three tokens, like a found object.
+        assert objects.read("HEAD:no such.md") is None
+        assert objects.read("HEAD:Flames/no such hunt.md") is None
+        assert objects.read("HEAD:a.md") == b"line one\nline two\n\n"  # still in step
+        assert objects.text(blob) == "line one\nline two\n\n"
+        assert objects.text("HEAD:nope.md") == ""
@@ -0,0 +1,108 @@
+"""HTTP cache: conditional revalidation against a local server, pooled connections."""
+
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+from scripts.http_cache import HttpCache, normalize_url
+
+
+class _Handler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"  # keep-alive
+
+    def do_GET(self):
+        server = self.server
+        server.log.append((self.path, self.client_address[1],
+                           self.headers.get("If-None-Match"), self.headers.get("If-Modified-Since")))
+        page = server.pages.get(self.path)
+        if page is None:
+            status, headers, body = 404, {}, b"missing"
+        else:
+            body, headers = page
+            etag, modified = headers.get("ETag"), headers.get("Last-Modified")
+            unchanged = (
+                (etag and self.headers.get("If-None-Match") == etag)
+                or (modified and self.headers.get("If-Modified-Since") == modified)
+            )
+            status, body = (304, b"") if unchanged else (200, body)
+        self.send_response(status)
+        for name, value in {"Content-Type": "text/html; charset=utf-8", **headers}.items():
+            self.send_header(name, value)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):
+        pass
+
+
+@pytest.fixture
+def server():
+    httpd = ThreadingHTTPServer(("127.0.0.1", 0), _Handler)
+    httpd.pages, httpd.log = {}, []
+    httpd.url = f"http://127.0.0.1:{httpd.server_address[1]}"
+    thread = threading.Thread(target=httpd.serve_forever, args=(0.05,), daemon=True)
+    thread.start()
+    yield httpd
+    httpd.shutdown()
+    httpd.server_close()
+
+
+def test_etag_revalidation_replays_the_body_and_keeps_extracted_text(server, tmp_path):
+    server.pages["/a"] = (b"<p>v1</p>", {"ETag": '"v1"'})
+    with HttpCache(tmp_path / "http.db") as cache:
+        first = cache.get(f"{server.url}/a")
+        assert (first.status_code, first.text, first.from_cache) == (200, "<p>v1</p>", False)
+        cache.store_extracted_text(f"{server.url}/a", "v1 text")
+
+        again = cache.get(f"{server.url}/a#section")  # same normalized key
+        assert (again.status_code, again.text, again.from_cache) == (200, "<p>v1</p>", True)
+        assert again.headers["content-type"] == "text/html; charset=utf-8"
+        assert cache.extracted_text(f"{server.url}/a") == "v1 text"
+
+        server.pages["/a"] = (b"<p>v2</p>", {"ETag": '"v2"'})
+        changed = cache.get(f"{server.url}/a")
+        assert (changed.text, changed.from_cache) == ("<p>v2</p>", False)
+        assert cache.extracted_text(f"{server.url}/a") is None  # stale text dropped
+
+    assert [entry[2] for entry in server.log] == [None, '"v1"', '"v1"']
+    # Every request went over one pooled keep-alive connection.
+    assert len({entry[1] for entry in server.log}) == 1
+
+
+def test_last_modified_and_validator_less_sources(server, tmp_path):
+    stamp = "Wed, 01 Oct 2025 10:00:00 GMT"
+    server.pages["/dated"] = (b"dated", {"Last-Modified": stamp})
+    server.pages["/plain"] = (b"plain", {})
+    with HttpCache(tmp_path / "http.db") as cache:
+        for path in ("/dated", "/plain"):
+            cache.get(server.url + path)
+            cache.store_extracted_text(server.url + path, path)
+        assert cache.get(server.url + "/dated").from_cache
+        # No validators: the body is downloaded again, but an identical one
+        # keeps the text extracted from it.
+        assert cache.get(server.url + "/plain").from_cache
+        assert cache.extracted_text(server.url + "/plain") == "/plain"
+    assert server.log[2][3] == stamp and server.log[3][2:] == (None, None)
+
+
+def test_errors_are_not_cached_and_the_store_survives_reopening(server, tmp_path):
+    server.pages["/a"] = (b"body", {"ETag": '"1"'})
+    with HttpCache(tmp_path / "http.db") as cache:
+        assert cache.get(server.url + "/gone").status_code == 404
+        assert cache.extracted_text(server.url + "/gone") is None
+        cache.get(server.url + "/a")
+    with HttpCache(tmp_path / "http.db") as cache:
+        assert cache.get(server.url + "/a").from_cache
+    assert server.log[-1][2] == '"1"'
+
+
+@pytest.mark.parametrize("url, key", [
+    ("HTTPS://Example.COM:443/post?b=2&a=1#top", "https://example.com/post?a=1&b=2"),
+    ("http://example.com", "http://example.com/"),
+    ("http://example.com:8080/x?utm_source=feed&id=7", "http://example.com:8080/x?id=7"),
+    ("https://blog.example.com/p?ref=&fbclid=abc", "https://blog.example.com/p?ref="),
+])
+def test_normalize_url(url, key):
+    assert normalize_url(url) == key
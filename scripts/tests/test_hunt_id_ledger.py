@@ -0,0 +1,108 @@
+"""Hunt-ID ledger: reservation, reconciliation with git, and concurrent writers."""
+
+import subprocess
+from concurrent.futures import ProcessPoolExecutor
+
+from scripts.hunt_id_ledger import CLAIM_TTL, HuntIdLedger, allocate, git_numbers
+
+
+def _reserve_many(path, count):
+    with HuntIdLedger(path) as ledger:
+        return [ledger.reserve("H", owner="race") for _ in range(count)]
+
+
+def test_reserve_continues_past_everything_known(tmp_path):
+    with HuntIdLedger(tmp_path / "ids.db") as ledger:
+        assert ledger.reserve("H") == 1
+        ledger.reconcile("H", {1, 2, 7}, {9: "issue-4"})
+        assert ledger.reserve("H", owner="issue-5") == 10
+        assert ledger.reserve("B") == 1  # categories are independent
+        assert ledger.state("H", 9) == ("claimed", "issue-4")
+        assert ledger.state("H", 10) == ("claimed", "issue-5")
+        assert ledger.state("H", 7) == ("allocated", "")
+
+
+def test_reconcile_releases_stale_claims_without_filling_gaps(tmp_path):
+    with HuntIdLedger(tmp_path / "ids.db") as ledger:
+        ledger.reconcile("H", {1}, {5: "issue-4", 6: "issue-8"})
+        # Issue 4's draft closed; 6 landed on main.
+        ledger.reconcile("H", {1, 6}, {})
+        assert ledger.state("H", 5) == ("released", "issue-4")
+        assert ledger.state("H", 6) == ("allocated", "")
+        assert ledger.next_number("H") == 7
+        ledger.claim("H", 6, owner="issue-9")  # never downgrades an allocated number
+        assert ledger.state("H", 6) == ("allocated", "")
+
+
+def test_concurrent_processes_never_share_a_number(tmp_path):
+    path = tmp_path / "ids.db"
+    HuntIdLedger(path).close()
+    with ProcessPoolExecutor(4) as pool:
+        batches = list(pool.map(_reserve_many, [path] * 4, [25] * 4))
+    numbers = [n for batch in batches for n in batch]
+    assert sorted(numbers) == list(range(1, 101))
+
+
+def test_sync_reads_git_once_per_commit(tmp_path):
+    def git(*args):
+        subprocess.run(["git", *args], cwd=tmp_path, check=True, capture_output=True)
+
+    git("init", "-q")
+    for name in ("Flames/H001.md", "Flames/H041.md", "Embers/B007.md", "Flames/notes.md"):
+        (tmp_path / name).parent.mkdir(exist_ok=True)
+        (tmp_path / name).write_text("x")
+    git("add", "-A")
+    git("-c", "user.email=t@example.com", "-c", "user.name=t", "commit", "-q", "-m", "x")
+
+    assert git_numbers("HEAD", cwd=tmp_path) == {"H": {1, 41}, "B": {7}, "M": set()}
+    with HuntIdLedger(tmp_path / "ids.db") as ledger:
+        assert ledger.sync("HEAD", cwd=tmp_path) is True
+        assert ledger.sync("HEAD", cwd=tmp_path) is False
+        assert ledger.next_number("H") == 42
+        assert ledger.next_number("B") == 8
+
+
+def test_allocate_reserves_after_syncing_head(tmp_path, monkeypatch):
+    subprocess.run(["git", "init", "-q"], cwd=tmp_path, check=True)
+    (tmp_path / "Alchemy").mkdir()
+    (tmp_path / "Alchemy" / "M003.md").write_text("x")
+    subprocess.run(["git", "add", "-A"], cwd=tmp_path, check=True)
+    subprocess.run(["git", "-c", "user.email=t@example.com", "-c", "user.name=t",
+                    "commit", "-q", "-m", "x"], cwd=tmp_path, check=True)
+    monkeypatch.chdir(tmp_path)
+    ledger = tmp_path / "ids.db"
+    assert allocate("Alchemy", owner="issue-1", path=ledger) == 4
+    assert allocate("Alchemy", owner="issue-2", path=ledger) == 5
+
+
+def test_allocate_respects_uncommitted_hunts(tmp_path, monkeypatch):
+    subprocess.run(["git", "init", "-q"], cwd=tmp_path, check=True)
+    (tmp_path / "Flames").mkdir()
+    (tmp_path / "Flames" / "H003.md").write_text("x")
+    subprocess.run(["git", "add", "-A"], cwd=tmp_path, check=True)
+    subprocess.run(["git", "-c", "user.email=t@example.com", "-c", "user.name=t",
+                    "commit", "-q", "-m", "x"], cwd=tmp_path, check=True)
+    (tmp_path / "Flames" / "H017.md").write_text("a local draft, not committed")
+    monkeypatch.chdir(tmp_path)
+    assert allocate("Flames", path=tmp_path / "ids.db") == 18
+
+
+def test_allocate_without_git_numbers_from_the_working_tree(tmp_path, monkeypatch):
+    (tmp_path / "Embers").mkdir()
+    (tmp_path / "Embers" / "B002.md").write_text("x")
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.setenv("GIT_CEILING_DIRECTORIES", str(tmp_path.parent))
+    assert allocate("Embers", path=tmp_path / "ids.db") == 3
+
+
+def test_a_run_that_never_wrote_its_file_frees_its_number(tmp_path):
+    with HuntIdLedger(tmp_path / "ids.db") as ledger:
+        ledger.reconcile("H", {1})
+        assert ledger.reserve("H", owner="issue-3", now=0) == 2
+        assert ledger.reserve("H", owner="issue-4", now=1) == 3  # 2 is still live
+        ledger.claim("H", 4, owner="draft")
+        # Both reservations lapse; the draft claim and its number hold.
+        assert ledger.next_number("H", now=CLAIM_TTL + 2) == 5
+        assert ledger.next_number("H", floor=7, now=CLAIM_TTL + 2) == 8
+        ledger.release("H", 4)
+        assert ledger.reserve("H", owner="issue-5", now=CLAIM_TTL + 2) == 2
@@ -0,0 +1,137 @@
+"""Tests for the read-only hunts.db query API in scripts/hunt_index.py."""
+
+import sqlite3
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+import scripts.build_hunt_database as db
+import scripts.duplicate_detection as dd
+from scripts.hunt_index import HuntIndex
+from scripts.tests.test_build_hunt_database import _hunt
+
+CREATED = {"H001.md": "2025-01-10T09:00:00+00:00", "H002.md": "2025-03-02T12:00:00+00:00"}
+
+
+@pytest.fixture
+def corpus(tmp_path):
+    flames = tmp_path / "Flames"
+    flames.mkdir()
+    (flames / "H001.md").write_text(_hunt(
+        "H001", "Adversaries run encoded PowerShell from Office macros.",
+        ["T1059.001"], ["powershell"], "- Encoded commands hide intent."))
+    (flames / "H002.md").write_text(_hunt(
+        "H002", "Threat actors tunnel C2 traffic over DNS TXT records.",
+        ["T1071.004", "T1059"], ["dns"], "- DNS is rarely inspected.",
+        tactics=["Command and Control", "Execution"]))
+    return flames
+
+
+@pytest.fixture
+def db_path(tmp_path, corpus, monkeypatch):
+    monkeypatch.setattr(db, "get_git_dates", lambda path: (CREATED[path.name], None))
+    path = tmp_path / "hunts.db"
+    conn = sqlite3.connect(path)
+    db.configure_connection(conn)
+    db.create_database_schema(conn)
+    db.scan_and_update_hunts(conn, [str(corpus)], verbose=False)
+    conn.close()
+    return path
+
+
+@pytest.fixture
+def index(db_path):
+    with HuntIndex(db_path) as hunt_index:
+        yield hunt_index
+
+
+def _ids(hunts):
+    return [h["hunt_id"] for h in hunts]
+
+
+def test_get_returns_full_record(index):
+    hunt = index.get("H002")
+    assert hunt["techniques"] == ["T1059", "T1071.004"]
+    assert hunt["tactics"] == ["Command and Control", "Execution"]
+    assert hunt["tags"] == ["dns"]
+    assert hunt["submitter"] == "Tester"
+    assert index.get("H404") is None
+
+
+def test_lookups(index):
+    assert _ids(index.by_technique("T1059")) == ["H002"]
+    assert _ids(index.by_technique("T1059.*")) == ["H001", "H002"]
+    assert _ids(index.by_tactic("Command and Control")) == ["H002"]
+    assert _ids(index.by_tag("#powershell")) == ["H001"]
+    assert _ids(index.by_submitter("Tester")) == ["H001", "H002"]
+    assert _ids(index.created_between("2025-02-01", "2025-04-01")) == ["H002"]
+    assert _ids(index.all()) == ["H001", "H002"]
+
+
+def test_stats(index):
+    stats = index.stats()
+    assert stats["total"] == 2
+    assert stats["tactics"] == {"Execution": 2, "Command and Control": 1}
+    assert stats["submitters"] == {"Tester": 2}
+    assert stats["categories"] == {"Flames": 2}
+    assert stats["months"] == {"2025-01": 1, "2025-03": 1}
+
+
+def test_connections_are_read_only(index):
+    with index.connection() as conn, pytest.raises(sqlite3.OperationalError):
+        conn.execute("DELETE FROM hunts")
+
+
+def test_missing_database_is_not_created(tmp_path):
+    with pytest.raises(FileNotFoundError):
+        HuntIndex(tmp_path / "missing.db")
+    assert not (tmp_path / "missing.db").exists()
+
+
+def test_pool_is_shared_across_threads(db_path):
+    with HuntIndex(db_path, pool_size=2) as index:
+        with ThreadPoolExecutor(max_workers=8) as pool:
+            results = list(pool.map(lambda _: _ids(index.by_technique("T1059.*")), range(32)))
+        assert all(r == ["H001", "H002"] for r in results)
+        assert len(index._opened) <= 2
+
+
+def test_duplicate_detection_reads_a_current_index(db_path, corpus):
+    files = sorted(corpus.glob("*.md"))
+    hunts = dd._hunts_from_index(files, db_path)
+    assert [h["filename"] for h in hunts] == ["H001.md", "H002.md"]
+    assert hunts[0]["tags"] == ["#powershell"]
+
+    (corpus / "H003.md").write_text("A hunt the index has not seen yet.\n")
+    assert dd._hunts_from_index(sorted(corpus.glob("*.md")), db_path) is None
+
+
+def test_duplicate_detection_falls_back_when_a_hunt_was_edited(db_path, corpus):
+    path = corpus / "H002.md"
+    path.write_text(path.read_text().replace("DNS TXT records", "DNS CNAME records"))
+    assert dd._hunts_from_index(sorted(corpus.glob("*.md")), db_path) is None
+
+
+def test_duplicate_detection_index_and_parse_return_the_same_records(tmp_path, corpus, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.setattr(db, "get_git_dates", lambda path: (None, None))
+    (tmp_path / "Embers").mkdir()
+    (tmp_path / "Embers" / "B001.md").write_text(_hunt(
+        "B001", "Adversaries beacon over port 443 at fixed intervals.",
+        ["T1071.001"], ["beacon"], "- Fixed intervals stand out."))
+    (corpus / "secret.md").write_text("Not a hunt.\n")
+    conn = sqlite3.connect(tmp_path / "relative.db")
+    db.create_database_schema(conn)
+    db.scan_and_update_hunts(conn, ["Flames", "Embers"], verbose=False)
+    conn.close()
+
+    from_index = dd._hunts_from_index
+    monkeypatch.setattr(dd, "_hunts_from_index",
+                        lambda files: from_index(files, tmp_path / "relative.db"))
+    indexed = dd.load_existing_hunts()
+    monkeypatch.setattr(dd, "_hunts_from_index", lambda files: None)
+    parsed = dd.load_existing_hunts()
+    assert indexed is not None
+    assert indexed == parsed
+    assert [h["filename"] for h in parsed] == ["H001.md", "H002.md", "B001.md"]
+    assert parsed[0]["hypothesis"] != "---" and parsed[0]["tactic"]
@@ -1,6 +1,20 @@
+import io
+import random
+import re
+
+import frontmatter
+
 import pytest
 
-from scripts.hunt_parser import HuntValidationError, parse_hunt_file
+from scripts.hunt_parser import (
+    HuntValidationError,
+    frontmatter_header,
+    parse_hunt_file,
+    read_frontmatter,
+    split_preamble,
+    split_sections,
+    split_table_row,
+)
 
 
 def test_parses_frontmatter_format(fixtures_dir):
@@ -219,6 +233,57 @@ def test_overlong_legacy_row_fails_closed(tmp_path):
         parse_hunt_file(f, "Flames")
 
 
+def _char_by_char_split(row):
+    """The per-character splitter split_table_row replaced, kept as the oracle."""
+    protect_code = row.count("`") % 2 == 0
+    cells, current, in_code, i = [], [], False, 0
+    while i < len(row):
+        if row[i] == "\\" and i + 1 < len(row) and row[i + 1] == "|":
+            current.append("|")
+            i += 2
+        elif row[i] == "`" and protect_code:
+            in_code = not in_code
+            current.append("`")
+            i += 1
+        elif row[i] == "|" and not in_code:
+            cells.append("".join(current).strip())
+            current = []
+            i += 1
+        else:
+            current.append(row[i])
+            i += 1
+    cells.append("".join(current).strip())
+    if cells and cells[0] == "":
+        cells = cells[1:]
+    if cells and cells[-1] == "":
+        cells = cells[:-1]
+    return cells
+
+
+def test_split_table_row_agrees_with_char_by_char_split():
+    rng = random.Random(0)
+    alphabet = "||\\``  ab\t"
+    for _ in range(5000):
+        row = "".join(rng.choice(alphabet) for _ in range(rng.randrange(30)))
+        assert split_table_row(row) == _char_by_char_split(row), repr(row)
+
+
+def test_split_table_row_keeps_384_rows_aligned():
+    row = ("| H992 | A hypothesis | Persistence | Run "
+           "`launchctl list | grep -E '(com\\.apple|com\\.google)'` to check | "
+           "#persistence #macos | [Lauren Proehl](https://x.com/jotunvillur) |")
+    cells = split_table_row(row)
+    assert cells == _char_by_char_split(row)
+    assert len(cells) == 6
+    assert cells[5] == "[Lauren Proehl](https://x.com/jotunvillur)"
+    # Empty cells hold their position; escaped pipes lose the backslash.
+    assert split_table_row("| a |  | b \\| c |") == ["a", "", "b | c"]
+    # The overlong row that must fail closed still splits into too many cells.
+    overlong = "| H994 | h | t | an | unescaped | pipe | storm | [X](x) |"
+    assert split_table_row(overlong) == _char_by_char_split(overlong)
+    assert len(split_table_row(overlong)) == 8
+
+
 def test_command_and_control_is_single_tactic(tmp_path):
     """The MITRE tactic 'Command and Control' must not split on the literal ' and '."""
     f = tmp_path / "H990.md"
@@ -270,3 +335,74 @@ def test_single_submitter_link_sets_no_links_key(tmp_path):
     hunt = parse_hunt_file(f, "Flames")
     assert hunt["submitter"]["link"] == "https://example.com/x"
     assert "links" not in hunt["submitter"]
+
+
+def test_split_sections_in_one_pass():
+    body = (
+        "Intro text is not a section.\n\n"
+        "## Why\n- Reason one.\n### Detail\nStill Why.\n\n"
+        "## Detection  \n```\n## not a heading, a shell comment\n```\n"
+        "~~~\n## nor this\n~~~\n"
+        "## Why\nA repeated heading does not replace the first.\n"
+        "## References\n- https://example.com"
+    )
+    assert split_sections(body) == {
+        "Why": "- Reason one.\n### Detail\nStill Why.",
+        "Detection": "```\n## not a heading, a shell comment\n```\n~~~\n## nor this\n~~~",
+        "References": "- https://example.com",
+    }
+
+
+def test_split_sections_agrees_with_per_heading_regex():
+    """Without code fences, each section matches the old per-heading regex scan."""
+    def regex_section(body, header):
+        match = re.search(rf"^## {re.escape(header)}\s*\n(.*?)(?=^## |\Z)", body, re.M | re.S)
+        return match.group(1).strip() if match else ""
+
+    vocab = ["## Why", "## Why  ", "## References", "##Why", "### Why", "## Notes",
+             "text", "", "  ## indented", "- item ## mid"]
+    rng = random.Random(0)
+    for _ in range(2000):
+        body = "\n".join(rng.choice(vocab) for _ in range(rng.randrange(12)))
+        sections = split_sections(body)
+        for header in ("Why", "References", "Notes"):
+            assert sections.get(header, "") == regex_section(body, header), body
+
+
+def test_split_preamble_finds_the_heading_split_sections_finds():
+    body = "Intro.\n```\n## comment\n```\n\n## Why\n- Reason.\n"
+    assert split_preamble(body) == ("Intro.\n```\n## comment\n```\n", "## Why\n- Reason.\n")
+    assert split_preamble("No headings.\n") == ("No headings.\n", "")
+
+
+def test_parsed_hunt_exposes_sections(fixtures_dir):
+    hunt = parse_hunt_file(fixtures_dir / "frontmatter_h001.md", "Flames")
+    assert list(hunt["sections"])[:2] == ["Why", "References"]
+    assert hunt["why"] == hunt["sections"]["Why"]
+
+
+@pytest.mark.parametrize("text", [
+    "---\nid: H1\ntags: [a, b]\n---\n# H1\n",
+    "\n\n  ---\nid: H1\n----  \nbody\n",
+    "---\nid: H1\n  ---\nstill: header\n---\n",
+    "---\n---\nbody",
+    "---\n- a list\n---\n",
+    "---\nid: H1\nnever closed\n",
+    "# H1\n\n| Hunt # | Idea |\n",
+    "",
+])
+def test_frontmatter_header_matches_python_frontmatter(text):
+    assert frontmatter_header(io.StringIO(text)) == frontmatter.loads(text).metadata
+
+
+def test_read_frontmatter_stops_at_closing_fence(fixtures_dir):
+    path = fixtures_dir / "frontmatter_h001.md"
+    assert read_frontmatter(path) == frontmatter.loads(path.read_text()).metadata
+
+    def lines():
+        yield "---\n"
+        yield "id: H1\n"
+        yield "---\n"
+        raise AssertionError("read past the header")
+
+    assert frontmatter_header(lines()) == {"id": "H1"}
@@ -1,9 +1,18 @@
 """Lock in the contract of scripts.hunt_schema (especially FormatChecker)."""
+import copy
+import random
+
+import pytest
+
 from scripts.hunt_schema import (
     CATEGORIES,
     SEVERITIES,
     STATUSES,
     HUNT_SCHEMA,
+    _compile_check,
+    _fast_check,
+    _Unsupported,
+    _validator,
     validate_hunt,
 )
 
@@ -136,3 +145,78 @@ def test_short_hypothesis_rejected():
     hunt["hypothesis"] = "too short"  # under 10 chars
     errors = validate_hunt(hunt)
     assert any("hypothesis" in e for e in errors)
+
+
+# --- compiled fast path ---------------------------------------------------------
+
+_ODD_VALUES = [
+    None, True, 0, 1.5, "", "x", "H001", "B0123", "X001", "H001\n", "T1059", "T1059.001",
+    "T1059_001", "2024-08-15", "2024-02-30", "not-a-date", "bad tag", "ok_tag", "Flames",
+    "high", "retired", "A hypothesis long enough.", [], ["a"], ["T1059"], ["ok_tag", 3],
+    {}, {"name": "x"}, {"platform": "p", "query": "q"}, {"name": "x", "extra": 1},
+]
+
+
+def _mutate(rng: random.Random, value):
+    """One random structural edit somewhere inside ``value``."""
+    if isinstance(value, dict) and value and rng.random() < 0.7:
+        key = rng.choice(list(value))
+        roll = rng.random()
+        if roll < 0.2:
+            del value[key]
+        elif roll < 0.3:
+            value[rng.choice(["unexpected", "links", "description", 7])] = rng.choice(_ODD_VALUES)
+        else:
+            value[key] = _mutate(rng, value[key])
+        return value
+    if isinstance(value, list) and value and rng.random() < 0.7:
+        i = rng.randrange(len(value))
+        value[i] = _mutate(rng, value[i])
+        return value
+    return rng.choice(_ODD_VALUES)
+
+
+def _rich_hunt() -> dict:
+    hunt = _valid_hunt()
+    hunt.update(
+        title="A title",
+        techniques=["T1059.001", "T1110"],
+        severity="high",
+        status="current",
+        created="2024-08-15",
+        last_reviewed="2025-01-01",
+        related_hunt_ids=["H002", "B010"],
+        required_data_sources=["Process creation"],
+        false_positive_notes="Admins.",
+        detection_queries=[{"platform": "splunk", "query": "index=main", "description": "d"}],
+        notes="n",
+    )
+    hunt["submitter"]["links"] = ["https://a", "https://b"]
+    return hunt
+
+
+def test_fast_path_compiles_for_the_shipped_schema():
+    assert _fast_check() is not None
+
+
+@pytest.mark.parametrize("seed", range(5))
+def test_fast_path_agrees_with_jsonschema_on_fuzzed_documents(seed):
+    rng = random.Random(seed)
+    check = _fast_check()
+    valid_seen = invalid_seen = 0
+    for _ in range(1000):
+        doc = copy.deepcopy(rng.choice([_valid_hunt(), _rich_hunt()]))
+        for _ in range(rng.choice([0, 1, 1, 2, 3])):
+            doc = _mutate(rng, doc)
+        expected = not any(True for _ in _validator().iter_errors(doc))
+        assert check(doc) is expected, doc
+        valid_seen += expected
+        invalid_seen += not expected
+    assert valid_seen and invalid_seen
+
+
+def test_compiler_refuses_unknown_keywords():
+    with pytest.raises(_Unsupported):
+        _compile_check({"type": "object", "properties": {"n": {"type": "integer"}}})
+    with pytest.raises(_Unsupported):
+        _compile_check({"type": "string", "maxLength": 3})
@@ -0,0 +1,69 @@
+"""hunt_yaml reads and writes hunts exactly as python-frontmatter does."""
+
+import datetime as dt
+
+import frontmatter
+import pytest
+import yaml
+
+from scripts import hunt_yaml
+
+TEXTS = [
+    "---\nid: H1\ntags: [a, b]\ncreated: 2025-01-05\n---\n# H1\n\n## Why\n- x\n",
+    "\n\n  ---\nid: H1\n----  \nbody\n--- not a fence\n---\nmore\n",
+    "---\nid: H1\n  ---\nstill: header\n---\n",
+    "---\n---\nbody",
+    "---\n- a list\n---\nbody",
+    "---\nid: H1\nnever closed\n",
+    "# H1\n\n| Hunt # | Idea |\n",
+    "",
+]
+
+
+@pytest.mark.parametrize("text", TEXTS)
+def test_split_matches_python_frontmatter(text):
+    post = frontmatter.loads(text)
+    assert hunt_yaml.split(text) == (post.metadata, post.content)
+
+
+def test_split_matches_python_frontmatter_on_fixtures(fixtures_dir):
+    for path in fixtures_dir.glob("*.md"):
+        text = path.read_text(encoding="utf-8")
+        post = frontmatter.loads(text)
+        assert hunt_yaml.split(text) == (post.metadata, post.content), path.name
+
+
+def test_join_matches_python_frontmatter():
+    metadata = {
+        "id": "H1",
+        "hypothesis": "Adversaries use `curl | sh` — non-ASCII stays readable",
+        "tactics": ["Execution"],
+        "submitter": {"name": "Ada", "link": ""},
+        "created": dt.date(2025, 1, 5),
+    }
+    body = "## Why\n\n- reasons\n"
+    assert hunt_yaml.join(metadata, body) == frontmatter.dumps(
+        frontmatter.Post(content=body, **metadata)
+    )
+
+
+def test_iso_dates_coerces_top_level_dates_only():
+    metadata = {
+        "created": dt.date(2025, 1, 5),
+        "updated": dt.datetime(2025, 1, 5, 10, 30),
+        "nested": {"when": dt.date(2025, 1, 5)},
+        "id": "H1",
+    }
+    assert hunt_yaml.iso_dates(metadata) == {
+        "created": "2025-01-05",
+        "updated": "2025-01-05T10:30:00",
+        "nested": {"when": dt.date(2025, 1, 5)},
+        "id": "H1",
+    }
+    assert isinstance(metadata["created"], dt.date)  # the input is untouched
+
+
+@pytest.mark.skipif(not yaml.__with_libyaml__, reason="PyYAML built without libyaml")
+def test_uses_libyaml_when_available():
+    assert hunt_yaml.Loader is yaml.CSafeLoader
+    assert hunt_yaml.Dumper is yaml.CSafeDumper
@@ -0,0 +1,88 @@
+"""Tests for the hunts-data inverted index and its query helper."""
+
+import pytest
+
+from scripts.inverted_index import (
+    InvertedIndex,
+    build_inverted_index,
+    decode_postings,
+    encode_postings,
+    write_inverted_index,
+)
+
+
+def _hunt(id, category, tactic, tags, techniques, who) -> dict:
+    return {
+        "id": id,
+        "category": category,
+        "tactic": tactic,
+        "tags": tags + techniques,
+        "techniques": techniques,
+        "severity": None,
+        "submitter": {"name": who, "link": ""},
+    }
+
+
+HUNTS = [
+    _hunt("B001", "Embers", "Exfiltration", ["baseline"], ["T1041"], "Sydney"),
+    _hunt("H001", "Flames", "Execution", ["powershell"], ["T1059.001"], "Sydney"),
+    _hunt("H002", "Flames", "Command and Control, Exfiltration", ["dns"], ["T1071.004"], "Lauren"),
+    _hunt("H003", "Flames", "Execution", ["bash"], ["T1059.004", "T1059"], "Lauren"),
+]
+
+
+def test_delta_round_trip():
+    offsets = [0, 3, 4, 10, 250]
+    assert encode_postings(offsets) == [0, 3, 1, 6, 240]
+    assert decode_postings(encode_postings(offsets)) == offsets
+    assert encode_postings([]) == []
+
+
+def test_postings_are_sorted_offsets_per_facet():
+    idx = InvertedIndex(build_inverted_index(HUNTS))
+    assert idx.postings["category"]["Flames"] == [1, 2, 3]
+    assert idx.postings["tactic"]["Exfiltration"] == [0, 2]
+    assert idx.postings["parent_technique"]["T1059"] == [1, 3]
+    assert idx.postings["submitter"]["Lauren"] == [2, 3]
+    # null severity is not indexed
+    assert idx.values("severity") == []
+
+
+def test_plain_and_delta_encodings_decode_identically():
+    delta = InvertedIndex(build_inverted_index(HUNTS, delta=True))
+    plain = InvertedIndex(build_inverted_index(HUNTS, delta=False))
+    assert delta.postings == plain.postings
+
+
+def test_query_ands_facets_and_ors_values():
+    idx = InvertedIndex(build_inverted_index(HUNTS))
+    assert idx.hunt_ids(idx.query(tactic="Execution", submitter="Lauren")) == ["H003"]
+    assert idx.hunt_ids(idx.query(tag=["dns", "baseline"])) == ["B001", "H002"]
+    assert idx.query(tactic="Execution", category="Embers") == []
+    assert idx.query(tag="missing") == []
+    assert idx.query() == [0, 1, 2, 3]
+
+
+def test_query_matches_linear_scan():
+    idx = InvertedIndex(build_inverted_index(HUNTS))
+    scanned = [
+        i
+        for i, h in enumerate(HUNTS)
+        if h["category"] == "Flames"
+        and any(t.split(".")[0] == "T1059" for t in h["techniques"])
+    ]
+    assert idx.query(parent_technique="T1059", category="Flames") == scanned
+
+
+def test_unknown_facet_raises():
+    idx = InvertedIndex(build_inverted_index(HUNTS))
+    with pytest.raises(KeyError):
+        idx.query(colour="red")
+
+
+def test_write_and_load(tmp_path):
+    path = tmp_path / "hunts-index.json"
+    write_inverted_index(HUNTS, path)
+    idx = InvertedIndex.load(path)
+    assert idx.ids == ["B001", "H001", "H002", "H003"]
+    assert idx.count("technique", "T1041") == 1
@@ -0,0 +1,50 @@
+"""Heavy dependencies stay out of import time, and importing needs no API key."""
+
+import os
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+REPO_ROOT = Path(__file__).resolve().parent.parent.parent
+
+
+def _loaded_after_import(module, path, heavy):
+    env = {k: v for k, v in os.environ.items() if not k.endswith("_API_KEY")}
+    proc = subprocess.run(
+        [sys.executable, "-c",
+         f"import sys; sys.path.insert(0, {str(path)!r}); import {module}; "
+         f"print(' '.join(m for m in {heavy!r} if m in sys.modules))"],
+        capture_output=True, text=True, cwd=REPO_ROOT, env=env,
+    )
+    assert proc.returncode == 0, proc.stderr
+    return proc.stdout.split()
+
+
+@pytest.mark.parametrize(
+    "module, path",
+    [
+        ("scripts.hunt_parser", REPO_ROOT),
+        ("scripts.check_hunt_id_collisions", REPO_ROOT),
+        ("scripts.cti_extract", REPO_ROOT),
+        ("generate_from_cti", REPO_ROOT / "scripts"),
+        ("process_hunt_submission", REPO_ROOT / "scripts"),
+        ("process_issue", REPO_ROOT / ".github" / "scripts"),
+    ],
+)
+def test_import_loads_no_heavy_dependencies(module, path):
+    heavy = ("jsonschema", "anthropic", "openai", "pypdf", "docx", "bs4")
+    assert _loaded_after_import(module, path, heavy) == []
+
+
+def test_missing_key_fails_on_first_use(monkeypatch):
+    sys.path.insert(0, str(REPO_ROOT / "scripts"))
+    try:
+        import llm_clients
+    finally:
+        sys.path.remove(str(REPO_ROOT / "scripts"))
+    monkeypatch.delenv("ANTHROPIC_API_KEY", raising=False)
+    llm_clients.anthropic_client.cache_clear()
+    with pytest.raises(ValueError, match="ANTHROPIC_API_KEY"):
+        llm_clients.client_for("claude")
@@ -3,7 +3,7 @@ from pathlib import Path
 
 import frontmatter
 
-from scripts.migrate_to_frontmatter import migrate_file
+from scripts.migrate_to_frontmatter import _build_body, migrate_file
 
 
 def test_migrates_legacy_to_frontmatter(fixtures_dir, tmp_path):
@@ -122,3 +122,10 @@ def test_no_intro_paragraph_adds_no_summary_section(tmp_path):
     )
     assert migrate_file(f, category="Flames", dry_run=False) is True
     assert "## Summary" not in frontmatter.load(f).content
+
+
+def test_summary_runs_to_the_first_heading_outside_code():
+    raw = "# H997\n\nRun this:\n```\n## not a heading\n```\n\n## Why\n- a reason\n"
+    assert _build_body(raw) == (
+        "## Summary\n\nRun this:\n```\n## not a heading\n```\n\n## Why\n- a reason\n"
+    )
@@ -0,0 +1,91 @@
+"""Draft-branch claims: one batched scan across drafts and categories, cached by tip."""
+
+import subprocess
+
+import pytest
+
+from scripts import reassign_hunt_id as reassign
+from scripts.hunt_id_ledger import HuntIdLedger
+
+
+def _git(repo, *args):
+    return subprocess.run(["git", *args], cwd=repo, check=True,
+                          capture_output=True, text=True).stdout.strip()
+
+
+def _draft(repo, issue, *paths, base="main"):
+    _git(repo, "checkout", "-q", "-B", f"d{issue}", base)
+    for path in paths:
+        (repo / path).parent.mkdir(exist_ok=True)
+        (repo / path).write_text(path)
+    _git(repo, "add", "-A")
+    _git(repo, "commit", "-q", "-m", f"draft {issue}")
+    _git(repo, "update-ref", f"refs/remotes/origin/draft/issue-{issue}", "HEAD")
+
+
+@pytest.fixture
+def repo(tmp_path, monkeypatch):
+    _git(tmp_path, "init", "-q", "-b", "main")
+    _git(tmp_path, "config", "user.email", "t@example.com")
+    _git(tmp_path, "config", "user.name", "t")
+    (tmp_path / "Flames").mkdir()
+    (tmp_path / "Flames" / "H001.md").write_text("x")
+    _git(tmp_path, "add", "-A")
+    _git(tmp_path, "commit", "-q", "-m", "main")
+    _git(tmp_path, "update-ref", "refs/remotes/origin/main", "HEAD")
+    monkeypatch.chdir(tmp_path)
+    return tmp_path
+
+
+def test_claims_cover_every_draft_and_category(repo, tmp_path):
+    _draft(repo, 5, "Flames/H002.md", "Embers/B001.md")
+    _draft(repo, 3, "Flames/H002.md")  # lower issue wins the contested number
+    _draft(repo, 9, "Alchemy/M004.md", "Flames/notes.md")
+    _draft(repo, 7, "Flames/H010.md")  # the current issue is excluded
+    # A draft that merged main back in still resolves its merge base.
+    _git(repo, "checkout", "-q", "main")
+    (repo / "Flames" / "H020.md").write_text("x")
+    _git(repo, "add", "-A")
+    _git(repo, "commit", "-q", "-m", "main moves")
+    _git(repo, "update-ref", "refs/remotes/origin/main", "HEAD")
+    _draft(repo, 11, "Embers/B002.md", base="d5")
+    _git(repo, "merge", "-q", "--no-edit", "main")
+    _git(repo, "update-ref", "refs/remotes/origin/draft/issue-11", "HEAD")
+
+    with HuntIdLedger(tmp_path / "ids.db") as ledger:
+        claims = reassign._other_draft_claims(7, ledger)
+        tips = reassign._draft_tips()
+        # The same paths a per-ref `git diff origin/main...<ref>` lists.
+        for sha, paths in reassign._draft_additions(list(tips.values()), ledger).items():
+            diff = _git(repo, "diff", "--diff-filter=A", "--name-only", f"origin/main...{sha}")
+            assert paths == [p for p in diff.splitlines() if p.endswith(".md")]
+    assert claims == {
+        "H": {2: 3},
+        "B": {1: 5, 2: 11},
+        "M": {4: 9},
+    }
+
+
+def test_repeat_scans_are_served_from_the_cache(repo, tmp_path, monkeypatch):
+    _draft(repo, 4, "Flames/H002.md")
+    with HuntIdLedger(tmp_path / "ids.db") as ledger:
+        first = reassign._other_draft_claims(7, ledger)
+
+        def no_walk(*args):
+            raise AssertionError(f"rescanned: git {args}")
+
+        monkeypatch.setattr(reassign, "_merge_bases", no_walk)
+        assert reassign._other_draft_claims(7, ledger) == first == {
+            "H": {2: 4}, "B": {}, "M": {},
+        }
+
+
+def test_cache_drops_tips_that_are_no_longer_open(repo, tmp_path):
+    _draft(repo, 4, "Flames/H002.md")
+    first = _git(repo, "rev-parse", "HEAD").strip()
+    _draft(repo, 5, "Flames/H003.md")
+    second = _git(repo, "rev-parse", "HEAD").strip()
+    with HuntIdLedger(tmp_path / "ids.db") as ledger:
+        reassign._draft_additions([first], ledger)
+        reassign._draft_additions([second], ledger)
+        assert ledger.draft_additions([first, second]) == {second: ["Flames/H003.md"]}
@@ -0,0 +1,108 @@
+"""The open-PR sweep checks only hunt PRs, against one main, and posts every status."""
+
+import importlib
+import subprocess
+
+import pytest
+
+
+def _git(repo, *args):
+    return subprocess.run(["git", *args], cwd=repo, check=True,
+                          capture_output=True, text=True).stdout.strip()
+
+
+def _hunt(hunt_id, submitter):
+    return (f"---\nid: {hunt_id}\ncategory: Flames\nsubmitter:\n  name: {submitter}\n"
+            f"---\n# {hunt_id}\n")
+
+
+@pytest.fixture
+def recheck(tmp_path, monkeypatch):
+    monkeypatch.setenv("GITHUB_REPOSITORY", "THORCollective/HEARTH")
+    module = importlib.import_module("scripts.recheck_open_prs")
+
+    _git(tmp_path, "init", "-q", "-b", "main")
+    _git(tmp_path, "config", "user.email", "t@example.com")
+    _git(tmp_path, "config", "user.name", "t")
+    (tmp_path / "Flames").mkdir()
+    (tmp_path / "Flames" / "H001.md").write_text(_hunt("H001", "Ada"))
+    _git(tmp_path, "add", "-A")
+    _git(tmp_path, "commit", "-q", "-m", "main")
+    _git(tmp_path, "update-ref", "refs/remotes/origin/main", "HEAD")
+    monkeypatch.chdir(tmp_path)
+    return module
+
+
+def _pr_head(repo, path, text):
+    """A commit on top of main that writes ``path``."""
+    _git(repo, "checkout", "-q", "--detach", "origin/main")
+    (repo / path).parent.mkdir(exist_ok=True)
+    (repo / path).write_text(text)
+    _git(repo, "add", "-A")
+    _git(repo, "commit", "-q", "-m", path)
+    return _git(repo, "rev-parse", "HEAD")
+
+
+def test_sweep_checks_hunt_prs_once_each(recheck, tmp_path, monkeypatch, capsys):
+    clean = _pr_head(tmp_path, "Flames/H002.md", _hunt("H002", "Grace"))
+    overwrite = _pr_head(tmp_path, "Flames/H001.md", _hunt("H001", "Mallory"))
+    docs = _pr_head(tmp_path, "docs/x.md", "docs only")
+    prs = [
+        {"number": 1, "headRefOid": clean, "files": [{"path": "Flames/H002.md"}]},
+        {"number": 2, "headRefOid": overwrite, "files": [{"path": "Flames/H001.md"}]},
+        {"number": 3, "headRefOid": docs, "files": [{"path": "docs/x.md"}]},
+        {"number": 4, "headRefOid": "0" * 40, "files": [{"path": "Flames/H009.md"}]},
+    ]
+    fetched, statuses = [], {}
+    monkeypatch.setattr(recheck, "_open_prs", lambda: prs)
+    monkeypatch.setattr(recheck, "_fetch_heads", fetched.append)
+    monkeypatch.setattr(recheck, "_post_status",
+                        lambda sha, state, description: statuses.__setitem__(sha, state))
+
+    assert recheck.main() == 0
+
+    assert fetched == [[1, 2, 4]]  # one batched fetch, docs-only PR skipped
+    # The docs-only PR is reported without a check; the unknown head errors.
+    assert statuses == {clean: "success", overwrite: "failure", docs: "success",
+                        "0" * 40: "error"}
+    out = capsys.readouterr()
+    assert "PR #4: recheck errored" in out.err  # an unknown head fails alone
+    assert "Rechecked 3 of 4 open PR(s)" in out.out
+    assert "1 now colliding" in out.out
+
+
+def test_sweep_with_no_hunt_prs_still_reports_every_pr(recheck, monkeypatch):
+    prs = [{"number": 5, "headRefOid": "a" * 40, "files": [{"path": "README.md"}]}]
+    statuses = []
+    monkeypatch.setattr(recheck, "_open_prs", lambda: prs)
+    monkeypatch.setattr(recheck, "_fetch_heads", lambda numbers: pytest.fail("fetched"))
+    monkeypatch.setattr(recheck, "_post_status", lambda *args: statuses.append(args))
+
+    assert recheck.main() == 0
+    assert statuses == [("a" * 40, *recheck.SKIPPED_STATUS)]
+
+
+def test_unreadable_main_posts_an_error_on_every_hunt_pr(recheck, monkeypatch, capsys):
+    prs = [
+        {"number": 6, "headRefOid": "b" * 40, "files": [{"path": "Flames/H002.md"}]},
+        {"number": 7, "headRefOid": "c" * 40, "files": [{"path": "docs/x.md"}]},
+    ]
+    statuses = {}
+
+    def broken_baseline():
+        raise RuntimeError("origin/main is not a commit")
+
+    monkeypatch.setattr(recheck, "_open_prs", lambda: prs)
+    monkeypatch.setattr(recheck, "Baseline", broken_baseline)
+    monkeypatch.setattr(recheck, "_post_status",
+                        lambda sha, state, description: statuses.__setitem__(sha, state))
+
+    assert recheck.main() == 0
+    assert statuses == {"b" * 40: "error", "c" * 40: "success"}
+    assert "origin/main is not a commit" in capsys.readouterr().err
+
+
+def test_pr_at_the_file_list_cap_counts_as_touching_hunts(recheck):
+    files = [{"path": f"docs/{i}.md"} for i in range(recheck.GH_FILES_LIMIT)]
+    assert recheck._touches_hunts({"files": files})
+    assert not recheck._touches_hunts({"files": files[:5]})
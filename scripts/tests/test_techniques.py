@@ -0,0 +1,59 @@
+"""Tests for the shared technique-ID extractor."""
+
+import json
+
+from scripts.techniques import (
+    classify_techniques,
+    extract_techniques,
+    extract_techniques_batch,
+    normalize_technique_id,
+    parent_technique,
+)
+
+
+def test_normalizes_underscore_and_slash_separators():
+    assert normalize_technique_id("T1070_004") == "T1070.004"
+    assert normalize_technique_id("T1070/004") == "T1070.004"
+    assert normalize_technique_id(" T1110 ") == "T1110"
+
+
+def test_normalize_rejects_non_technique():
+    assert normalize_technique_id("TA0001") is None
+    assert normalize_technique_id("persistence") is None
+    assert normalize_technique_id("T1059.001 T1110") is None
+
+
+def test_parent_technique():
+    assert parent_technique("T1059.001") == "T1059"
+    assert parent_technique("T1059") == "T1059"
+
+
+def test_extract_dedupes_mixed_spellings_in_first_seen_order():
+    text = "#T1566_002 then T1110 and T1566.002 again, T1059/001"
+    assert extract_techniques(text) == ["T1566.002", "T1110", "T1059.001"]
+
+
+def test_batch_matches_per_text_extraction():
+    texts = ["T1110 T1110_003", "", "no ids here", "T1070/004 #T1110"]
+    assert extract_techniques_batch(texts) == [extract_techniques(t) for t in texts]
+    assert extract_techniques_batch([]) == []
+
+
+def test_classify_reports_subtechniques_deprecated_and_unknown(tmp_path):
+    matrix = tmp_path / "mitre-matrix.json"
+    matrix.write_text(
+        json.dumps(
+            {
+                "techniques": [{"id": "T1110"}, {"id": "T1110.003"}],
+                "deprecated": {"T1158": {"revoked_by": "T1564.001"}},
+            }
+        )
+    )
+    report = classify_techniques(
+        ["T1110_003", "T1110", "T1158", "T9999", "T1110.003", "not-an-id"],
+        matrix_path=matrix,
+    )
+    assert report["techniques"] == ["T1110.003", "T1110", "T1158", "T9999"]
+    assert report["subtechniques"] == ["T1110.003"]
+    assert report["deprecated"] == {"T1158": "T1564.001"}
+    assert report["unknown"] == ["T9999"]
@@ -0,0 +1,100 @@
+"""Tests for the bulk hunt validator in scripts/validate_hunts.py."""
+
+import json
+import subprocess
+
+import pytest
+
+import scripts.validate_hunts as vh
+from scripts.tests.test_build_hunt_database import _hunt
+
+
+@pytest.fixture
+def flames(tmp_path):
+    flames = tmp_path / "Flames"
+    flames.mkdir()
+    (flames / "H001.md").write_text(_hunt("H001", "A valid hypothesis.", ["T1059"], ["ok"], "- Why."))
+    (flames / "H002.md").write_text(
+        _hunt("H002", "Short", ["T1059_001"], ["Bad"], "- Why.").replace("hypothesis:", "extra: 1\nhypothesis:")
+    )
+    (flames / "H003.md").write_text("---\nid: [unclosed\n---\nbody\n")
+    (flames / "H004.md").write_text("# H004\n\n| Hunt # | Idea |\n")
+    # #384: an unescaped pipe splits the legacy row into too many cells.
+    (flames / "H005.md").write_text(
+        "# H005\n\n"
+        "| Hunt # | Hypothesis | Tactic | Notes | Tags | Submitter |\n"
+        "|---|---|---|---|---|---|\n"
+        "| H005 | A hypothesis | Persistence | Run ps | grep x | #persistence | Ada |\n"
+    )
+    return flames
+
+
+def _files(flames):
+    return [str(p) for p in sorted(flames.glob("*.md"))]
+
+
+def test_collects_every_finding_with_field_paths(flames):
+    findings = vh.validate_files(_files(flames), jobs=1)
+    by_file = {}
+    for f in findings:
+        by_file.setdefault(f["file"].rsplit("/", 1)[1], []).append(f)
+
+    assert "H001.md" not in by_file
+    assert {f["path"] for f in by_file["H002.md"]} == {"<root>", "hypothesis", "techniques.0", "tags.0"}
+    assert all(f["rule"] == "hunt-schema" and f["level"] == "error" for f in by_file["H002.md"])
+    assert [f["rule"] for f in by_file["H003.md"]] == ["hunt-unreadable"]
+    assert [(f["rule"], f["level"]) for f in by_file["H004.md"]] == [("hunt-legacy-format", "warning")]
+    assert [(f["rule"], f["level"]) for f in by_file["H005.md"]] == [
+        ("hunt-legacy-format", "warning"), ("hunt-legacy-table", "error"),
+    ]
+    assert "7 cells, expected 6" in by_file["H005.md"][1]["message"]
+
+
+def test_process_pool_matches_in_process(flames, monkeypatch):
+    files = _files(flames) * 5
+    expected = vh.validate_files(files, jobs=1)
+    monkeypatch.setattr(vh, "POOL_THRESHOLD", 0)
+    assert vh.validate_files(files, jobs=2) == expected
+
+
+def test_reports(flames, tmp_path, capsys):
+    out = tmp_path / "report.sarif"
+    assert vh.main([*_files(flames), "--format", "sarif", "--output", str(out)]) == 1
+    sarif = json.loads(out.read_text())
+    results = sarif["runs"][0]["results"]
+    assert sarif["version"] == "2.1.0"
+    assert {r["ruleId"] for r in results} == {"hunt-schema", "hunt-unreadable", "hunt-legacy-format", "hunt-legacy-table"}
+    assert results[0]["locations"][0]["physicalLocation"]["artifactLocation"]["uri"].endswith(".md")
+
+    assert vh.main([_files(flames)[0], "--format", "json"]) == 0
+    assert json.loads(capsys.readouterr().out) == {"checked": 1, "findings": []}
+
+
+def _git(root, *args):
+    subprocess.run(["git", *args], cwd=root, check=True, capture_output=True)
+
+
+@pytest.mark.parametrize("source", ["scripts/hunt_schema.py", "scripts/hunt_yaml.py",
+                                    "scripts/techniques.py", "scripts/validate_hunts.py"])
+def test_changed_only_follows_the_diff(tmp_path, source):
+    root = tmp_path / "repo"
+    (root / "Flames").mkdir(parents=True)
+    (root / "scripts").mkdir()
+    for name in ("H001.md", "H002.md"):
+        (root / "Flames" / name).write_text("x")
+    (root / source).write_text("v1")
+    _git(root, "init", "-q", "-b", "main")
+    _git(root, "-c", "user.email=a@b", "-c", "user.name=a", "commit", "-qam", "base", "--allow-empty")
+    _git(root, "add", ".")
+    _git(root, "-c", "user.email=a@b", "-c", "user.name=a", "commit", "-qm", "hunts")
+    _git(root, "checkout", "-qb", "pr")
+
+    (root / "Flames" / "H002.md").write_text("edited")
+    (root / "Flames" / "H003.md").write_text("new")
+    _git(root, "add", ".")
+    _git(root, "-c", "user.email=a@b", "-c", "user.name=a", "commit", "-qm", "pr")
+    assert vh.changed_hunt_files("main", root) == ["Flames/H002.md", "Flames/H003.md"]
+
+    (root / source).write_text("v2")
+    _git(root, "-c", "user.email=a@b", "-c", "user.name=a", "commit", "-qam", "parser")
+    assert vh.changed_hunt_files("main", root) == ["Flames/H001.md", "Flames/H002.md", "Flames/H003.md"]
@@ -0,0 +1,211 @@
+#!/usr/bin/env python3
+"""
+Validate hunt frontmatter against the schema, in bulk.
+
+Every hunt is checked — a failing file never stops the run — and each problem
+is reported as a finding: the file, the field path (``tags.0``, ``<root>``),
+and the message. Files are spread over a process pool; small batches run
+in-process, where pool start-up would cost more than it saves.
+
+With ``--changed-only`` only hunts added, copied, modified or renamed since
+``--base`` (default ``origin/main``) are validated, so PR cost scales with the
+diff. If the diff touches the validator or any parser layer (schema, YAML,
+technique IDs: ``build_manifest.PARSER``), every hunt is validated anyway.
+
+Legacy table-format hunts are reported as warnings; they carry no frontmatter
+to validate, but their table is still parsed, and a row that does not parse
+(e.g. an unescaped ``|`` splitting it into too many cells, #384) is an error.
+Exits 1 if any file has errors.
+
+Usage:
+    python scripts/validate_hunts.py                       # every hunt, text report
+    python scripts/validate_hunts.py --changed-only        # hunts changed vs origin/main
+    python scripts/validate_hunts.py --format sarif --output hunts.sarif
+    python scripts/validate_hunts.py Flames/H001.md Embers/B002.md
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import subprocess
+import sys
+import warnings
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+
+_REPO_ROOT = str(Path(__file__).resolve().parent.parent)
+if _REPO_ROOT not in sys.path:
+    sys.path.insert(0, _REPO_ROOT)
+
+from scripts.build_manifest import PARSER
+from scripts.migrate_to_frontmatter import CATEGORY_DIRS, SKIP_FILENAMES
+
+# Changes to these can change the verdict for hunts the diff does not touch:
+# the parser layers every corpus build fingerprints, plus this validator.
+VALIDATION_SOURCES = (*PARSER, "scripts/validate_hunts.py")
+
+# Below this many files, validate in-process.
+POOL_THRESHOLD = 64
+
+RULES = {
+    "hunt-schema": "Hunt frontmatter violates the HEARTH schema",
+    "hunt-unreadable": "Hunt file could not be read or its frontmatter parsed",
+    "hunt-legacy-format": "Hunt uses the legacy table format instead of frontmatter",
+    "hunt-legacy-table": "Legacy table-format hunt could not be parsed",
+}
+
+
+def hunt_files(root: Path = Path(_REPO_ROOT)) -> list[str]:
+    """Every hunt file, repo-relative, in category order."""
+    return [
+        f"{category}/{path.name}"
+        for category in CATEGORY_DIRS
+        for path in sorted((root / category).glob("*.md"))
+        if path.name not in SKIP_FILENAMES
+    ]
+
+
+def changed_hunt_files(base: str = "origin/main", root: Path = Path(_REPO_ROOT)) -> list[str]:
+    """Hunts changed since the merge base with ``base``, or all of them if a
+    validation source changed."""
+    out = subprocess.run(
+        ["git", "diff", "--diff-filter=ACMR", "--name-only", f"{base}...HEAD", "--",
+         *CATEGORY_DIRS, *VALIDATION_SOURCES],
+        check=True, capture_output=True, text=True, cwd=root,
+    ).stdout.split()
+    if any(p in VALIDATION_SOURCES for p in out):
+        return hunt_files(root)
+    return [
+        p for p in out
+        if p.endswith(".md") and p.split("/")[0] in CATEGORY_DIRS
+        and Path(p).name not in SKIP_FILENAMES
+    ]
+
+
+def _finding(file: str, rule: str, message: str, path: str = "<root>",
+             level: str = "error") -> dict:
+    return {"file": file, "path": path, "message": message, "rule": rule, "level": level}
+
+
+def validate_file(file: str) -> list[dict]:
+    """Findings for one hunt file (empty if it is valid).
+
+    ``file`` is repo-relative or absolute; its directory names the category.
+    """
+    from scripts.hunt_parser import (
+        HuntValidationError, frontmatter_data, parse_hunt_file, read_frontmatter,
+    )
+    from scripts.hunt_schema import schema_errors
+
+    try:
+        metadata = read_frontmatter(Path(_REPO_ROOT) / file)
+    except Exception as exc:  # noqa: BLE001 — bad YAML, undecodable bytes, ...
+        return [_finding(file, "hunt-unreadable", f"{type(exc).__name__}: {exc}")]
+    if not metadata:
+        findings = [_finding(file, "hunt-legacy-format",
+                             "uses legacy table format; run scripts/migrate_to_frontmatter.py",
+                             level="warning")]
+        try:
+            with warnings.catch_warnings():
+                warnings.simplefilter("ignore", DeprecationWarning)  # reported above
+                parse_hunt_file(Path(_REPO_ROOT) / file, Path(file).parent.name)
+        except HuntValidationError as exc:
+            findings.append(_finding(file, "hunt-legacy-table", str(exc)))
+        except Exception as exc:  # noqa: BLE001
+            findings.append(_finding(file, "hunt-unreadable", f"{type(exc).__name__}: {exc}"))
+        return findings
+    data = frontmatter_data(metadata, Path(file).parent.name)
+    return [_finding(file, "hunt-schema", message, path)
+            for path, message in schema_errors(data)]
+
+
+def _validate_chunk(files: list[str]) -> list[dict]:
+    return [finding for file in files for finding in validate_file(file)]
+
+
+def validate_files(files: list[str], jobs: int | None = None) -> list[dict]:
+    """Findings for every file, in input order."""
+    jobs = jobs or os.cpu_count() or 1
+    if jobs == 1 or len(files) < POOL_THRESHOLD:
+        return _validate_chunk(files)
+    # A few chunks per worker balance the load without pickling per file.
+    size = -(-len(files) // (jobs * 4))
+    chunks = [files[i:i + size] for i in range(0, len(files), size)]
+    with ProcessPoolExecutor(max_workers=jobs) as pool:
+        return [finding for found in pool.map(_validate_chunk, chunks) for finding in found]
+
+
+def to_sarif(findings: list[dict]) -> dict:
+    """A SARIF 2.1.0 log with one result per finding."""
+    return {
+        "$schema": "https://json.schemastore.org/sarif-2.1.0.json",
+        "version": "2.1.0",
+        "runs": [{
+            "tool": {"driver": {
+                "name": "validate_hunts",
+                "informationUri": "https://github.com/THORCollective/HEARTH",
+                "rules": [
+                    {"id": rule, "shortDescription": {"text": text}}
+                    for rule, text in RULES.items()
+                ],
+            }},
+            "results": [
+                {
+                    "ruleId": f["rule"],
+                    "level": f["level"],
+                    "message": {"text": f"{f['path']}: {f['message']}"},
+                    "locations": [{"physicalLocation": {
+                        "artifactLocation": {"uri": f["file"]},
+                        "region": {"startLine": 1},
+                    }}],
+                    "properties": {"field": f["path"]},
+                }
+                for f in findings
+            ],
+        }],
+    }
+
+
+def render(findings: list[dict], checked: int, fmt: str) -> str:
+    if fmt == "json":
+        return json.dumps({"checked": checked, "findings": findings}, indent=2) + "\n"
+    if fmt == "sarif":
+        return json.dumps(to_sarif(findings), indent=2) + "\n"
+    lines = [f"{f['level']}: {f['file']}: {f['path']}: {f['message']}" for f in findings]
+    errors = sum(f["level"] == "error" for f in findings)
+    lines.append(f"Checked {checked} hunts: {errors} errors, "
+                 f"{len(findings) - errors} warnings.")
+    return "\n".join(lines) + "\n"
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("files", nargs="*", help="repo-relative hunt files (default: all)")
+    parser.add_argument("--changed-only", action="store_true",
+                        help="only hunts changed since --base (git diff base...HEAD)")
+    parser.add_argument("--base", default="origin/main")
+    parser.add_argument("--format", choices=("text", "json", "sarif"), default="text")
+    parser.add_argument("--output", type=Path, help="write the report here instead of stdout")
+    parser.add_argument("--jobs", type=int, help="worker processes (default: CPU count)")
+    args = parser.parse_args(argv)
+
+    if args.files:
+        files = args.files
+    elif args.changed_only:
+        files = changed_hunt_files(args.base)
+    else:
+        files = hunt_files()
+
+    findings = validate_files(files, args.jobs)
+    report = render(findings, len(files), args.format)
+    if args.output:
+        args.output.write_text(report)
+    else:
+        sys.stdout.write(report)
+    return 1 if any(f["level"] == "error" for f in findings) else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())